@@ -0,0 +1,74 @@
+"""Benchmark of the PBN parser on files in the export format.
+
+Compares the general parser with the line-oriented parser for the export
+format on boards written by PbnWriter::
+
+    $ python benchmarks/pbn_parser.py -n 20000
+"""
+import argparse
+import datetime
+import random
+import tempfile
+import time
+
+from bridge_env import Contract, Hands, Player, Vul
+from bridge_env.data_handler.pbn_handler.parser import PbnParser
+from bridge_env.data_handler.pbn_handler.writer import PbnWriter, Scoring
+
+
+def write_boards(fp, board_num: int) -> None:
+    writer = PbnWriter(fp)
+    writer.write_header()
+    for i in range(board_num):
+        if i > 0:
+            fp.write('\n')
+        vul = random.choice(list(Vul))
+        writer.write_board_result(
+            event='benchmark', site='', date=datetime.date(2020, 1, 1),
+            board_num=i + 1, west_player='W', north_player='N',
+            east_player='E', south_player='S',
+            dealer=random.choice(list(Player)),
+            deal=Hands.generate_random_hands(), scoring=Scoring.IMP,
+            contract=Contract(final_bid=None, vul=vul), taken_tricks=None)
+
+
+def measure(parser: PbnParser, path: str, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with open(path, 'r') as fp:
+            for _ in parser.iter_board_settings(fp):
+                pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--board_num',
+                        default=10000,
+                        type=int,
+                        help='The number of boards. (default=10000)')
+    parser.add_argument('-r', '--repeat',
+                        default=3,
+                        type=int,
+                        help='The number of runs. The best is reported. '
+                             '(default=3)')
+    args = parser.parse_args()
+
+    random.seed(0)
+    with tempfile.NamedTemporaryFile('w', suffix='.pbn') as fp:
+        write_boards(fp, args.board_num)
+        fp.flush()
+        general = measure(PbnParser(fast_export=False), fp.name, args.repeat)
+        export = measure(PbnParser(), fp.name, args.repeat)
+    print(f'boards: {args.board_num}')
+    print(f'general parser: {general:.3f} s '
+          f'({args.board_num / general:.0f} boards/s)')
+    print(f'export parser:  {export:.3f} s '
+          f'({args.board_num / export:.0f} boards/s)')
+    print(f'speedup: {general / export:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
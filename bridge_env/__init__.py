@@ -1,9 +1,13 @@
+from .batch_bidding_phase import BatchBiddingPhase
 from .bid import Bid
-from .bidding_phase import BiddingPhase, BiddingPhaseState
+from .bidding_phase import BiddingPhase, BiddingPhaseState, BiddingSnapshot
+from .bit_hands import BitHands
 from .card import Card
 from .contract import Contract
+from .deal_generator import DealBatch
 from .hands import Hands
 from .pair import Pair
+from .play_engine import PlayEngine
 from .player import Player
 from .playing_phase import ObservedPlayingPhase, PlayingPhase, \
     PlayingPhaseWithHands, TrickHistory
@@ -11,14 +15,19 @@ from .suit import Suit
 from .table import Table, Team
 from .vul import Vul
 
-__all__ = ['Bid',
+__all__ = ['BatchBiddingPhase',
+           'Bid',
            'BiddingPhase',
            'BiddingPhaseState',
+           'BiddingSnapshot',
+           'BitHands',
            'Card',
            'Contract',
+           'DealBatch',
            'Hands',
            'ObservedPlayingPhase',
            'Pair',
+           'PlayEngine',
            'Player',
            'PlayingPhase',
            'PlayingPhaseWithHands',
@@ -0,0 +1,51 @@
+from dataclasses import fields
+from typing import Any, List, Type, TypeVar
+
+T = TypeVar('T')
+
+
+def _getstate(self) -> List[Any]:
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _setstate(self, state: List[Any]) -> None:
+    # object.__setattr__ is used because the dataclass may be frozen.
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+def add_slots(cls: Type[T]) -> Type[T]:
+    """Recreates a dataclass with __slots__ of its fields.
+
+    This is the same as dataclass(slots=True) of Python 3.10 and later.
+    Instances don't have __dict__. Use it above the dataclass decorator::
+
+        >>> @add_slots
+        ... @dataclass(frozen=True)
+        ... class Foo:
+        ...     x: int
+        ...     y: int = 0
+
+    Names in __slots__ of the class body are kept as additional slots.
+
+    :param cls: Dataclass.
+    :return: Dataclass with __slots__.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    extra_names = tuple(cls.__dict__.get('__slots__', ()))
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names + extra_names
+    for name in field_names + extra_names:
+        # Remove default values and member descriptors of the original class.
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    if '__getstate__' not in cls_dict:
+        cls_dict['__getstate__'] = _getstate
+        cls_dict['__setstate__'] = _setstate
+
+    qualname = getattr(cls, '__qualname__', None)
+    cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        cls.__qualname__ = qualname
+    return cls
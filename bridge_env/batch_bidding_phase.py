@@ -0,0 +1,300 @@
+"""Vectorized bidding phase of many auctions.
+
+BatchBiddingPhase holds N auctions in numpy arrays and takes a bid of every
+auction at once. Players are seat indexes (Player.value - 1) and bids are
+0-indexes of bids (Bid.idx). Finished auctions are reset automatically, so
+the batch can be stepped forever::
+
+    >>> phase = BatchBiddingPhase(1000, dealer=Player.N, vul=Vul.NONE)
+    >>> bids = policy(phase.active_player, phase.available_bid)
+    >>> states = phase.take_bids(bids)
+    >>> finished = states == BiddingPhaseState.FINISHED.value
+    >>> phase.contract_bid[finished]  # results of the finished auctions
+"""
+from __future__ import annotations
+
+from typing import Optional, Union
+
+import numpy as np
+
+from .bid import Bid
+from .bidding_phase import BiddingPhaseState
+from .contract import Contract
+from .player import Player
+from .vul import Vul
+
+# Maximum number of bids in an auction. The longest auction is 3 passes, each
+# of 35 contract bids followed by Pass, Pass, X, Pass, Pass, XX, Pass, Pass,
+# and the final pass.
+MAX_AUCTION_LENGTH = 3 + 35 * 9 + 1
+
+_PASS = Bid.Pass.idx
+_X = Bid.X.idx
+_XX = Bid.XX.idx
+_CONTRACT_BIDS = np.arange(35)
+
+_ILLEGAL = BiddingPhaseState.ILLEGAL.value
+_ONGOING = BiddingPhaseState.ONGOING.value
+_FINISHED = BiddingPhaseState.FINISHED.value
+
+
+def _to_idx_array(value: Union[Player, Vul, np.ndarray], n: int
+                  ) -> np.ndarray:
+    if isinstance(value, (Player, Vul)):
+        return np.full(n, value.value - 1, dtype=np.int8)
+    array = np.asarray(value, dtype=np.int8)
+    if array.shape != (n,):
+        raise ValueError(f'Shape of the array must be ({n},).')
+    return array.copy()
+
+
+class BatchBiddingPhase:
+    """Bidding phases of many auctions in contract bridge.
+
+    State arrays are public read-only views. Do not modify them.
+
+    :param n: The number of auctions.
+    :param dealer: Dealer of all auctions, or (n,) array of seat indexes.
+    :param vul: Vulnerability of all auctions, or (n,) array of 0-indexes of
+        vulnerability (Vul.value - 1).
+    :param auto_reset: Whether finished auctions are reset automatically.
+        If False, finished auctions are kept until they are reset by reset,
+        and only Pass is available in them, which take_bids ignores.
+    """
+
+    def __init__(self,
+                 n: int,
+                 dealer: Union[Player, np.ndarray] = Player.N,
+                 vul: Union[Vul, np.ndarray] = Vul.NONE,
+                 auto_reset: bool = True):
+        self._n = n
+        self._auto_reset = auto_reset
+        self._rows = np.arange(n)
+        self._dealer = _to_idx_array(dealer, n)
+        self._vul = _to_idx_array(vul, n)
+
+        # state of auctions
+        self._active_player = np.empty(n, dtype=np.int8)
+        self._last_bidder = np.empty(n, dtype=np.int8)  # -1 if no bid
+        self._last_bid = np.empty(n, dtype=np.int8)  # -1 if no bid
+        self._called_x = np.empty(n, dtype=bool)
+        self._called_xx = np.empty(n, dtype=bool)
+        self._passes = np.empty(n, dtype=np.int8)  # consecutive passes
+        self._done = np.empty(n, dtype=bool)
+        # first bidder of each strain in each pair. [i, pair, strain]
+        self._declarer_check = np.empty((n, 2, 5), dtype=np.int8)
+        self._available_bid = np.empty((n, 38), dtype=bool)
+        self._bid_history = np.empty((n, MAX_AUCTION_LENGTH), dtype=np.int8)
+        self._bid_num = np.empty(n, dtype=np.int16)
+
+        # results of the last finished auctions
+        self._contract_bid = np.full(n, -1, dtype=np.int8)
+        self._contract_doubled = np.zeros(n, dtype=np.int8)
+        self._contract_declarer = np.full(n, -1, dtype=np.int8)
+        self._contract_vul = self._vul.copy()
+
+        self.reset()
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def dealer(self) -> np.ndarray:
+        """(N,) seat indexes of dealers."""
+        return self._dealer
+
+    @property
+    def vul(self) -> np.ndarray:
+        """(N,) 0-indexes of vulnerability (Vul.value - 1)."""
+        return self._vul
+
+    @property
+    def active_player(self) -> np.ndarray:
+        """(N,) seat indexes of players who take the next bids."""
+        return self._active_player
+
+    @property
+    def available_bid(self) -> np.ndarray:
+        """(N, 38) bool array of legal bids. The column is Bid.idx."""
+        return self._available_bid
+
+    @property
+    def bid_history(self) -> np.ndarray:
+        """(N, MAX_AUCTION_LENGTH) array of taken bids padded with -1."""
+        return self._bid_history
+
+    @property
+    def bid_num(self) -> np.ndarray:
+        """(N,) the number of taken bids."""
+        return self._bid_num
+
+    @property
+    def done(self) -> np.ndarray:
+        """(N,) bool array. True if the auction has finished.
+
+        It is always False with auto reset.
+        """
+        return self._done
+
+    @property
+    def contract_bid(self) -> np.ndarray:
+        """(N,) Bid.idx of the last finished contracts. -1 if passed out."""
+        return self._contract_bid
+
+    @property
+    def contract_doubled(self) -> np.ndarray:
+        """(N,) 0 (undoubled), 1 (X) or 2 (XX) of the last finished contracts.
+        """
+        return self._contract_doubled
+
+    @property
+    def contract_declarer(self) -> np.ndarray:
+        """(N,) seat indexes of declarers of the last finished contracts.
+
+        -1 if passed out.
+        """
+        return self._contract_declarer
+
+    def reset(self,
+              idxes: Optional[np.ndarray] = None,
+              dealer: Union[None, Player, np.ndarray] = None,
+              vul: Union[None, Vul, np.ndarray] = None) -> None:
+        """Starts new auctions.
+
+        :param idxes: Indexes or bool mask of auctions to reset.
+            If None, all auctions are reset.
+        :param dealer: New dealer, or array of seat indexes of new dealers of
+            the reset auctions. If None, dealers are not changed.
+        :param vul: New vulnerability, or array of 0-indexes of new
+            vulnerability of the reset auctions. If None, vulnerability is not
+            changed.
+        """
+        rows = self._rows if idxes is None else self._rows[idxes]
+        if dealer is not None:
+            self._dealer[rows] = dealer.value - 1 \
+                if isinstance(dealer, Player) else dealer
+        if vul is not None:
+            self._vul[rows] = vul.value - 1 if isinstance(vul, Vul) else vul
+
+        self._active_player[rows] = self._dealer[rows]
+        self._last_bidder[rows] = -1
+        self._last_bid[rows] = -1
+        self._called_x[rows] = False
+        self._called_xx[rows] = False
+        self._passes[rows] = 0
+        self._done[rows] = False
+        self._declarer_check[rows] = -1
+        self._available_bid[rows] = True
+        self._available_bid[rows, _X:] = False  # X and XX are illegal.
+        self._bid_history[rows] = -1
+        self._bid_num[rows] = 0
+
+    def take_bids(self, bids: np.ndarray) -> np.ndarray:
+        """Takes a bid in every auction.
+
+        An illegal bid doesn't change the auction, the same as
+        BiddingPhase.take_bid. Bids of finished auctions, which are kept
+        without auto reset, must be Pass and are ignored.
+
+        :param bids: (N,) Bid.idx of bids to take.
+        :return: (N,) int8 array of BiddingPhaseState values. FINISHED for
+            finished auctions.
+        :raise Exception: If a bid of a finished auction is not Pass.
+        """
+        bids = np.asarray(bids)
+        if bids.shape != (self._n,):
+            raise ValueError(f'Shape of bids must be ({self._n},).')
+        if self._n > 0 and (bids.min() < 0 or 37 < bids.max()):
+            raise ValueError('bid int is from 0 to 37')
+        done = self._done
+        if (done & (bids != _PASS)).any():
+            raise Exception('Bidding phase has already ended.')
+
+        states = np.full(self._n, _ONGOING, dtype=np.int8)
+        states[done] = _FINISHED
+        legal = self._available_bid[self._rows, bids] & ~done
+        states[~legal & ~done] = _ILLEGAL
+        rows = self._rows[legal]
+        bids = bids[legal].astype(np.int8)
+        players = self._active_player[rows]
+
+        self._bid_history[rows, self._bid_num[rows]] = bids
+        self._bid_num[rows] += 1
+
+        is_pass = bids == _PASS
+        finished = is_pass & (self._passes[rows] >= 2) & \
+            (self._bid_num[rows] >= 4)
+        self._passes[rows] = np.where(is_pass, self._passes[rows] + 1, 0)
+        self._called_x[rows[bids == _X]] = True
+        self._called_xx[rows[bids == _XX]] = True
+
+        # regular bids
+        is_regular = bids < _PASS
+        regular_rows = rows[is_regular]
+        regular_bids = bids[is_regular]
+        regular_players = players[is_regular]
+        self._last_bidder[regular_rows] = regular_players
+        self._last_bid[regular_rows] = regular_bids
+        pairs = regular_players % 2
+        strains = regular_bids % 5
+        check = self._declarer_check[regular_rows, pairs, strains]
+        self._declarer_check[regular_rows, pairs, strains] = np.where(
+            check < 0, regular_players, check)
+        self._called_x[regular_rows] = False
+        self._called_xx[regular_rows] = False
+        self._available_bid[regular_rows, :_PASS] &= \
+            _CONTRACT_BIDS > regular_bids[:, np.newaxis]
+
+        # next player and availability of X and XX
+        next_players = (players + 1) % 4
+        self._active_player[rows] = next_players
+        last_bidders = self._last_bidder[rows]
+        is_partner = (next_players - last_bidders) % 2 == 0
+        has_bid = last_bidders >= 0
+        called_x = self._called_x[rows]
+        called_xx = self._called_xx[rows]
+        self._available_bid[rows, _X] = \
+            has_bid & ~called_x & ~called_xx & ~is_partner
+        self._available_bid[rows, _XX] = \
+            has_bid & called_x & ~called_xx & is_partner
+
+        finished_rows = rows[finished]
+        states[finished_rows] = _FINISHED
+        self._finish(finished_rows)
+        return states
+
+    def _finish(self, rows: np.ndarray) -> None:
+        last_bids = self._last_bid[rows]
+        last_bidders = self._last_bidder[rows]
+        declarers = self._declarer_check[rows, last_bidders % 2,
+                                         last_bids % 5]
+        self._contract_bid[rows] = last_bids
+        self._contract_doubled[rows] = np.where(
+            self._called_xx[rows], 2, self._called_x[rows].astype(np.int8))
+        self._contract_declarer[rows] = np.where(last_bids < 0, -1,
+                                                 declarers)
+        self._contract_vul[rows] = self._vul[rows]
+        if self._auto_reset:
+            self.reset(rows)
+        else:
+            self._done[rows] = True
+            self._available_bid[rows] = False
+            self._available_bid[rows, _PASS] = True
+
+    def contract(self, item: int) -> Contract:
+        """The last finished contract of an auction.
+
+        :param item: Index of the auction.
+        :return: Contract declared in the last finished auction.
+        """
+        vul = Vul(int(self._contract_vul[item]) + 1)
+        bid = int(self._contract_bid[item])
+        if bid < 0:
+            return Contract(None, vul=vul)  # Passed Out
+        doubled = int(self._contract_doubled[item])
+        declarer = Player(int(self._contract_declarer[item]) + 1)
+        return Contract(final_bid=Bid.int_to_bid(bid),
+                        x=doubled >= 1,
+                        xx=doubled == 2,
+                        vul=vul,
+                        declarer=declarer)
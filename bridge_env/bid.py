@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from .card import Suit
 
@@ -99,9 +99,7 @@ class Bid(Enum):
     XX = 38  # redouble
 
     def __str__(self) -> str:
-        if self.value >= 36:
-            return self.name
-        return self.name[-1] + self.name[:-1]
+        return _BID_STRS[self._value_ - 1]
 
     @property
     def idx(self) -> int:  # 0-index
@@ -122,7 +120,7 @@ class Bid(Enum):
         :return: An index of the bid.
         :rtype: int
         """
-        return self.value - 1
+        return self._value_ - 1
 
     @property
     def level(self) -> Optional[int]:
@@ -137,9 +135,7 @@ class Bid(Enum):
         :return: A level of the bid.
         :rtype: int or None
         """
-        if self.value >= 36:
-            return None
-        return self.idx // 5 + 1
+        return _LEVELS[self._value_ - 1]
 
     @property
     def suit(self) -> Optional[Suit]:
@@ -150,9 +146,7 @@ class Bid(Enum):
         :return: A suit of the bid.
         :rtype: Suit or None
         """
-        if self.value >= 36:
-            return None
-        return Suit(self.idx % 5 + 1)
+        return _SUITS[self._value_ - 1]
 
     @classmethod
     def int_to_bid(cls, x: int) -> Bid:  # 0-index
@@ -165,7 +159,7 @@ class Bid(Enum):
         """
         if x < 0 or 37 < x:
             raise ValueError("bid int is from 0 to 37")
-        return Bid(x + 1)
+        return BIDS[x]
 
     @classmethod
     def level_suit_to_bid(cls, level: int, suit: Suit) -> Bid:
@@ -175,11 +169,11 @@ class Bid(Enum):
         :param Suit suit: A suit of the bid.
         :return: A bid of the level and the suit.
         :rtype: Bid
-        :raise ValueError: if level < 0 or 7 < level.
+        :raise ValueError: if level < 1 or 7 < level.
         """
-        if level < 0 or 7 < level:
-            raise ValueError("bid int is from 0 to 37")
-        return Bid((level - 1) * 5 + suit.value)
+        if level < 1 or 7 < level:
+            raise ValueError("bid level is from 1 to 7")
+        return BIDS[(level - 1) * 5 + suit.value - 1]
 
     @classmethod
     def str_to_bid(cls, bid_str: str) -> Bid:
@@ -189,6 +183,31 @@ class Bid(Enum):
         :return: A bid represented as the string.
         :rtype: Bid
         """
+        bid = _STR_TO_BID.get(bid_str)
+        if bid is not None:
+            return bid
         if bid_str in ["Pass", "X", "XX"]:
             return Bid[bid_str]
         return Bid[bid_str[1:] + bid_str[0]]
+
+
+# Bids in the order of the 0-index of bids (bid.idx).
+BIDS: Tuple[Bid, ...] = tuple(Bid)
+
+# Lookup tables indexed by the 0-index of a bid, so that engines can work on
+# raw ints. Pass, X and XX have level 0 and strain -1. A strain is the 0-index
+# of the suit (suit.value - 1), that is, C = 0, D = 1, H = 2, S = 3 and NT = 4.
+BID_LEVELS: Tuple[int, ...] = tuple(i // 5 + 1 if i < 35 else 0
+                                    for i in range(38))
+BID_STRAINS: Tuple[int, ...] = tuple(i % 5 if i < 35 else -1
+                                     for i in range(38))
+
+_LEVELS: Tuple[Optional[int], ...] = tuple(level if level > 0 else None
+                                           for level in BID_LEVELS)
+_SUITS: Tuple[Optional[Suit], ...] = tuple(Suit(strain + 1) if strain >= 0
+                                           else None
+                                           for strain in BID_STRAINS)
+_BID_STRS: Tuple[str, ...] = tuple(bid.name if bid.value >= 36
+                                   else bid.name[-1] + bid.name[:-1]
+                                   for bid in BIDS)
+_STR_TO_BID: Dict[str, Bid] = dict(zip(_BID_STRS, BIDS))
@@ -1,13 +1,13 @@
+from __future__ import annotations
+
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 
 from .bid import Bid
-from .card import Suit
 from .contract import Contract
-from .pair import Pair
-from .player import Player
+from .player import PAIR_IDX, Player
 from .vul import Vul
 
 
@@ -18,8 +18,38 @@ class BiddingPhaseState(Enum):
     FINISHED = 2  # bidding phase is over
 
 
+class BiddingSnapshot(NamedTuple):
+    """Compact and hashable key of a bidding phase.
+
+    A bidding phase is restored from it by BiddingPhase.restore.
+    """
+    dealer: Player
+    vul: Vul
+    bids: bytes  # Bid.idx of taken bids
+
+
+class _AuctionNode(NamedTuple):
+    # State of an auction after a bid. Nodes are immutable and linked to the
+    # previous states, so clones of a bidding phase share them.
+    bid: Optional[Bid]  # None for the initial state
+    bid_num: int
+    active_player: Optional[Player]  # None if the bidding phase is over
+    last_bidder: Optional[Player]  # except Pass, X and XX
+    last_bid: Optional[Bid]  # except Pass, X and XX
+    called_x: bool
+    called_xx: bool
+    # first bidder of each strain in each pair. [pair idx * 5 + suit idx]
+    declarer_check: Tuple[Optional[Player], ...]
+    parent: Optional[_AuctionNode]
+
+
 class BiddingPhase:
-    """Bidding phase in contract bridge."""
+    """Bidding phase in contract bridge.
+
+    The state of an auction is kept in immutable nodes linked to the previous
+    states. undo_bid and clone are constant time, and clones share the
+    history.
+    """
 
     def __init__(self, dealer: Player = Player.N, vul: Vul = Vul.NONE):
         """
@@ -30,26 +60,12 @@ class BiddingPhase:
         """
         self.__dealer: Player = dealer  # player who firstly take a bid.
         self.__vul: Vul = vul  # vulnerability.
-
-        # player who take a bid in this turn.
-        self.__active_player: Optional[Player] = dealer
-
-        # player who take the last bid except Pass, X and XX.
-        self.__last_bidder: Optional[Player] = None
-
-        # the last bid except Pass, X and XX
-        self.__last_bid: Optional[Bid] = None
-        self.__called_x: bool = False
-        self.__called_xx: bool = False
-
-        self.__bid_history: List[Bid] = []
-        self.__players_bid_history: Dict[Player, List[Bid]] = \
-            {player: [] for player in Player}
-        self.__declarer_check: Dict[Pair, Dict[Suit, Optional[Player]]] = \
-            {pair: {suit: None for suit in Suit} for pair in Pair}
-
-        self.__available_bid: np.ndarray = np.ones(38)
-        self.__available_bid[-2:] = 0  # X and XX are set to be illegal.
+        self.__node: _AuctionNode = _AuctionNode(
+            bid=None, bid_num=0, active_player=dealer, last_bidder=None,
+            last_bid=None, called_x=False, called_xx=False,
+            declarer_check=(None,) * 10, parent=None)
+        self.__available_bid: Optional[np.ndarray] = None  # cache
+        self.__bids: Optional[Tuple[Bid, ...]] = ()  # cache of the history
 
     @property
     def dealer(self) -> Player:
@@ -77,16 +93,16 @@ class BiddingPhase:
         :return: Active player.
         :rtype: Player
         """
-        return self.__active_player
+        return self.__node.active_player
 
     @property
     def bid_history(self) -> List[Bid]:
         """History of bids.
 
-        :return: History of bids.
+        :return: History of bids. A new list is returned.
         :rtype: List[Bid]
         """
-        return self.__bid_history
+        return list(self.__history())
 
     @property
     def players_bid_history(self) -> Dict[Player, List[Bid]]:
@@ -95,26 +111,68 @@ class BiddingPhase:
         :return: Players' history of bids.
         :rtype: Dict[Player, List[Bid]]
         """
-        return self.__players_bid_history
+        bids = self.__history()
+        history: Dict[Player, List[Bid]] = dict()
+        player = self.__dealer
+        for i in range(4):
+            history[player] = list(bids[i::4])
+            player = player.next_player
+        return history
 
     @property
     def available_bid(self) -> np.ndarray:
         """Binary vector of available bids.
         The index of vector corresponds to Bid object index.
         [0-34] are [1C-7NT], 35 is Pass, 36 is X, 37 is XX.
+        All bids are unavailable after the bidding phase has done.
 
         :return: Binary vector of available bids.
         :rtype: np.ndarray
         """
+        if self.__available_bid is None:
+            available_bid = np.zeros(38)
+            if not self.has_done():
+                node = self.__node
+                available_bid[0 if node.last_bid is None else
+                              node.last_bid.idx + 1:Bid.Pass.idx + 1] = 1
+                available_bid[Bid.X.idx] = self.__can_double(node)
+                available_bid[Bid.XX.idx] = self.__can_redouble(node)
+            self.__available_bid = available_bid
         return self.__available_bid
 
+    def __history(self) -> Tuple[Bid, ...]:
+        # Bids taken until the current node. Nodes don't keep the history, so
+        # that a bid doesn't copy it, and it is rebuilt by walking the chain
+        # once after the node changes.
+        if self.__bids is None:
+            bids: List[Bid] = []
+            node = self.__node
+            while node.bid is not None:
+                bids.append(node.bid)
+                node = node.parent  # type: ignore
+            self.__bids = tuple(reversed(bids))
+        return self.__bids
+
     def has_done(self) -> bool:
         """Checks whether the bidding phase has done.
 
         :return: Whether the bidding phase has done.
         :rtype: bool
         """
-        return self.__active_player is None
+        return self.__node.active_player is None
+
+    @staticmethod
+    def __can_double(node: _AuctionNode) -> bool:
+        return node.last_bidder is not None and not node.called_x and \
+            not node.called_xx and \
+            not node.active_player.is_partner(  # type: ignore
+                node.last_bidder)
+
+    @staticmethod
+    def __can_redouble(node: _AuctionNode) -> bool:
+        return node.last_bidder is not None and node.called_x and \
+            not node.called_xx and \
+            node.active_player.is_partner(node.last_bidder)  # type: ignore
 
     def take_bid(self, bid: Bid) -> BiddingPhaseState:
         """Takes a bid.
@@ -126,59 +184,110 @@ class BiddingPhase:
         if self.has_done():
             raise Exception('Bidding phase has already ended.')
 
-        assert self.__active_player is not None
-
-        if self.__available_bid[bid.idx] == 0:  # illegal bids
-            return BiddingPhaseState.ILLEGAL
+        node = self.__node
+        active_player = node.active_player
+        assert active_player is not None
 
+        last_bidder = node.last_bidder
+        last_bid = node.last_bid
+        called_x = node.called_x
+        called_xx = node.called_xx
+        declarer_check = node.declarer_check
+        next_player: Optional[Player] = active_player.next_player
         if bid is Bid.Pass:  # Pass
-            if len(self.__bid_history) >= 3:
-                if self.__bid_history[-1] is Bid.Pass and \
-                        self.__bid_history[-2] is Bid.Pass:
-                    self.__bid_history.append(bid)
-                    self.__players_bid_history[self.__active_player].append(bid)
-                    self.__active_player = None
-                    return BiddingPhaseState.FINISHED  # bidding phase end
+            if node.bid_num >= 3 and node.bid is Bid.Pass and \
+                    node.parent.bid is Bid.Pass:  # type: ignore
+                next_player = None  # bidding phase end
         elif bid is Bid.X:  # X
-            self.__called_x = True
+            if not self.__can_double(node):
+                return BiddingPhaseState.ILLEGAL
+            called_x = True
         elif bid is Bid.XX:  # XX
-            self.__called_xx = True
+            if not self.__can_redouble(node):
+                return BiddingPhaseState.ILLEGAL
+            called_xx = True
         else:  # regular bids
+            if last_bid is not None and bid.idx <= last_bid.idx:
+                return BiddingPhaseState.ILLEGAL
             assert bid.suit is not None
 
-            self.__last_bidder = self.__active_player
-            self.__last_bid = bid
-
-            if self.__declarer_check[self.__active_player.pair][bid.suit] \
-                    is None:
-                self.__declarer_check[self.__active_player.pair][bid.suit] = \
-                    self.__active_player
-
-            self.__called_x, self.__called_xx = False, False
-            self.__available_bid[:bid.idx + 1] = 0
-
-        self.__bid_history.append(bid)
-        self.__players_bid_history[self.__active_player].append(bid)
-        self.__active_player = self.__active_player.next_player
-
-        if self.__last_bidder is not None:
-            # check X
-            if (not self.__called_x) and (not self.__called_xx) and \
-                    (not self.__active_player.is_partner(self.__last_bidder)):
-                self.__available_bid[Bid.X.idx] = 1
-            else:
-                self.__available_bid[Bid.X.idx] = 0
-
-            # check XX
-            if self.__called_x and (
-                    not self.__called_xx) and \
-                    self.__active_player.is_partner(self.__last_bidder):
-                self.__available_bid[Bid.XX.idx] = 1
-            else:
-                self.__available_bid[Bid.XX.idx] = 0
+            last_bidder = active_player
+            last_bid = bid
 
+            key = PAIR_IDX[active_player.value - 1] * 5 + bid.suit.value - 1
+            if declarer_check[key] is None:
+                declarer_check = declarer_check[:key] + (active_player,) + \
+                    declarer_check[key + 1:]
+
+            called_x, called_xx = False, False
+
+        self.__node = _AuctionNode(
+            bid=bid, bid_num=node.bid_num + 1, active_player=next_player,
+            last_bidder=last_bidder, last_bid=last_bid, called_x=called_x,
+            called_xx=called_xx, declarer_check=declarer_check, parent=node)
+        self.__available_bid = None
+        self.__bids = None
+
+        if next_player is None:
+            return BiddingPhaseState.FINISHED
         return BiddingPhaseState.ONGOING
 
+    def undo_bid(self) -> Bid:
+        """Takes back the last bid. It takes constant time.
+
+        :return: The bid taken back.
+        :raise Exception: If no bid has been taken.
+        """
+        node = self.__node
+        if node.bid is None:
+            raise Exception('No bid has been taken.')
+        assert node.parent is not None
+
+        self.__node = node.parent
+        self.__available_bid = None
+        self.__bids = None
+        return node.bid
+
+    def clone(self) -> BiddingPhase:
+        """Copies the bidding phase. It takes constant time.
+
+        The clone shares the immutable history with the original, and bids
+        taken by one of them don't affect the other.
+
+        :return: A copy of the bidding phase.
+        """
+        clone = BiddingPhase.__new__(BiddingPhase)
+        clone.__dealer = self.__dealer
+        clone.__vul = self.__vul
+        clone.__node = self.__node
+        clone.__available_bid = None
+        clone.__bids = self.__bids
+        return clone
+
+    def snapshot(self) -> BiddingSnapshot:
+        """Compact and hashable key of the bidding phase.
+
+        :return: Snapshot of the bidding phase.
+        """
+        return BiddingSnapshot(
+            dealer=self.__dealer, vul=self.__vul,
+            bids=bytes(bid.idx for bid in self.__history()))
+
+    @classmethod
+    def restore(cls, snapshot: BiddingSnapshot) -> BiddingPhase:
+        """Restores a bidding phase from a snapshot by replaying the bids.
+
+        :param snapshot: Snapshot of a bidding phase.
+        :return: Restored bidding phase.
+        """
+        bidding_phase = cls(dealer=snapshot.dealer, vul=snapshot.vul)
+        for idx in snapshot.bids:
+            state = bidding_phase.take_bid(Bid.int_to_bid(idx))
+            if state is BiddingPhaseState.ILLEGAL:
+                raise ValueError(f'Illegal bid {Bid.int_to_bid(idx)} is in '
+                                 f'the snapshot.')
+        return bidding_phase
+
     def contract(self) -> Optional[Contract]:
         """Contract declared in the bidding phase.
 
@@ -189,18 +298,20 @@ class BiddingPhase:
         if not self.has_done():
             return None
 
-        if self.__last_bid is None:  # 4 consecutive passes
+        node = self.__node
+        if node.last_bid is None:  # 4 consecutive passes
             return Contract(None, vul=self.__vul)  # Passed Out
         else:
-            assert self.__last_bidder is not None
-            assert self.__last_bid.suit is not None
+            assert node.last_bidder is not None
+            assert node.last_bid.suit is not None
 
             contract = Contract(
-                final_bid=self.__last_bid,
-                x=self.__called_x,
-                xx=self.__called_xx,
+                final_bid=node.last_bid,
+                x=node.called_x,
+                xx=node.called_xx,
                 vul=self.__vul,
-                declarer=self.__declarer_check[self.__last_bidder.pair][
-                    self.__last_bid.suit])
+                declarer=node.declarer_check[
+                    PAIR_IDX[node.last_bidder.value - 1] * 5
+                    + node.last_bid.suit.value - 1])
 
         return contract
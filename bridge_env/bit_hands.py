@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .card import Card
+from .deal_ordinal import masks_to_ordinal, ordinal_to_masks
+from .hands import DEAL_PATTERN, HAND_PATTERN, Hands
+from .player import Player
+from .suit import Suit
+
+# 13 bits of a suit. Suit.C is bits [0, 12], ..., Suit.S is bits [39, 51].
+SUIT_BITS = 0x1fff
+# all 52 cards
+FULL_DECK = (1 << 52) - 1
+
+_RANK_CHARS = '23456789TJQKA'
+
+
+def card_to_bit(card: Card) -> int:
+    """Converts a card to a single bit mask.
+
+    :param card: Card.
+    :return: Mask whose bit int(card) is set.
+    """
+    return 1 << int(card)
+
+
+def popcount(mask: int) -> int:
+    """Counts set bits of a mask.
+
+    :param mask: Non-negative int mask.
+    :return: The number of set bits.
+    """
+    return bin(mask).count('1')
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Iterates indexes of set bits in ascending order.
+
+    :param mask: Non-negative int mask.
+    :return: Indexes of set bits (yield).
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def suit_shift(suit: Suit) -> int:
+    """Bit offset of a suit in a 52-bit mask.
+
+    :param suit: Suit of cards. Suit.NT is not allowed.
+    :return: The bit index of the deuce of the suit.
+    """
+    if suit is Suit.NT:
+        raise ValueError('card suit is not NT')
+    return (suit.value - 1) * 13
+
+
+def cards_to_mask(cards: Set[Card]) -> int:
+    """Converts a set of cards to a 52-bit mask.
+
+    :param cards: Set of cards.
+    :return: 52-bit mask.
+    """
+    mask = 0
+    for card in cards:
+        mask |= 1 << int(card)
+    return mask
+
+
+def mask_to_cards(mask: int) -> Set[Card]:
+    """Converts a 52-bit mask to a set of cards.
+
+    :param mask: 52-bit mask.
+    :return: Set of cards.
+    """
+    return {Card.int_to_card(i) for i in iter_bits(mask)}
+
+
+@lru_cache(maxsize=None)
+def _suit_bits_to_pbn(bits: int) -> str:
+    return ''.join(_RANK_CHARS[i] for i in range(12, -1, -1) if bits >> i & 1)
+
+
+def _pbn_to_suit_bits(ranks: str) -> int:
+    bits = 0
+    for r in ranks:
+        bits |= 1 << _RANK_CHARS.index(r)
+    return bits
+
+
+class BitHands:
+    """Hands in contract bridge represented by 52-bit int masks.
+
+    Bit i of a hand is set when the player holds the card whose int
+    representation (int(card)) is i. A deal costs four ints instead of four
+    sets of Card objects, card membership is a bit test, a suit is extracted
+    by shift-and-mask, and a suit length is a popcount.
+
+    BitHands is immutable and hashable.
+
+    :param north: Mask of the north hand.
+    :param east: Mask of the east hand.
+    :param south: Mask of the south hand.
+    :param west: Mask of the west hand.
+    """
+    __slots__ = ('_masks',)
+
+    def __init__(self, north: int, east: int, south: int, west: int):
+        for mask in (north, east, south, west):
+            if mask < 0 or mask > FULL_DECK:
+                raise ValueError('hand mask is from 0 to 2 ** 52 - 1')
+        if (north & east) or (north & south) or (north & west) or \
+                (east & south) or (east & west) or (south & west):
+            raise ValueError('A card is held by more than one player.')
+        self._masks: Tuple[int, int, int, int] = (north, east, south, west)
+
+    def __getitem__(self, item: Player) -> int:
+        if not isinstance(item, Player):
+            raise KeyError('Key must be Player object.')
+        return self._masks[item.value - 1]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BitHands):
+            raise TypeError(
+                'BitHands object is comparable only with BitHands object.')
+        return self._masks == other._masks
+
+    def __hash__(self) -> int:
+        return hash(self._masks)
+
+    def __repr__(self) -> str:
+        return f'BitHands({self.to_pbn()!r})'
+
+    @property
+    def north(self) -> int:
+        return self._masks[0]
+
+    @property
+    def east(self) -> int:
+        return self._masks[1]
+
+    @property
+    def south(self) -> int:
+        return self._masks[2]
+
+    @property
+    def west(self) -> int:
+        return self._masks[3]
+
+    @property
+    def masks(self) -> Tuple[int, int, int, int]:
+        """Masks of the hands in the order of N, E, S and W."""
+        return self._masks
+
+    def has_card(self, player: Player, card: Card) -> bool:
+        """Checks whether a player holds a card.
+
+        :param player: Player.
+        :param card: Card.
+        :return: Whether the player holds the card.
+        """
+        return bool(self._masks[player.value - 1] >> int(card) & 1)
+
+    def owner(self, card: Card) -> Optional[Player]:
+        """Player who holds a card.
+
+        :param card: Card.
+        :return: Player who holds the card. None if no one holds it.
+        """
+        bit = 1 << int(card)
+        for i, mask in enumerate(self._masks):
+            if mask & bit:
+                return Player(i + 1)
+        return None
+
+    def suit_bits(self, player: Player, suit: Suit) -> int:
+        """Cards of a suit in a hand as a 13-bit mask.
+
+        :param player: Player.
+        :param suit: Suit.
+        :return: 13-bit mask. Bit 0 is the deuce and bit 12 is the ace.
+        """
+        return self._masks[player.value - 1] >> suit_shift(suit) & SUIT_BITS
+
+    def suit_length(self, player: Player, suit: Suit) -> int:
+        """The number of cards of a suit in a hand.
+
+        :param player: Player.
+        :param suit: Suit.
+        :return: Length of the suit.
+        """
+        return popcount(self.suit_bits(player, suit))
+
+    def suit_lengths(self, player: Player) -> Tuple[int, int, int, int]:
+        """Lengths of all suits in a hand.
+
+        :param player: Player.
+        :return: Lengths of the suits in the order of C, D, H and S.
+        """
+        mask = self._masks[player.value - 1]
+        return (popcount(mask & SUIT_BITS),
+                popcount(mask >> 13 & SUIT_BITS),
+                popcount(mask >> 26 & SUIT_BITS),
+                popcount(mask >> 39 & SUIT_BITS))
+
+    def hand_length(self, player: Player) -> int:
+        """The number of cards in a hand.
+
+        :param player: Player.
+        :return: The number of cards.
+        """
+        return popcount(self._masks[player.value - 1])
+
+    def cards(self, player: Player) -> Set[Card]:
+        """Cards of a hand as a set.
+
+        :param player: Player.
+        :return: Set of cards.
+        """
+        return mask_to_cards(self._masks[player.value - 1])
+
+    def to_hands(self) -> Hands:
+        """Converts to Hands object.
+
+        :return: Hands object which has the same cards.
+        """
+        return Hands(north_hand=mask_to_cards(self._masks[0]),
+                     east_hand=mask_to_cards(self._masks[1]),
+                     south_hand=mask_to_cards(self._masks[2]),
+                     west_hand=mask_to_cards(self._masks[3]))
+
+    def to_dict(self) -> Dict[Player, Set[Card]]:
+        """Converts to dict format.
+
+        :return: Dict of Player and set of cards.
+        """
+        return {p: mask_to_cards(self._masks[p.value - 1]) for p in Player}
+
+    def to_pbn(self, dealer: Player = Player.N) -> str:
+        """Converts to deal in PBN format.
+
+        :param dealer: Dealer.
+        :return: Hands in PBN format.
+        """
+        player = dealer
+        cards: List[str] = list()
+        for _ in range(4):
+            cards.append(self._convert_hand_to_pbn(
+                self._masks[player.value - 1]))
+            player = player.next_player
+        return f'{dealer}:{cards[0]} {cards[1]} {cards[2]} {cards[3]}'
+
+    @staticmethod
+    def _convert_hand_to_pbn(mask: int) -> str:
+        if mask == 0:
+            return '-'
+        return '.'.join(_suit_bits_to_pbn(mask >> shift & SUIT_BITS)
+                        for shift in (39, 26, 13, 0))
+
+    def to_binary(self) -> Dict[Player, Tuple[int, ...]]:
+        """Converts to tuple of 52 dims binary vectors.
+
+        :return: Dict of Player and tuple of 52 dims binary vector.
+        """
+        return {p: tuple(self._masks[p.value - 1] >> i & 1 for i in range(52))
+                for p in Player}
+
+    def to_np_binary(self, dtype: np.dtype = np.int32) -> Dict[
+        Player, np.ndarray]:
+        """Converts to 52 dims binary numpy array.
+
+        :param dtype: numpy array's dtype.
+        :return: Dict of Player and 52 dims binary numpy array.
+        """
+        shifts = np.arange(52, dtype=np.uint64)
+        return {p: ((np.uint64(self._masks[p.value - 1]) >> shifts)
+                    & np.uint64(1)).astype(dtype) for p in Player}
+
+    def to_ordinal(self) -> int:
+        """Converts a complete deal to the ordinal.
+
+        See bridge_env.deal_ordinal for the encoding.
+
+        :return: Ordinal of the deal.
+        """
+        return masks_to_ordinal(self._masks)
+
+    @classmethod
+    def from_ordinal(cls, ordinal: int) -> BitHands:
+        """Converts an ordinal to BitHands object.
+
+        :param ordinal: Ordinal of a deal.
+        :return: BitHands instance of the ordinal.
+        """
+        return cls(*ordinal_to_masks(ordinal))
+
+    @classmethod
+    def convert_hands(cls, hands: Hands) -> BitHands:
+        """Converts Hands object to BitHands object.
+
+        :param hands: Hands object.
+        :return: BitHands which has the same cards.
+        """
+        return cls(north=cards_to_mask(hands.north),
+                   east=cards_to_mask(hands.east),
+                   south=cards_to_mask(hands.south),
+                   west=cards_to_mask(hands.west))
+
+    @classmethod
+    def convert_pbn(cls, pbn_hands: str) -> BitHands:
+        """Converts PBN style hands to BitHands object.
+
+        See Hands.convert_pbn for the format.
+
+        :param pbn_hands: String of PBN style hands.
+        :return: BitHands instance converted from pbn hands.
+        """
+        match = re.match(DEAL_PATTERN, pbn_hands)
+        if not match:
+            raise Exception(f'Parse exception. "{pbn_hands}" does not match '
+                            f'the pattern.')
+        player = Player[match.group(1)]
+        masks = [0] * 4
+        for i in range(2, 2 + 4):
+            masks[player.value - 1] = cls._hand_parser(match.group(i))
+            player = player.next_player
+        return cls(*masks)
+
+    @staticmethod
+    def _hand_parser(pbn_hand: str) -> int:
+        if pbn_hand == '-':
+            return 0
+        match = re.match(HAND_PATTERN, pbn_hand)
+        if not match:
+            raise Exception(f'Parse exception. "{pbn_hand}" does not match '
+                            f'the pattern.')
+        return (_pbn_to_suit_bits(match.group(1)) << 39
+                | _pbn_to_suit_bits(match.group(2)) << 26
+                | _pbn_to_suit_bits(match.group(3)) << 13
+                | _pbn_to_suit_bits(match.group(4)))
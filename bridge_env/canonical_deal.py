@@ -0,0 +1,146 @@
+"""Canonical forms of deals.
+
+The double dummy analysis of a deal doesn't change under rotation of seats or
+relabelling of the 4 suits, except that the DDA table is rotated and its
+suits are relabelled in the same way. canonicalize chooses one representative
+deal among these 96 equivalent deals, so the canonical form can be used as a
+key of memoization::
+
+    >>> canonical, transform = canonicalize(hands)
+    >>> dda = transform.to_original_dda(calc_dda(canonical))
+
+The canonical deal maximizes the holdings of the 4 players in spades, and then
+in hearts, diamonds and clubs.
+"""
+from __future__ import annotations
+
+from typing import Dict, NamedTuple, Sequence, Tuple
+
+from .bit_hands import SUIT_BITS, cards_to_mask, mask_to_cards
+from .deal_ordinal import ORDINAL_BYTES, masks_to_ordinal
+from .hands import Hands
+from .player import Player
+from .suit import Suit
+
+_PLAYERS = (Player.N, Player.E, Player.S, Player.W)
+_SUITS = (Suit.C, Suit.D, Suit.H, Suit.S)
+
+
+class DealTransform(NamedTuple):
+    """Transform from a deal to its canonical form.
+
+    The hand of the original seat i is held by the seat (i - rotation) % 4 in
+    the canonical deal, and the original suit s is relabelled to the suit
+    suit_map[s]. Seats and suits are indexed by Player.value - 1 and
+    Suit.value - 1.
+    """
+    rotation: int
+    suit_map: Tuple[int, int, int, int]
+
+    def player(self, player: Player) -> Player:
+        """Canonical seat of an original seat.
+
+        :param player: Seat in the original deal.
+        :return: Seat in the canonical deal.
+        """
+        return _PLAYERS[(player.value - 1 - self.rotation) % 4]
+
+    def suit(self, suit: Suit) -> Suit:
+        """Canonical suit of an original suit.
+
+        :param suit: Suit in the original deal. NT is not changed.
+        :return: Suit in the canonical deal.
+        """
+        if suit is Suit.NT:
+            return suit
+        return _SUITS[self.suit_map[suit.value - 1]]
+
+    def apply_masks(self, masks: Sequence[int]) -> Tuple[int, int, int, int]:
+        """Transforms hands.
+
+        :param masks: 52-bit masks of hands in the order of N, E, S and W.
+        :return: Transformed masks of hands.
+        """
+        result = []
+        for i in range(4):
+            mask = masks[(i + self.rotation) % 4]
+            result.append(sum(
+                (mask >> 13 * s & SUIT_BITS) << 13 * self.suit_map[s]
+                for s in range(4)))
+        return result[0], result[1], result[2], result[3]
+
+    def to_canonical_dda(self, dda: Dict[Player, Dict[Suit, int]]
+                         ) -> Dict[Player, Dict[Suit, int]]:
+        """Converts a DDA table of the original deal to the canonical deal.
+
+        :param dda: DDA table of the original deal.
+        :return: DDA table of the canonical deal.
+        """
+        players = {self.player(p): p for p in Player}
+        suits = {self.suit(s): s for s in Suit}
+        return {p: {s: dda[players[p]][suits[s]]
+                    for s in Suit if suits[s] in dda[players[p]]}
+                for p in Player}
+
+    def to_original_dda(self, dda: Dict[Player, Dict[Suit, int]]
+                        ) -> Dict[Player, Dict[Suit, int]]:
+        """Converts a DDA table of the canonical deal to the original deal.
+
+        :param dda: DDA table of the canonical deal.
+        :return: DDA table of the original deal.
+        """
+        return {p: {s: dda[self.player(p)][self.suit(s)]
+                    for s in Suit if self.suit(s) in dda[self.player(p)]}
+                for p in Player}
+
+
+def canonicalize_masks(masks: Sequence[int]
+                       ) -> Tuple[Tuple[int, int, int, int], DealTransform]:
+    """Canonicalizes a deal.
+
+    :param masks: 52-bit masks of hands in the order of N, E, S and W. The
+        deal may be incomplete.
+    :return: Masks of the canonical deal and the transform to it.
+    """
+    best_holdings = None
+    best = DealTransform(0, (0, 1, 2, 3))
+    for rotation in range(4):
+        rotated = [masks[(i + rotation) % 4] for i in range(4)]
+        # holdings of the 4 players in each suit
+        suits = sorted(((tuple(mask >> 13 * s & SUIT_BITS for mask in rotated),
+                         s) for s in range(4)), reverse=True)
+        # the largest holdings go to spades
+        holdings = [h for h, _ in suits]
+        if best_holdings is None or holdings > best_holdings:
+            suit_map = [0] * 4
+            for i, (_, s) in enumerate(suits):
+                suit_map[s] = 3 - i
+            best_holdings = holdings
+            best = DealTransform(rotation, (suit_map[0], suit_map[1],
+                                            suit_map[2], suit_map[3]))
+    return best.apply_masks(masks), best
+
+
+def canonicalize(hands: Hands) -> Tuple[Hands, DealTransform]:
+    """Canonicalizes a deal.
+
+    :param hands: Hands of 4 players.
+    :return: Canonical hands and the transform to them.
+    """
+    masks, transform = canonicalize_masks(
+        [cards_to_mask(hands[p]) for p in _PLAYERS])
+    canonical = Hands(north_hand=mask_to_cards(masks[0]),
+                      east_hand=mask_to_cards(masks[1]),
+                      south_hand=mask_to_cards(masks[2]),
+                      west_hand=mask_to_cards(masks[3]))
+    return canonical, transform
+
+
+def canonical_key(masks: Sequence[int]) -> bytes:
+    """Key of the equivalence class of a complete deal.
+
+    :param masks: 52-bit masks of hands in the order of N, E, S and W.
+    :return: 12-byte ordinal of the canonical deal.
+    """
+    canonical, _ = canonicalize_masks(masks)
+    return masks_to_ordinal(canonical).to_bytes(ORDINAL_BYTES, 'big')
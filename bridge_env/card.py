@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Dict, Tuple
 
+from ._dataclass_slots import add_slots
 from .suit import Suit
 
 
+@add_slots
 @dataclass(frozen=True)
 class Card:
     """Card of playing cards.
@@ -12,6 +15,10 @@ class Card:
     Card is comparable. The order is C2 < ... <  CA < D2 < ... <  DA < H2 < ...
     <  HA < S2 < ... <  SA, which is base on the index (int(card)) of the card.
 
+    The 52 cards are interned. Card.int_to_card, Card.str_to_card and
+    Card.rank_suit_to_card return the shared instances instead of creating
+    new objects, and copies of a card are the card itself.
+
     :param rank: Rank of the card. A value is from 2 to 14.
         10 means T, 11 means J, 12 means Q, 13 means K, 14 means A.
     :param suit: Suit of the card.
@@ -20,11 +27,33 @@ class Card:
     rank: int
     suit: Suit
 
+    # int representation cached by __post_init__
+    __slots__ = ('_idx',)
+
     def __post_init__(self):
         if self.rank < 2 or 14 < self.rank:
             raise ValueError("card rank is from 2 to 14")
         if self.suit == Suit.NT:
             raise ValueError("card suit is not NT")
+        object.__setattr__(self, '_idx',
+                           self.rank - 2 + (self.suit.value - 1) * 13)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._idx == other._idx
+
+    def __hash__(self) -> int:
+        return self._idx
+
+    def __copy__(self) -> Card:
+        return self
+
+    def __deepcopy__(self, memo) -> Card:
+        return self
+
+    def __reduce__(self):
+        return Card.int_to_card, (self._idx,)
 
     def __str__(self):
         """
@@ -51,27 +80,27 @@ class Card:
             (C2 - CA, D2 - DA, H2 - HA, S2 - SA)
         :rtype: int
         """
-        return self.rank - 2 + (self.suit.value - 1) * 13
+        return self._idx
 
     def __lt__(self, other: Card) -> bool:
         if not isinstance(other, self.__class__):
             raise NotImplementedError
-        return int(self) < int(other)
+        return self._idx < other._idx
 
     def __le__(self, other: Card) -> bool:
         if not isinstance(other, self.__class__):
             raise NotImplementedError
-        return int(self) <= int(other)
+        return self._idx <= other._idx
 
     def __gt__(self, other: Card) -> bool:
         if not isinstance(other, self.__class__):
             raise NotImplementedError
-        return int(self) > int(other)
+        return self._idx > other._idx
 
     def __ge__(self, other: Card) -> bool:
         if not isinstance(other, self.__class__):
             raise NotImplementedError
-        return int(self) >= int(other)
+        return self._idx >= other._idx
 
     @classmethod
     def int_to_card(cls, x: int) -> Card:
@@ -85,7 +114,7 @@ class Card:
         if x < 0 or 51 < x:
             raise ValueError("card int is from 0 to 51")
 
-        return Card(x % 13 + 2, Suit(x // 13 + 1))
+        return _CARDS[x]
 
     @classmethod
     def str_to_card(cls, x: str) -> Card:
@@ -95,11 +124,28 @@ class Card:
             'DT', 'HQ' or 'SA'.
         :return: Converted Card object.
         """
+        card = _STR_TO_CARD.get(x)
+        if card is not None:
+            return card
         if len(x) != 2:
             raise ValueError('Incorrect card string format.')
         suit = Suit[x[0]]
         rank = Card.rank_str_to_int(x[1])
-        return Card(rank, suit)
+        return Card.rank_suit_to_card(rank, suit)
+
+    @classmethod
+    def rank_suit_to_card(cls, rank: int, suit: Suit) -> Card:
+        """Converts rank and suit to Card.
+
+        :param rank: Rank of the card. A value is from 2 to 14.
+        :param suit: Suit of the card.
+        :return: Card object of the rank and the suit.
+        :raise ValueError: If rank or suit is not of a card.
+        """
+        card = _RANK_SUIT_TO_CARD.get((rank, suit))
+        if card is None:
+            return Card(rank, suit)  # raises ValueError
+        return card
 
     @classmethod
     def rank_int_to_str(cls, rank: int) -> str:
@@ -146,3 +192,11 @@ class Card:
             return 14
         else:
             return int(rank)
+
+
+# Interned cards. _CARDS[i] is the card whose int representation is i.
+_CARDS: Tuple[Card, ...] = tuple(Card(i % 13 + 2, Suit(i // 13 + 1))
+                                 for i in range(52))
+_STR_TO_CARD: Dict[str, Card] = {str(card): card for card in _CARDS}
+_RANK_SUIT_TO_CARD: Dict[Tuple[int, Suit], Card] = {
+    (card.rank, card.suit): card for card in _CARDS}
@@ -3,12 +3,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
+from ._dataclass_slots import add_slots
 from .bid import Bid
 from .player import Player
 from .suit import Suit
 from .vul import Vul
 
 
+@add_slots
 @dataclass(frozen=True)
 class Contract:
     """Contract in contract bridge.
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
-from typing import Dict, IO, List, NamedTuple, Optional
+from typing import Dict, IO, Iterator, List, NamedTuple, Optional
 
 from .. import Bid, Contract, Hands, Pair, Player, Suit, TrickHistory, Vul
 
@@ -30,6 +30,60 @@ class Parser(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def iter_board_settings(self, fp: IO[str]) -> Iterator[BoardSetting]:
+        """Parses board settings one by one.
+
+        The default implementation parses all board settings at first.
+        Subclasses may override it to keep memory use bounded.
+
+        :param fp: Input stream of board settings' file.
+        :return: Board settings (yield).
+        """
+        yield from self.parse_board_settings(fp)
+
+    def iter_board_logs(self, fp: IO[str]) -> Iterator[BoardLog]:
+        """Parses board logs one by one.
+
+        The default implementation parses all board logs at first.
+        Subclasses may override it to keep memory use bounded.
+
+        :param fp: Input stream of board settings' file.
+        :return: Board logs (yield).
+        """
+        yield from self.parse_board_logs(fp)
+
+    def board_offsets(self, fp: IO[bytes]) -> List[int]:
+        """Finds the byte offsets of boards.
+
+        A board is parsed by seeking to its offset and calling
+        iter_board_settings_at or iter_board_logs_at.
+
+        :param fp: Input stream of the file in binary mode.
+        :return: Byte offsets of boards from the start of the file.
+        """
+        raise NotImplementedError(
+            f'{type(self).__name__} does not support board offsets.')
+
+    def iter_board_settings_at(self, fp: IO[str]) -> Iterator[BoardSetting]:
+        """Parses board settings from the current position of the stream.
+
+        The position must be a board offset found by board_offsets.
+
+        :param fp: Input stream of board settings' file.
+        :return: Board settings from the position (yield).
+        """
+        yield from self.iter_board_settings(fp)
+
+    def iter_board_logs_at(self, fp: IO[str]) -> Iterator[BoardLog]:
+        """Parses board logs from the current position of the stream.
+
+        The position must be a board offset found by board_offsets.
+
+        :param fp: Input stream of logs' file.
+        :return: Board logs from the position (yield).
+        """
+        yield from self.iter_board_logs(fp)
+
 
 class BoardSetting(NamedTuple):
     """Board setting.
@@ -62,7 +116,7 @@ class BoardLog(NamedTuple):
     vul: Vul
     declarer: Optional[Player]  # None if passed out.
     contract: Contract  # Contract contains vul and dealer information.
-    taken_trick: int
+    taken_trick: Optional[int]  # None if passed out or not played out.
     # optional
     players: Optional[Dict[Player, str]] = None  # player names
     bid_history: Optional[List[Bid]] = None
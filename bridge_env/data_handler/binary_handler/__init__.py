@@ -0,0 +1,51 @@
+"""Columnar binary archive of board settings and board logs.
+
+An archive file consists of a header, an extra region and a record region::
+
+    header (64 bytes): magic, the number of boards, offsets of the regions
+    extra region: variable-length fields of boards (board id, player names,
+        score type, bid history and play history)
+    record region: fixed-width records of boards (_RECORD_DTYPE)
+
+The record region is a NumPy structured array, which is loaded with np.memmap,
+so an archive opens without reading boards and each board is accessed in
+O(1).
+"""
+import struct
+
+import numpy as np
+
+# Archive format version
+_MAGIC = b'BRGARC01'
+
+# magic, the number of boards, offset of the extra region, offset of records
+_HEADER = struct.Struct('<8sQQQ')
+_HEADER_SIZE = 64
+
+# Flags of records.
+_HAS_DDA = 1
+_IS_LOG = 2
+_HAS_PLAYERS = 4
+_HAS_BID_HISTORY = 8
+_HAS_PLAY_HISTORY = 16
+_HAS_SCORE_TYPE = 32
+_HAS_SCORES = 64
+
+# Value of empty uint8 fields (passed out contract and declarer).
+_NONE = 255
+
+# Fixed-width record of a board. Players, suits and bids are 0-indexed.
+_RECORD_DTYPE = np.dtype([
+    ('deal', 'u1', (12,)),  # deal ordinal (big endian)
+    ('dealer', 'u1'),
+    ('vul', 'u1'),
+    ('flags', 'u1'),
+    ('dda', 'u1', (4, 5)),  # [declarer, strain]
+    ('contract', 'u1'),  # bid.idx of the final bid
+    ('doubled', 'u1'),  # 0: not doubled, 1: doubled, 2: redoubled
+    ('declarer', 'u1'),
+    ('taken_trick', 'i1'),  # -1 if passed out
+    ('scores', '<i4', (2,)),  # NS, EW
+    ('extra_offset', '<u8'),
+    ('extra_length', '<u4'),
+])
@@ -0,0 +1,170 @@
+import pathlib
+import struct
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from . import _HAS_BID_HISTORY, _HAS_DDA, _HAS_PLAYERS, _HAS_PLAY_HISTORY, \
+    _HAS_SCORES, _HAS_SCORE_TYPE, _HEADER, _IS_LOG, _MAGIC, _NONE, \
+    _RECORD_DTYPE
+from ..abstract_classes import BoardLog, BoardSetting
+from ... import Bid, Card, Contract, Hands, Pair, Player, Suit, \
+    TrickHistory, Vul
+from ...bid import BIDS
+
+_PLAYERS = (Player.N, Player.E, Player.S, Player.W)
+_STRAINS = (Suit.C, Suit.D, Suit.H, Suit.S, Suit.NT)
+_VULS = (Vul.NONE, Vul.NS, Vul.EW, Vul.BOTH)
+_CARDS = tuple(Card.int_to_card(i) for i in range(52))
+
+
+class BoardArchive:
+    """Binary archive of board settings and board logs.
+
+    The archive is memory-mapped, so opening it doesn't read boards.
+    archive[i] decodes the i-th board as BoardLog if it is a log, otherwise
+    as BoardSetting. records is the structured array of fixed-width fields,
+    which can be used for vectorized analysis::
+
+        >>> archive = BoardArchive('boards.bin')
+        >>> archive[9000].board_id
+        '9001'
+        >>> archive.records['dda'].shape
+        (100000, 4, 5)
+
+    :param path: Path of the archive file.
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path]):
+        with open(path, 'rb') as fp:
+            header = fp.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError('File is not a board archive.')
+        magic, board_num, extra_offset, records_offset = \
+            _HEADER.unpack(header)
+        if magic != _MAGIC:
+            raise ValueError('File is not a board archive.')
+        self._data = np.memmap(path, dtype=np.uint8, mode='r')
+        self.records: np.ndarray = np.ndarray(
+            shape=(board_num,), dtype=_RECORD_DTYPE, buffer=self._data,
+            offset=records_offset) if board_num > 0 \
+            else np.zeros(0, dtype=_RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index: int) -> Union[BoardSetting, BoardLog]:
+        record = self.records[index]
+        if record['flags'] & _IS_LOG:
+            return self._board_log(record)
+        return self._board_setting(record, self._extra(record)[0])
+
+    def __iter__(self) -> Iterator[Union[BoardSetting, BoardLog]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def board_setting(self, index: int) -> BoardSetting:
+        """Decodes the board setting of a board.
+
+        :param index: Index of the board.
+        :return: Board setting of the board, also for board logs.
+        """
+        record = self.records[index]
+        return self._board_setting(record, self._extra(record)[0])
+
+    def board_log(self, index: int) -> BoardLog:
+        """Decodes the board log of a board.
+
+        :param index: Index of the board.
+        :return: Board log of the board.
+        """
+        record = self.records[index]
+        if not record['flags'] & _IS_LOG:
+            raise ValueError(f'Board {index} is not a board log.')
+        return self._board_log(record)
+
+    def _extra(self, record: np.ndarray) -> Tuple[str, bytes, int]:
+        offset = int(record['extra_offset'])
+        extra = self._data[offset:offset + int(record['extra_length'])] \
+            .tobytes()
+        board_id, pos = _unpack_str(extra, 0)
+        return board_id, extra, pos
+
+    @staticmethod
+    def _board_setting(record: np.ndarray, board_id: str) -> BoardSetting:
+        dda: Optional[Dict[Player, Dict[Suit, int]]] = None
+        if record['flags'] & _HAS_DDA:
+            dda = {p: {s: int(record['dda'][i, j])
+                       for j, s in enumerate(_STRAINS)}
+                   for i, p in enumerate(_PLAYERS)}
+        return BoardSetting(
+            hands=Hands.from_ordinal(int.from_bytes(record['deal'].tobytes(),
+                                                    'big')),
+            dealer=_PLAYERS[record['dealer']],
+            vul=_VULS[record['vul']],
+            board_id=board_id,
+            dda=dda)
+
+    def _board_log(self, record: np.ndarray) -> BoardLog:
+        flags = int(record['flags'])
+        board_id, extra, pos = self._extra(record)
+        board_setting = self._board_setting(record, board_id)
+
+        players: Optional[Dict[Player, str]] = None
+        if flags & _HAS_PLAYERS:
+            players = dict()
+            for player in _PLAYERS:
+                players[player], pos = _unpack_str(extra, pos)
+        score_type: Optional[str] = None
+        if flags & _HAS_SCORE_TYPE:
+            score_type, pos = _unpack_str(extra, pos)
+        bid_history: Optional[List[Bid]] = None
+        if flags & _HAS_BID_HISTORY:
+            (length,), pos = struct.unpack_from('<H', extra, pos), pos + 2
+            bid_history = [BIDS[b] for b in extra[pos:pos + length]]
+            pos += length
+        play_history: Optional[List[TrickHistory]] = None
+        if flags & _HAS_PLAY_HISTORY:
+            (length,), pos = struct.unpack_from('<H', extra, pos), pos + 2
+            play_history = []
+            for _ in range(length):
+                leader, card_num = extra[pos], extra[pos + 1]
+                cards = tuple(_CARDS[c]
+                              for c in extra[pos + 2:pos + 2 + card_num])
+                play_history.append(TrickHistory(leader=_PLAYERS[leader],
+                                                 cards=cards))
+                pos += 2 + card_num
+
+        declarer = None if record['declarer'] == _NONE \
+            else _PLAYERS[record['declarer']]
+        if record['contract'] == _NONE:
+            contract = Contract(final_bid=None, vul=board_setting.vul)
+        else:
+            doubled = int(record['doubled'])
+            contract = Contract(final_bid=BIDS[record['contract']],
+                                x=doubled >= 1, xx=doubled == 2,
+                                vul=board_setting.vul, declarer=declarer)
+        scores: Optional[Dict[Pair, int]] = None
+        if flags & _HAS_SCORES:
+            scores = {Pair.NS: int(record['scores'][0]),
+                      Pair.EW: int(record['scores'][1])}
+        return BoardLog(board_id=board_id,
+                        hands=board_setting.hands,
+                        dealer=board_setting.dealer,
+                        vul=board_setting.vul,
+                        declarer=declarer,
+                        contract=contract,
+                        taken_trick=None if record['taken_trick'] < 0
+                        else int(record['taken_trick']),
+                        players=players,
+                        bid_history=bid_history,
+                        play_history=play_history,
+                        dda=board_setting.dda,
+                        score_type=score_type,
+                        scores=scores)
+
+
+def _unpack_str(data: bytes, pos: int) -> Tuple[str, int]:
+    (length,) = struct.unpack_from('<H', data, pos)
+    pos += 2
+    return data[pos:pos + length].decode('utf-8'), pos + length
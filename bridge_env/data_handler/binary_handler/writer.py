@@ -0,0 +1,157 @@
+import pathlib
+import shutil
+import struct
+import tempfile
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from . import _HAS_BID_HISTORY, _HAS_DDA, _HAS_PLAYERS, _HAS_PLAY_HISTORY, \
+    _HAS_SCORES, _HAS_SCORE_TYPE, _HEADER, _HEADER_SIZE, _IS_LOG, _MAGIC, \
+    _NONE, _RECORD_DTYPE
+from ..abstract_classes import BoardLog, BoardSetting
+from ... import Pair, Player, Suit
+from ...deal_ordinal import ORDINAL_BYTES
+
+_PLAYERS = (Player.N, Player.E, Player.S, Player.W)
+_STRAINS = (Suit.C, Suit.D, Suit.H, Suit.S, Suit.NT)
+
+
+def _pack_str(string: str) -> bytes:
+    data = string.encode('utf-8')
+    return struct.pack('<H', len(data)) + data
+
+
+class BinaryWriter:
+    """Writer for board settings and board logs in a binary archive.
+
+    Records are kept in a temporary file until close, where they are appended
+    to the archive after the extra region.
+
+    :param path: Path of the archive file. File will be overwritten.
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path]):
+        self._path = pathlib.Path(path)
+        self._open = False
+        self._board_num = 0
+        self._extra_size = 0
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self):
+        self._file = open(self._path, 'wb')
+        self._file.write(b'\0' * _HEADER_SIZE)
+        self._records = tempfile.TemporaryFile()
+        self._board_num = 0
+        self._extra_size = 0
+        self._open = True
+
+    def close(self):
+        # records are aligned to 8 bytes
+        padding = -(_HEADER_SIZE + self._extra_size) % 8
+        self._file.write(b'\0' * padding)
+        records_offset = _HEADER_SIZE + self._extra_size + padding
+        self._records.seek(0)
+        shutil.copyfileobj(self._records, self._file)
+        self._records.close()
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(_MAGIC, self._board_num, _HEADER_SIZE,
+                                      records_offset))
+        self._file.close()
+        self._open = False
+
+    def write_board_setting(self, board_setting: BoardSetting) -> None:
+        """Writes a BoardSetting object to the archive.
+
+        :param board_setting: Board setting to be written.
+        :return: None.
+        """
+        record = self._record(board_setting.hands.to_ordinal(),
+                              board_setting.dealer,
+                              board_setting.vul,
+                              board_setting.dda)
+        self._write(record, _pack_str(board_setting.board_id))
+
+    def write_board_log(self, board_log: BoardLog) -> None:
+        """Writes a BoardLog object to the archive.
+
+        :param board_log: Board log to be written.
+        :return: None.
+        """
+        record = self._record(board_log.hands.to_ordinal(),
+                              board_log.dealer,
+                              board_log.vul,
+                              board_log.dda)
+        record['flags'] |= _IS_LOG
+        contract = board_log.contract
+        if contract.is_passed_out():
+            record['contract'] = _NONE
+        else:
+            assert contract.final_bid is not None
+            record['contract'] = contract.final_bid.idx
+            record['doubled'] = 2 if contract.xx else int(contract.x)
+        record['declarer'] = _NONE if board_log.declarer is None \
+            else board_log.declarer.value - 1
+        record['taken_trick'] = -1 if board_log.taken_trick is None \
+            else board_log.taken_trick
+
+        extra = [_pack_str(board_log.board_id)]
+        if board_log.players is not None:
+            record['flags'] |= _HAS_PLAYERS
+            extra += [_pack_str(board_log.players[p]) for p in _PLAYERS]
+        if board_log.score_type is not None:
+            record['flags'] |= _HAS_SCORE_TYPE
+            extra.append(_pack_str(board_log.score_type))
+        if board_log.bid_history is not None:
+            record['flags'] |= _HAS_BID_HISTORY
+            extra.append(struct.pack('<H', len(board_log.bid_history)))
+            extra.append(bytes(bid.idx for bid in board_log.bid_history))
+        if board_log.play_history is not None:
+            record['flags'] |= _HAS_PLAY_HISTORY
+            extra.append(struct.pack('<H', len(board_log.play_history)))
+            for trick in board_log.play_history:
+                leader = trick.leader if isinstance(trick.leader, Player) \
+                    else Player[trick.leader]
+                extra.append(bytes([leader.value - 1, len(trick.cards)]))
+                extra.append(bytes(int(card) for card in trick.cards))
+        if board_log.scores is not None:
+            record['flags'] |= _HAS_SCORES
+            record['scores'] = [_pair_score(board_log.scores, pair)
+                                for pair in (Pair.NS, Pair.EW)]
+        self._write(record, b''.join(extra))
+
+    @staticmethod
+    def _record(ordinal: int, dealer: Player, vul,
+                dda: Optional[Dict[Player, Dict[Suit, int]]]) -> np.ndarray:
+        record = np.zeros((), dtype=_RECORD_DTYPE)
+        record['deal'] = list(ordinal.to_bytes(ORDINAL_BYTES, 'big'))
+        record['dealer'] = dealer.value - 1
+        record['vul'] = vul.value - 1
+        record['contract'] = _NONE
+        record['declarer'] = _NONE
+        record['taken_trick'] = -1
+        if dda is not None:
+            record['flags'] |= _HAS_DDA
+            record['dda'] = [[dda[p][s] for s in _STRAINS] for p in _PLAYERS]
+        return record
+
+    def _write(self, record: np.ndarray, extra: bytes) -> None:
+        if not self._open:
+            raise Exception('BinaryWriter does not open the file.')
+        record['extra_offset'] = _HEADER_SIZE + self._extra_size
+        record['extra_length'] = len(extra)
+        self._file.write(extra)
+        self._extra_size += len(extra)
+        self._records.write(record.tobytes())
+        self._board_num += 1
+
+
+def _pair_score(scores: Dict, pair: Pair) -> int:
+    # scores parsed from JSON have str keys
+    return scores[pair] if pair in scores else scores[str(pair)]
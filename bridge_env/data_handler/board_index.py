@@ -0,0 +1,181 @@
+"""Byte-offset index of boards in a file.
+
+The index records the byte offset of each board of a PBN, JSON or JSON Lines
+file in a sidecar file next to it (boards.pbn -> boards.pbn.idx). The sidecar
+stores the size and the modification time of the indexed file, and is
+rebuilt when the file is changed. Boards are parsed by seeking to their
+offsets, so the board k is read without parsing the boards before it::
+
+    >>> board_settings = IndexedBoardSettings.open('boards.pbn', PbnParser())
+    >>> board_settings[9000].board_id
+    '9001'
+    >>> remaining = board_settings[9000:]  # no boards are parsed
+"""
+from __future__ import annotations
+
+import io
+import os
+import pathlib
+import struct
+from logging import getLogger
+from typing import IO, Iterator, Sequence, Union, overload
+
+import numpy as np
+
+from .abstract_classes import BoardSetting, Parser
+
+logger = getLogger(__file__)
+
+# Index format version
+_MAGIC = b'BRGIDX01'
+
+# magic, size and modification time (ns) of the indexed file, the number of
+# boards
+_HEADER = struct.Struct('<8sQqQ')
+
+_OFFSET_DTYPE = np.dtype('<u8')
+
+
+def index_path(path: Union[str, pathlib.Path]) -> pathlib.Path:
+    """Path of the sidecar index of a file.
+
+    :param path: Path of the indexed file.
+    :return: Path of the sidecar file.
+    """
+    path = pathlib.Path(path)
+    return path.with_name(path.name + '.idx')
+
+
+def build_offsets(path: Union[str, pathlib.Path],
+                  parser: Parser) -> np.ndarray:
+    """Finds the byte offsets of boards in a file and saves them.
+
+    The sidecar is not saved if it can't be written, for example in a
+    read-only directory.
+
+    :param path: Path of the file.
+    :param parser: Parser of the file format.
+    :return: Byte offsets of boards.
+    """
+    stat = os.stat(path)
+    with open(path, 'rb') as fp:
+        offsets = np.array(parser.board_offsets(fp), dtype=_OFFSET_DTYPE)
+    sidecar = index_path(path)
+    temp = sidecar.with_name(sidecar.name + '.tmp')
+    try:
+        with open(temp, 'wb') as fw:
+            fw.write(_HEADER.pack(_MAGIC, stat.st_size, stat.st_mtime_ns,
+                                  len(offsets)))
+            fw.write(offsets.tobytes())
+        os.replace(temp, sidecar)
+    except OSError as e:
+        logger.warning(f'Board index is not saved to {sidecar}. {e}')
+    return offsets
+
+
+def load_offsets(path: Union[str, pathlib.Path],
+                 parser: Parser) -> np.ndarray:
+    """Loads the byte offsets of boards in a file.
+
+    The sidecar index is memory-mapped. It is rebuilt if it doesn't exist or
+    the size or the modification time of the file is changed.
+
+    :param path: Path of the file.
+    :param parser: Parser of the file format.
+    :return: Byte offsets of boards.
+    """
+    sidecar = index_path(path)
+    stat = os.stat(path)
+    try:
+        with open(sidecar, 'rb') as fp:
+            header = fp.read(_HEADER.size)
+    except OSError:
+        return build_offsets(path, parser)
+    if len(header) == _HEADER.size:
+        magic, size, mtime_ns, board_num = _HEADER.unpack(header)
+        if magic == _MAGIC and size == stat.st_size and \
+                mtime_ns == stat.st_mtime_ns and \
+                sidecar.stat().st_size == \
+                _HEADER.size + board_num * _OFFSET_DTYPE.itemsize:
+            if board_num == 0:
+                return np.zeros(0, dtype=_OFFSET_DTYPE)
+            return np.memmap(sidecar, dtype=_OFFSET_DTYPE, mode='r',
+                             offset=_HEADER.size, shape=(board_num,))
+    logger.info(f'Board index {sidecar} is outdated.')
+    return build_offsets(path, parser)
+
+
+class IndexedBoardSettings(Sequence[BoardSetting]):
+    """Board settings in a file, parsed on access.
+
+    :param path: Path of the file.
+    :param parser: Parser of the file format.
+    :param offsets: Byte offsets of the boards.
+    :param contiguous: Whether the boards are contiguous in the file.
+    :param encoding: Encoding of the file.
+    """
+
+    def __init__(self,
+                 path: Union[str, pathlib.Path],
+                 parser: Parser,
+                 offsets: np.ndarray,
+                 contiguous: bool = True,
+                 encoding: str = 'utf-8'):
+        self._path = pathlib.Path(path)
+        self._parser = parser
+        self._offsets = offsets
+        self._contiguous = contiguous
+        self._encoding = encoding
+
+    @classmethod
+    def open(cls,
+             path: Union[str, pathlib.Path],
+             parser: Parser,
+             encoding: str = 'utf-8') -> IndexedBoardSettings:
+        """Opens board settings in a file with the sidecar index.
+
+        :param path: Path of the file.
+        :param parser: Parser of the file format.
+        :param encoding: Encoding of the file.
+        :return: Board settings in the file.
+        """
+        return cls(path, parser, load_offsets(path, parser),
+                   encoding=encoding)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, index: int) -> BoardSetting:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> IndexedBoardSettings:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return IndexedBoardSettings(
+                self._path, self._parser, self._offsets[index],
+                self._contiguous and index.step in (None, 1), self._encoding)
+        with self._open_at(int(self._offsets[index])) as fp:
+            return next(self._parser.iter_board_settings_at(fp))
+
+    def __iter__(self) -> Iterator[BoardSetting]:
+        if not self._contiguous:
+            yield from (self[i] for i in range(len(self)))
+            return
+        if len(self) == 0:
+            return
+        # contiguous boards are parsed in a stream
+        with self._open_at(int(self._offsets[0])) as fp:
+            boards = self._parser.iter_board_settings_at(fp)
+            for _ in range(len(self)):
+                yield next(boards)
+
+    def _open_at(self, offset: int) -> IO[str]:
+        # The offsets are in bytes, so the file is sought in binary mode and
+        # decoded from there. Text streams only seek to cookies of tell.
+        fp = open(self._path, 'rb')
+        fp.seek(offset)
+        return io.TextIOWrapper(fp, encoding=self._encoding)
@@ -0,0 +1,210 @@
+"""Annotates board settings with double dummy analysis.
+
+Deals are solved by the double dummy solver in worker processes, and the
+board settings are yielded in the input order. At most max_pending boards are
+in flight, so memory use doesn't grow with the number of boards::
+
+    >>> with open('boards.pbn', 'r') as fp:
+    ...     board_settings = PbnParser().parse_board_settings(fp)
+    >>> with open('output.json', 'w') as fp, \\
+    ...         JsonBoardSettingWriter(fp) as writer:
+    ...     for board_setting in annotate_dda(board_settings, workers=8):
+    ...         writer.write_board_setting(board_setting)
+
+Run from the command line::
+
+    $ bridge-dda boards.pbn -o output.json -w 8
+
+Deals are solved by DDS, which needs the optional package endplay
+(``pip install '.[dds]'``). A deal takes 0.5 to 1.5 seconds of CPU time on
+average, so 10,000 boards take 1.5 to 4 CPU-hours. The pure Python solver takes
+minutes per deal (from 2 to 16 minutes measured), so 10,000 boards would take
+hundreds of CPU-hours. bridge-dda refuses to run without DDS unless
+--python_solver is given.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import pathlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from logging import getLogger
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, \
+    Sequence, Tuple
+
+from .abstract_classes import BoardSetting, Parser
+from .json_handler.parser import JsonParser
+from .json_handler.writer import JsonBoardSettingWriter
+from .pbn_handler.parser import PbnParser
+from .. import Hands, Player, Suit
+from ..bit_hands import cards_to_mask
+from ..dda_cache import DDACache, get_default_cache
+from ..double_dummy import DDS_AVAILABLE, calc_dda_masks, \
+    calc_dda_masks_python
+
+logger = getLogger(__file__)
+
+DDA = Dict[Player, Dict[Suit, int]]
+
+
+def _to_masks(hands: Hands) -> Tuple[int, int, int, int]:
+    return (cards_to_mask(hands.north), cards_to_mask(hands.east),
+            cards_to_mask(hands.south), cards_to_mask(hands.west))
+
+
+def annotate_dda(board_settings: Iterable[BoardSetting],
+                 workers: int = 1,
+                 max_pending: Optional[int] = None,
+                 overwrite: bool = False,
+                 solver: Callable[[Sequence[int]], DDA] = calc_dda_masks,
+                 cache: Optional[DDACache] = None
+                 ) -> Iterator[BoardSetting]:
+    """Fills dda of board settings.
+
+    Deals in the cache are not solved, and solved deals are stored to the
+    cache. The cache is used only in the current process.
+
+    :param board_settings: Board settings to annotate.
+    :param workers: The number of worker processes. If 1, deals are solved in
+        the current process.
+    :param max_pending: The maximum number of boards in flight. The default is
+        4 times workers.
+    :param overwrite: Whether boards which already have dda are solved again.
+    :param solver: Function which calculates dda from 52-bit masks of hands in
+        the order of N, E, S and W. It must be picklable if workers > 1. The
+        default uses DDS if it is installed, and otherwise the pure Python
+        solver, which takes minutes per deal (see bridge_env.double_dummy).
+    :param cache: Cache of DDA tables. If None, the default cache is used
+        (see bridge_env.dda_cache).
+    :return: Annotated board settings in the input order (yield).
+    """
+    if workers < 1:
+        raise ValueError('The number of workers must be positive.')
+    if cache is None:
+        cache = get_default_cache()
+    if workers == 1:
+        for board_setting in board_settings:
+            if board_setting.dda is None or overwrite:
+                masks = _to_masks(board_setting.hands)
+                dda = cache.get(masks) if cache is not None else None
+                if dda is None:
+                    dda = solver(masks)
+                    if cache is not None:
+                        cache.put(masks, dda)
+                board_setting = board_setting._replace(dda=dda)
+            yield board_setting
+        return
+
+    if max_pending is None:
+        max_pending = workers * 4
+    if max_pending < 1:
+        raise ValueError('max_pending must be positive.')
+    pending: Deque[Tuple[BoardSetting, Optional[Future]]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for board_setting in board_settings:
+            future = None
+            if board_setting.dda is None or overwrite:
+                masks = _to_masks(board_setting.hands)
+                dda = cache.get(masks) if cache is not None else None
+                if dda is None:
+                    future = executor.submit(solver, masks)
+                else:
+                    board_setting = board_setting._replace(dda=dda)
+            pending.append((board_setting, future))
+            if len(pending) >= max_pending:
+                yield _result(*pending.popleft(), cache)
+        while pending:
+            yield _result(*pending.popleft(), cache)
+
+
+def _result(board_setting: BoardSetting,
+            future: Optional[Future],
+            cache: Optional[DDACache]) -> BoardSetting:
+    if future is None:
+        return board_setting
+    dda = future.result()
+    if cache is not None:
+        cache.put(_to_masks(board_setting.hands), dda)
+    return board_setting._replace(dda=dda)
+
+
+def main() -> None:
+    """Script to annotate board settings with double dummy analysis.
+
+    :return: None.
+    """
+    FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+    logging.basicConfig(level=logging.INFO, format=FORMAT)
+    parser = argparse.ArgumentParser()
+    parser.add_argument('board_setting',
+                        type=str,
+                        help='Board settings file (.json or .pbn).')
+    parser.add_argument('-o', '--output_file',
+                        default='output.json',
+                        type=str,
+                        help='Output file path (.json file). '
+                             'File will be overwritten. '
+                             '(default="output.json")')
+    parser.add_argument('-w', '--workers',
+                        default=os.cpu_count() or 1,
+                        type=int,
+                        help='The number of worker processes. '
+                             '(default=the number of CPUs)')
+    parser.add_argument('--overwrite',
+                        action='store_true',
+                        help='Solve boards which already have dda.')
+    parser.add_argument('--cache',
+                        default=None,
+                        type=str,
+                        help='DDA cache file (sqlite3). '
+                             '(default=$BRIDGE_ENV_DDA_CACHE)')
+    parser.add_argument('--cache_size',
+                        default=None,
+                        type=int,
+                        help='The maximum number of deals in the cache. '
+                             '(default=unlimited)')
+    parser.add_argument('--python_solver',
+                        action='store_true',
+                        help='Solve deals by the pure Python solver instead '
+                             'of DDS. It takes minutes per deal.')
+    args = parser.parse_args()
+    if not DDS_AVAILABLE and not args.python_solver:
+        parser.error("DDS is not installed. Install endplay "
+                     "(pip install '.[dds]'), or give --python_solver to "
+                     "use the pure Python solver, which takes minutes per "
+                     "deal.")
+    solver = calc_dda_masks_python if args.python_solver else calc_dda_masks
+
+    path = pathlib.Path(args.board_setting)
+    board_setting_parser: Parser
+    if path.suffix == '.pbn':
+        board_setting_parser = PbnParser()
+    elif path.suffix == '.json':
+        board_setting_parser = JsonParser()
+    else:
+        raise Exception('File type error. '
+                        'Board setting file is neither PBN or JSON.')
+    output_path = pathlib.Path(args.output_file)
+    if output_path.suffix != '.json':
+        raise Exception('File type error. Output file is not JSON.')
+
+    cache = DDACache(args.cache, max_size=args.cache_size) \
+        if args.cache is not None else get_default_cache()
+    # board settings are read one by one while boards are solved
+    logger.info(f'Board settings are imported from {path}.')
+    with open(path, 'r') as input_fp, open(output_path, 'w') as fp, \
+            JsonBoardSettingWriter(fp) as writer:
+        for i, board_setting in enumerate(annotate_dda(
+                board_setting_parser.iter_board_settings(input_fp),
+                workers=args.workers, overwrite=args.overwrite,
+                solver=solver, cache=cache)):
+            writer.write_board_setting(board_setting)
+            logger.info(f'Board {board_setting.board_id} is annotated. '
+                        f'({i + 1} boards)')
+    if cache is not None:
+        logger.info(f'DDA cache: hits = {cache.hits}, '
+                    f'misses = {cache.misses}.')
+        if args.cache is not None:
+            cache.close()
@@ -1,13 +1,36 @@
+import io
 import json
-from typing import Dict, IO, List, Optional
+import mmap
+import re
+from typing import Dict, IO, Iterator, List, Optional, Tuple
 
 from ..abstract_classes import BoardLog, BoardSetting, Parser
 from ... import Bid, Card, Contract, Hands, Pair, Player, Suit, TrickHistory, \
     Vul
 
 
+# Size of chunks read from a stream.
+_CHUNK_SIZE = 1 << 16
+
+# Start of a document which has a list of boards as the first member.
+_HEADER = re.compile(r'\s*\{\s*"(\w+)"\s*:\s*\[')
+
+_WHITESPACES = ' \t\n\r'
+
+# Patterns to find the offsets of boards in bytes
+_HEADER_BYTES = re.compile(rb'\s*\{\s*"(\w+)"\s*:\s*\[')
+_SEPARATORS = re.compile(rb'[\s,]*')
+_TOKEN = re.compile(rb'[{}\[\]"]')
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(rb'[^\s,\]}]*')
+
+
 class JsonParser(Parser):
-    # TODO: Consider stream handling.
+    """JSON format parser.
+
+    parse_board_settings and parse_board_logs load the whole file, while
+    iter_board_settings and iter_board_logs decode one board at a time.
+    """
 
     def parse_all(self, fp: IO[str]) -> List[dict]:
         return json.load(fp)
@@ -30,6 +53,206 @@ class JsonParser(Parser):
 
         return outputs
 
+    def iter_board_settings(self, fp: IO[str]) -> Iterator[BoardSetting]:
+        """Parses board settings one by one.
+
+        Boards in "logs" are also parsed as board settings.
+
+        :param fp: Input stream of board settings' file.
+        :return: Board settings (yield).
+        """
+        for d in _iter_boards(fp, ('logs', 'board_settings')):
+            yield convert_board_setting(d)
+
+    def iter_board_logs(self, fp: IO[str]) -> Iterator[BoardLog]:
+        """Parses board logs one by one.
+
+        :param fp: Input stream of logs' file.
+        :return: Board logs (yield).
+        """
+        for d in _iter_boards(fp, ('logs',)):
+            yield convert_board_log(d)
+
+    def board_offsets(self, fp: IO[bytes]) -> List[int]:
+        """Finds the byte offsets of boards.
+
+        The document must start with the list of boards, such as files
+        written by JsonWriter.
+
+        :param fp: Input stream of a JSON document in binary mode.
+        :return: Byte offsets of boards from the start of the file.
+        """
+        try:
+            # the file is scanned without loading it
+            data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (io.UnsupportedOperation, OSError, ValueError):
+            data = fp.read()
+        try:
+            return _list_offsets(data)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    def iter_board_settings_at(self, fp: IO[str]) -> Iterator[BoardSetting]:
+        for d in _iter_list(fp, '', 0):
+            yield convert_board_setting(d)
+
+    def iter_board_logs_at(self, fp: IO[str]) -> Iterator[BoardLog]:
+        for d in _iter_list(fp, '', 0):
+            yield convert_board_log(d)
+
+
+def _iter_boards(fp: IO[str], tags: Tuple[str, ...]) -> Iterator[dict]:
+    """Decodes dicts of boards in a JSON document one by one.
+
+    A document which starts with a list of boards, such as files written by
+    JsonWriter, is decoded incrementally, so only a board is kept in memory.
+    Other documents are loaded at once.
+
+    :param fp: Input stream of a JSON document.
+    :param tags: Keys of the list of boards in the priority order.
+    :return: Dicts of boards (yield).
+    """
+    # the header is in the first chunk
+    buffer = fp.read(max(_CHUNK_SIZE, 256))
+    match = _HEADER.match(buffer)
+    if match is None or match.group(1) not in tags:
+        # fallback to load the whole document
+        data = json.loads(buffer + fp.read())
+        tag = next((t for t in tags if t in data), tags[-1])
+        yield from data[tag]
+        return
+
+    yield from _iter_list(fp, buffer, match.end())
+
+
+def _iter_list(fp: IO[str], buffer: str, pos: int) -> Iterator[dict]:
+    # decodes elements of a list from buffer[pos:] and the rest of fp
+    decoder = json.JSONDecoder()
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACES:
+            pos += 1
+        if pos == len(buffer):
+            chunk = fp.read(_CHUNK_SIZE)
+            if not chunk:
+                raise ValueError('JSON document ends in the list of boards.')
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+        if buffer[pos] == ']':
+            return
+        if buffer[pos] == ',':
+            pos += 1
+            continue
+        try:
+            board, pos = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # the board continues in the next chunk. The chunk is as large as
+            # the read part of the board, so a board larger than a chunk is
+            # decoded O(log n) times instead of O(n) times.
+            chunk = fp.read(max(_CHUNK_SIZE, len(buffer) - pos))
+            if not chunk:
+                raise
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+        yield board
+
+
+def _list_offsets(data) -> List[int]:
+    match = _HEADER_BYTES.match(data)
+    if match is None or match.group(1) not in (b'logs', b'board_settings'):
+        raise ValueError('JSON document does not start with the list of '
+                         'boards.')
+    offsets = list()
+    pos = match.end()
+    while True:
+        pos = _SEPARATORS.match(data, pos).end()
+        if pos == len(data):
+            raise ValueError('JSON document ends in the list of boards.')
+        if data[pos:pos + 1] == b']':
+            return offsets
+        offsets.append(pos)
+        pos = _skip_value(data, pos)
+
+
+def _skip_value(data: bytes, pos: int) -> int:
+    # position after the JSON value starting at data[pos]
+    if data[pos:pos + 1] == b'"':
+        string = _STRING.match(data, pos)
+        if string is None:
+            raise ValueError('JSON document ends in a string.')
+        return string.end()
+    if data[pos:pos + 1] not in (b'{', b'['):
+        return _SCALAR.match(data, pos).end()
+    depth = 0
+    while True:
+        token = _TOKEN.search(data, pos)
+        if token is None:
+            raise ValueError('JSON document ends in the list of boards.')
+        if token.group() == b'"':
+            pos = _skip_value(data, token.start())
+            continue
+        pos = token.end()
+        depth += 1 if token.group() in (b'{', b'[') else -1
+        if depth == 0:
+            return pos
+
+
+class JsonLinesParser(Parser):
+    """JSON Lines format parser.
+
+    Each line is a board setting or a board log. An incomplete last line,
+    which is left when the writer crashes, is ignored.
+    """
+
+    def parse_all(self, fp: IO[str]) -> List[dict]:
+        return list(_iter_lines(fp))
+
+    def parse_board_settings(self, fp: IO[str]) -> List[BoardSetting]:
+        return list(self.iter_board_settings(fp))
+
+    def parse_board_logs(self, fp: IO[str]) -> List[BoardLog]:
+        return list(self.iter_board_logs(fp))
+
+    def iter_board_settings(self, fp: IO[str]) -> Iterator[BoardSetting]:
+        for d in _iter_lines(fp):
+            yield convert_board_setting(d)
+
+    def iter_board_logs(self, fp: IO[str]) -> Iterator[BoardLog]:
+        for d in _iter_lines(fp):
+            yield convert_board_log(d)
+
+    def board_offsets(self, fp: IO[bytes]) -> List[int]:
+        offsets = list()
+        position = 0
+        for line in fp:
+            if line.strip() and (line.endswith(b'\n') or _is_json(line)):
+                offsets.append(position)
+            position += len(line)
+        return offsets
+
+
+def _iter_lines(fp: IO[str]) -> Iterator[dict]:
+    for line in fp:
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            if line.endswith('\n'):
+                raise
+            return
+        yield data
+
+
+def _is_json(line: bytes) -> bool:
+    try:
+        json.loads(line)
+    except json.JSONDecodeError:
+        return False
+    return True
+
 
 def hands_parser(hands: Dict[str, List[str]]) -> Hands:
     """Parses deal in json.
@@ -1,7 +1,9 @@
 import json
-from typing import Dict, IO, List, Optional
+import os
+import pathlib
+from typing import Dict, IO, List, Optional, Union
 
-from ..abstract_classes import Writer
+from ..abstract_classes import BoardSetting, Writer
 from ..pbn_handler.writer import Scoring
 from ... import Bid, Contract, Hands, Pair, Player, Suit, Vul
 from ...playing_phase import PlayingHistory
@@ -79,7 +81,19 @@ class JsonBoardSettingWriter(JsonWriter):
         if dda is not None:
             setting['dda'] = {str(p): {str(s): v for s, v in r.items()} for p, r
                               in dda.items()}
-        super()._write_content(setting)
+        self._write_content(setting)
+
+    def write_board_setting(self, board_setting: BoardSetting) -> None:
+        """Writes a BoardSetting object to a file.
+
+        :param board_setting: Board setting to be written.
+        :return: None.
+        """
+        self.write(board_id=board_setting.board_id,
+                   dealer=board_setting.dealer,
+                   deal=board_setting.hands,
+                   vul=board_setting.vul,
+                   dda=board_setting.dda)
 
 
 class JsonLogWriter(JsonWriter):
@@ -151,7 +165,100 @@ class JsonLogWriter(JsonWriter):
             result['dda'] = {str(p): {str(s): v for s, v in r.items()} for p, r
                              in dda.items()}
 
-        super()._write_content(result)
+        self._write_content(result)
+
+
+class JsonLinesWriter(JsonWriter):
+    """Base writer in JSON Lines format, where a line is a board.
+
+    Unlike JsonWriter, the file is valid after each line is written, so lines
+    can be appended to an existing file. Written lines are flushed in batches
+    of flush_interval lines, and os.fsync is called after each flush if fsync
+    is True.
+
+    :param writer: Output stream. Open it in 'a' mode to append boards.
+    :param flush_interval: The number of lines written between flushes.
+    :param fsync: Whether the file is synchronized to the disk after flushes.
+    """
+
+    def __init__(self,
+                 writer: IO[str],
+                 flush_interval: int = 1,
+                 fsync: bool = False):
+        super().__init__(writer=writer)
+        if flush_interval < 1:
+            raise ValueError('flush_interval must be positive.')
+        self._flush_interval = flush_interval
+        self._fsync = fsync
+        self._unflushed = 0
+
+    def open(self):
+        self._open = True
+
+    def close(self):
+        self.flush()
+        self._open = False
+
+    def flush(self) -> None:
+        """Flushes written lines.
+
+        :return: None.
+        """
+        self._writer.flush()
+        if self._fsync:
+            os.fsync(self._writer.fileno())
+        self._unflushed = 0
+
+    def _write_content(self, d: dict) -> None:
+        self._writer.write(json.dumps(d, indent=None) + '\n')
+        self._unflushed += 1
+        if self._unflushed >= self._flush_interval:
+            self.flush()
+
+
+class JsonLinesBoardSettingWriter(JsonLinesWriter, JsonBoardSettingWriter):
+    """Writer for board settings in JSON Lines format."""
+
+
+class JsonLinesLogWriter(JsonLinesWriter, JsonLogWriter):
+    """Writer for logs in JSON Lines format."""
+
+
+def recover_json_lines(path: Union[str, pathlib.Path]) -> Optional[dict]:
+    """Recovers a JSON Lines file to resume writing.
+
+    An incomplete last line, which is left when the writer crashes, is
+    removed. Only the tail of the file is read.
+
+    :param path: Path of a JSON Lines file.
+    :return: The last complete board. None if the file has no board.
+    """
+    with open(path, 'r+b') as fp:
+        end = fp.seek(0, os.SEEK_END)
+        tail = b''
+        start = end
+        # reads blocks until the tail has a complete line
+        while start > 0 and tail.count(b'\n') < 2:
+            block = min(start, 1 << 16)
+            start -= block
+            fp.seek(start)
+            tail = fp.read(block) + tail
+        lines = tail.split(b'\n')
+        if lines[-1]:
+            # the last line is not terminated
+            try:
+                last = json.loads(lines[-1])
+            except ValueError:
+                fp.truncate(end - len(lines[-1]))
+            else:
+                fp.seek(0, os.SEEK_END)
+                fp.write(b'\n')
+                return last
+        # the first line may be a part of a line
+        for line in reversed(lines[1 if start > 0 else 0:-1]):
+            if line.strip():
+                return json.loads(line)
+        return None
 
 
 def convert_deal(deal: Hands) -> Dict[str, List[str]]:
@@ -10,22 +10,48 @@ Parse PBN file::
     >>> with open(file_path, 'r') as fp:
     ...     print(parser.parse_all(fp))
 
+Parse a large PBN file in worker processes::
+
+    >>> for board_setting in parser.iter_board_settings_parallel(
+    ...         file_path, workers=8):
+    ...     print(board_setting.board_id)
 
 """
+import io
+import itertools
+import os
+import pathlib
 import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from logging import getLogger
-from typing import Dict, IO, Iterator, List
+from typing import Callable, Deque, Dict, IO, Iterable, Iterator, List, \
+    Optional, Tuple, TypeVar, Union
 
 from ..abstract_classes import BoardLog, BoardSetting, Parser
-from ... import Hands, Player, Vul
+from ... import Bid, Card, Contract, Hands, Pair, Player, Suit, \
+    TrickHistory, Vul
+from ...playing_phase import PlayingPhase
 
 logger = getLogger(__file__)
 
+T = TypeVar('T')
+
+# Default size of chunks parsed in parallel.
+_PARALLEL_CHUNK_SIZE = 1 << 22
+
 
 class PbnParser(Parser):
     """PBN (Portable Bridge Notation) format parser."""
 
-    def __init__(self):
+    def __init__(self, fast_export: bool = True):
+        """
+
+        :param fast_export: Whether board settings of files in the export
+            format are parsed by the line-oriented parser for the format.
+        """
+        self.fast_export = fast_export
+
         # for multiple-line comment
         self._in_comment = False
 
@@ -86,9 +112,11 @@ class PbnParser(Parser):
 
     TAG_PATTERN = r'\[[ ]?([A-Z][a-zA-Z]+) "([^"]*)"[ ]?\]'
     REPLACE_PATTERN = r'[ \t\r\n]+'
+    # a tag pair or a token of a section
+    GAME_PATTERN = re.compile(
+        r'\[\s*([A-Z][a-zA-Z]+)\s+"([^"]*)"\s*\]|([^\s\[]+)|\[')
 
-    # TODO: This method only parses tag pairs.
-    #  Add a function to parse optional annotations such as auction and play.
+    # This method only parses tag pairs. See parse_game for sections.
     def parse_board(self) -> Dict[str, str]:
         """Parse tag pairs of a board.
 
@@ -107,24 +135,62 @@ class PbnParser(Parser):
 
         return game_mem
 
+    def parse_game(self) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """Parse tag pairs and sections of a board.
+
+        The buffer is scanned once. Tokens of a section, such as calls of the
+        auction and cards of the play, follow the tag pair of the section.
+
+        :return: Dict converted from tag pairs and dict of tokens of
+            sections.
+        """
+        tag_pairs: Dict[str, str] = dict()
+        sections: Dict[str, List[str]] = dict()
+        tokens: Optional[List[str]] = None
+        for match in self.GAME_PATTERN.finditer(
+                ''.join(self.tag_pair_buffer)):
+            tag = match.group(1)
+            if tag is not None:
+                # In import format, a tag pair that already occurred, is
+                # ignored.
+                if tag in tag_pairs:
+                    tokens = None
+                    continue
+                tag_pairs[tag] = match.group(2)
+                tokens = sections[tag] = list()
+            elif tokens is not None and match.group(3) is not None:
+                tokens.append(match.group(3))
+        return tag_pairs, {tag: tokens for tag, tokens in sections.items()
+                           if tokens}
+
+    def _reset(self) -> None:
+        self._in_comment = False
+        self.tag_pair_buffer = list()
+        self.comment_list = list()
+        self.comment_buffer = list()
+
+    def _is_game_end(self, line: str) -> bool:
+        return not self._in_comment and \
+            re.fullmatch(self.REPLACE_PATTERN, line) is not None
+
     def parse_stream(self, fp: IO[str]) -> Iterator[Dict[str, str]]:
         """Parses a PBN style stream in stream.
 
         :param fp: Input stream in a PBN style.
         :return: Dict of a board content (yield).
         """
+        yield from self._iter_games(fp, self.parse_board)
+
+    def _iter_games(self, fp: IO[str], parse: Callable[[], T]) -> Iterator[T]:
+        # parse is called on the buffer of each game
+        self._reset()
         # line is maximally 255 characters in protocol PBN ver2.1
         for line in fp:
             # Check a semi-empty line, which is the first line of a new
             # game except the first game of the PBN file.
-            match = re.fullmatch(self.REPLACE_PATTERN, line)
-            if match and not self._in_comment:
-                yield self.parse_board()
-
-                # initialization
-                self.tag_pair_buffer = list()
-                self.comment_list = list()
-                self.comment_buffer = list()
+            if self._is_game_end(line):
+                yield parse()
+                self._reset()
                 continue
 
             # escape character '%'
@@ -146,7 +212,7 @@ class PbnParser(Parser):
             self.extract_content(line)
 
         if len(self.tag_pair_buffer) != 0:
-            yield self.parse_board()
+            yield parse()
 
     # TODO: Consider type not IO[str] but IO[AnyStr]
     def parse_all(self, fp: IO[str]) -> List[Dict[str, str]]:
@@ -162,20 +228,476 @@ class PbnParser(Parser):
 
     # TODO: Add unit test
     def parse_board_settings(self, fp: IO[str]) -> List[BoardSetting]:
-        outputs: List[BoardSetting] = list()
-        for x in self.parse_stream(fp):
-            deal = Hands.convert_pbn(x['Deal'])
-            dealer = Player[x['Dealer']]
-            vul = Vul.str_to_vul(x['Vulnerable'])
-            board_id = x['Board']  # TODO: Consider other id conversion
-            outputs.append(BoardSetting(hands=deal,
-                                        dealer=dealer,
-                                        vul=vul,
-                                        board_id=board_id,
-                                        dda=None))
+        return list(self.iter_board_settings(fp))
 
-        return outputs
+    def iter_board_settings(self, fp: IO[str]) -> Iterator[BoardSetting]:
+        """Parses board settings one by one.
+
+        Files which declare the export format ("% EXPORT") in the header are
+        parsed line by line, where each tag pair is in a line.
+
+        :param fp: Input stream in a PBN style.
+        :return: Board settings (yield).
+        """
+        header: List[str] = list()
+        if self.fast_export:
+            for line in fp:
+                header.append(line)
+                if line[0] != '%':
+                    break
+        if any(line.startswith('% EXPORT') for line in header):
+            logger.debug('File is parsed as the export format.')
+            yield from _iter_export_board_settings(
+                itertools.chain(header, fp))
+            return
+        for x in self.parse_stream(itertools.chain(header, fp)):
+            yield _to_board_setting(x)
+
+    def board_offsets(self, fp: IO[bytes]) -> List[int]:
+        """Finds the byte offsets of games.
+
+        Games are split at semi-empty lines out of comments in the same way
+        as parse_stream, so the i-th offset is the start of the i-th game
+        yielded by parse_stream.
+
+        :param fp: Input stream in a PBN style in binary mode.
+        :return: Byte offsets of games from the start of the file.
+        """
+        return [0] + list(self._iter_game_ends(fp))[:-1]
+
+    def _iter_game_ends(self, fp: IO[bytes]) -> Iterator[int]:
+        """Finds the byte offsets of the ends of games.
+
+        Only lines with braces can open or close a comment, so other lines
+        are not parsed.
+
+        :param fp: Input stream in a PBN style in binary mode.
+        :return: Byte offset after the last line of each game (yield).
+        """
+        self._reset()
+        position = 0
+        has_content = False
+        for raw_line in fp:
+            position += len(raw_line)
+            if not self._in_comment and not raw_line.strip(b' \t\r\n'):
+                yield position
+                has_content = False
+                continue
+            if raw_line[:1] == b'%' and not self._in_comment:
+                continue
+            if b'{' in raw_line or b'}' in raw_line:
+                self.extract_content(
+                    raw_line.decode('utf-8', errors='replace'))
+                has_content = has_content or len(self.tag_pair_buffer) > 0
+                in_comment = self._in_comment
+                self._reset()
+                self._in_comment = in_comment
+            elif not self._in_comment:
+                has_content = True
+        self._reset()
+        if has_content:
+            yield position
+
+    def parse_file_parallel(self,
+                            path: Union[str, pathlib.Path],
+                            workers: Optional[int] = None,
+                            chunk_size: int = _PARALLEL_CHUNK_SIZE,
+                            encoding: str = 'utf-8'
+                            ) -> Iterator[Dict[str, str]]:
+        """Parses a PBN file in worker processes.
+
+        The file is split into chunks of about chunk_size bytes at the ends
+        of games, and the chunks are parsed in parallel.
+
+        :param path: Path of the PBN file.
+        :param workers: The number of worker processes. The default is the
+            number of CPUs. If 1, chunks are parsed in the current process.
+        :param chunk_size: Size of chunks in bytes.
+        :param encoding: Encoding of the file.
+        :return: Dict of a board content in the file order (yield).
+        """
+        yield from self._iter_parallel(path, workers, chunk_size, encoding,
+                                       False)
+
+    def iter_board_settings_parallel(self,
+                                     path: Union[str, pathlib.Path],
+                                     workers: Optional[int] = None,
+                                     chunk_size: int = _PARALLEL_CHUNK_SIZE,
+                                     encoding: str = 'utf-8'
+                                     ) -> Iterator[BoardSetting]:
+        """Parses board settings of a PBN file in worker processes.
+
+        See parse_file_parallel.
+
+        :param path: Path of the PBN file.
+        :param workers: The number of worker processes. The default is the
+            number of CPUs. If 1, chunks are parsed in the current process.
+        :param chunk_size: Size of chunks in bytes.
+        :param encoding: Encoding of the file.
+        :return: Board settings in the file order (yield).
+        """
+        yield from self._iter_parallel(path, workers, chunk_size, encoding,
+                                       True)
+
+    def _iter_parallel(self,
+                       path: Union[str, pathlib.Path],
+                       workers: Optional[int],
+                       chunk_size: int,
+                       encoding: str,
+                       to_board_settings: bool) -> Iterator:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError('The number of workers must be positive.')
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be positive.')
+        with open(path, 'rb') as fp:
+            export = self.fast_export and to_board_settings and \
+                _is_export(fp)
+            fp.seek(0)
+            chunks = _iter_chunks(self._iter_game_ends(fp), chunk_size)
+            if workers == 1:
+                for start, end in chunks:
+                    yield from _parse_chunk(path, start, end, encoding,
+                                            to_board_settings, export)
+                return
+
+            # at most 2 chunks per worker are in flight
+            pending: Deque[Future] = deque()
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for start, end in chunks:
+                    pending.append(executor.submit(
+                        _parse_chunk, path, start, end, encoding,
+                        to_board_settings, export))
+                    if len(pending) >= workers * 2:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
 
     def parse_board_logs(self, fp: IO[str]) -> List[BoardLog]:
-        raise NotImplementedError(
-            'parse_board_log in PbnParser is not implemented')
+        return list(self.iter_board_logs(fp))
+
+    def iter_board_logs(self, fp: IO[str]) -> Iterator[BoardLog]:
+        """Parses board logs one by one.
+
+        Auction and Play sections are parsed into bid_history and
+        play_history, and OptimumResultTable into dda.
+
+        :param fp: Input stream in a PBN style.
+        :return: Board logs (yield).
+        """
+        for tag_pairs, sections in self._iter_games(fp, self.parse_game):
+            yield _to_board_log(tag_pairs, sections)
+
+
+def _to_board_setting(x: Dict[str, str]) -> BoardSetting:
+    deal = Hands.convert_pbn(x['Deal'])
+    dealer = Player[x['Dealer']]
+    vul = Vul.str_to_vul(x['Vulnerable'])
+    board_id = x['Board']  # TODO: Consider other id conversion
+    return BoardSetting(hands=deal,
+                        dealer=dealer,
+                        vul=vul,
+                        board_id=board_id,
+                        dda=None)
+
+
+def _iter_chunks(game_ends: Iterator[int],
+                 chunk_size: int) -> Iterator[Tuple[int, int]]:
+    # groups games into byte ranges of at least chunk_size bytes
+    start = end = 0
+    for end in game_ends:
+        if end - start >= chunk_size:
+            yield start, end
+            start = end
+    if end > start:
+        yield start, end
+
+
+def _parse_chunk(path: Union[str, pathlib.Path],
+                 start: int,
+                 end: int,
+                 encoding: str,
+                 to_board_settings: bool,
+                 export: bool = False) -> List:
+    with open(path, 'rb') as fp:
+        fp.seek(start)
+        data = fp.read(end - start)
+    # newlines are translated in the same way as open(path, 'r')
+    text = io.TextIOWrapper(io.BytesIO(data), encoding=encoding)
+    if export:
+        return list(_iter_export_board_settings(text))
+    boards = PbnParser().parse_stream(text)
+    if to_board_settings:
+        return [_to_board_setting(x) for x in boards]
+    return list(boards)
+
+
+def _is_export(fp: IO[bytes]) -> bool:
+    # whether the header declares the export format
+    for line in fp:
+        if line[:1] != b'%':
+            return False
+        if line.startswith(b'% EXPORT'):
+            return True
+    return False
+
+
+def _opens_comment(line: str) -> bool:
+    # whether a { } comment is left open at the end of the line out of a
+    # comment. Comments are found by PbnParser.extract_content, so that both
+    # parsers agree on which '{' opens a comment.
+    if '{ ' not in line:
+        return False
+    parser = PbnParser()
+    parser.extract_content(line)
+    return parser._in_comment
+
+
+def _iter_export_board_settings(lines: Iterable[str]
+                                ) -> Iterator[BoardSetting]:
+    """Parses board settings of the export format.
+
+    In the export format, a tag pair is in a line and starts at the first
+    column. Lines of sections, such as the auction and the play, and comments
+    are skipped. As in the import format, a tag pair that already occurred in
+    the game is ignored.
+
+    :param lines: Lines of a PBN file in the export format.
+    :return: Board settings (yield).
+    """
+    board_id: Optional[str] = None
+    dealer: Optional[str] = None
+    vul: Optional[str] = None
+    deal: Optional[str] = None
+    in_comment = False
+    for line in lines:
+        if in_comment:
+            closing = line.find('}')
+            if closing >= 0:
+                in_comment = _opens_comment(line[closing + 1:])
+            continue
+        if line[0] == '[':
+            # [Tag "value"]
+            separator = line.find(' "')
+            end = line.find('"]', separator + 2)
+            if separator < 0 or end < 0:
+                raise ValueError(f'Tag pair "{line.rstrip()}" is not in the '
+                                 f'export format.')
+            tag = line[1:separator]
+            if tag == 'Board':
+                board_id = line[separator + 2:end] if board_id is None \
+                    else board_id
+            elif tag == 'Dealer':
+                dealer = line[separator + 2:end] if dealer is None \
+                    else dealer
+            elif tag == 'Vulnerable':
+                vul = line[separator + 2:end] if vul is None else vul
+            elif tag == 'Deal':
+                deal = line[separator + 2:end] if deal is None else deal
+            in_comment = _opens_comment(line)
+        elif line.isspace():
+            if board_id is not None or dealer is not None or \
+                    vul is not None or deal is not None:
+                yield _export_board_setting(board_id, dealer, vul, deal)
+                board_id = dealer = vul = deal = None
+        elif line[0] != '%':
+            in_comment = _opens_comment(line)
+    if board_id is not None or dealer is not None or vul is not None or \
+            deal is not None:
+        yield _export_board_setting(board_id, dealer, vul, deal)
+
+
+def _export_board_setting(board_id: Optional[str],
+                          dealer: Optional[str],
+                          vul: Optional[str],
+                          deal: Optional[str]) -> BoardSetting:
+    if board_id is None or dealer is None or vul is None or deal is None:
+        raise ValueError('Board, Dealer, Vulnerable and Deal are required in '
+                         'the export format.')
+    return BoardSetting(hands=Hands.convert_pbn(deal),
+                        dealer=Player[dealer],
+                        vul=Vul.str_to_vul(vul),
+                        board_id=board_id,
+                        dda=None)
+
+
+# Calls in Auction sections. 'AP' is 3 passes.
+_CALLS: Dict[str, List[Bid]] = {
+    **{str(bid): [bid] for bid in Bid},
+    **{str(bid)[:2]: [bid] for bid in Bid if str(bid).endswith('NT')},
+    'AP': [Bid.Pass] * 3,
+}
+# Suffix annotations of calls and cards
+_SUFFIXES = '!?'
+_STRAINS = {'C': Suit.C, 'D': Suit.D, 'H': Suit.H, 'S': Suit.S,
+            'NT': Suit.NT, 'N': Suit.NT}
+
+
+def _parse_auction(tokens: List[str]) -> List[Bid]:
+    """Parses tokens of Auction section.
+
+    Notes ('=1='), NAGs ('$1') and other marks are skipped.
+
+    :param tokens: Tokens of the section.
+    :return: Calls in the order of the auction.
+    """
+    bids: List[Bid] = list()
+    for token in tokens:
+        calls = _CALLS.get(token.rstrip(_SUFFIXES))
+        if calls is not None:
+            bids.extend(calls)
+    return bids
+
+
+def _parse_play(leader: Player,
+                trump: Suit,
+                tokens: List[str]) -> List[TrickHistory]:
+    """Parses tokens of Play section.
+
+    A row of the section has a trick, whose cards are in the columns of the
+    players from the opening leader. '-' is a card not played, and '*' ends
+    the play. The leader of each trick is the winner of the previous trick.
+
+    :param leader: The opening leader (the value of Play tag).
+    :param trump: Trump of the contract.
+    :param tokens: Tokens of the section.
+    :return: Tricks played.
+    """
+    columns: List[Optional[Card]] = list()
+    for token in tokens:
+        if token == '*':
+            break
+        token = token.rstrip(_SUFFIXES)
+        if token == '-':
+            columns.append(None)
+        elif len(token) == 2 and token[0] in 'SHDC':
+            columns.append(Card.str_to_card(token))
+    opening_leader = leader
+    tricks: List[TrickHistory] = list()
+    for i in range(0, len(columns), 4):
+        # cards in the order of play from the leader
+        start = (leader.value - opening_leader.value) % 4
+        row = columns[i:i + 4]
+        cards = list()
+        for j in range(4):
+            card = row[(start + j) % 4] if (start + j) % 4 < len(row) \
+                else None
+            if card is None:
+                break
+            cards.append(card)
+        if cards:
+            tricks.append(TrickHistory(leader=leader, cards=tuple(cards)))
+        if len(cards) < 4:
+            break
+        highest = PlayingPhase.calc_highest(trump, cards)
+        if highest < 0:
+            highest = PlayingPhase.calc_highest(cards[0].suit, cards)
+        for _ in range(highest):
+            leader = leader.next_player
+    return tricks
+
+
+def _parse_optimum_result_table(header: str, tokens: List[str]
+                                ) -> Optional[Dict[Player, Dict[Suit, int]]]:
+    """Parses OptimumResultTable section into a DDA table.
+
+    Only the columns "Declarer;Denomination;Result" are supported.
+
+    :param header: The value of OptimumResultTable tag.
+    :param tokens: Tokens of the section.
+    :return: DDA table. None if the table is not complete.
+    """
+    columns = [c.split('\\')[0] for c in header.split(';')]
+    if columns != ['Declarer', 'Denomination', 'Result']:
+        return None
+    dda: Dict[Player, Dict[Suit, int]] = {p: dict() for p in Player}
+    for i in range(0, len(tokens) - 2, 3):
+        player, strain, result = tokens[i:i + 3]
+        if player not in ('N', 'E', 'S', 'W') or strain not in _STRAINS or \
+                not result.isdigit():
+            return None
+        dda[Player[player]][_STRAINS[strain]] = int(result)
+    if any(len(d) != 5 for d in dda.values()):
+        return None
+    return dda
+
+
+def _side_value(tag: str, value: str) -> Tuple[Optional[Pair], int]:
+    # "NS 11", "EW -100" or "11" in the tag
+    side, _, number = value.rpartition(' ')
+    try:
+        return (Pair[side] if side in ('NS', 'EW') else None), int(number)
+    except ValueError:
+        raise ValueError(f'{tag} tag "{value}" is not a number of tricks or '
+                         f'points.') from None
+
+
+def _to_board_log(tag_pairs: Dict[str, str],
+                  sections: Dict[str, List[str]]) -> BoardLog:
+    board_setting = _to_board_setting(tag_pairs)
+    vul = board_setting.vul
+
+    declarer_str = tag_pairs.get('Declarer', '').lstrip('^')
+    declarer = Player[declarer_str] if declarer_str in ('N', 'E', 'S', 'W') \
+        else None
+    contract_str = tag_pairs.get('Contract', '')
+    if contract_str in ('', 'Pass') or declarer is None:
+        contract = Contract(final_bid=None, vul=vul)
+        declarer = None
+        taken_trick = None
+    else:
+        contract = Contract.str_to_contract(contract_str, vul=vul,
+                                            declarer=declarer)
+        result = tag_pairs.get('Result')
+        if result is None:
+            # the game is not played out
+            taken_trick = None
+        else:
+            side, taken_trick = _side_value('Result', result)
+            if side is not None and side is not declarer.pair:
+                taken_trick = 13 - taken_trick
+
+    players: Optional[Dict[Player, str]] = None
+    if all(name in tag_pairs for name in ('North', 'East', 'South', 'West')):
+        players = {Player.N: tag_pairs['North'],
+                   Player.E: tag_pairs['East'],
+                   Player.S: tag_pairs['South'],
+                   Player.W: tag_pairs['West']}
+    bid_history: Optional[List[Bid]] = None
+    if 'Auction' in tag_pairs:
+        bid_history = _parse_auction(sections.get('Auction', []))
+    play_history: Optional[List[TrickHistory]] = None
+    if 'Play' in tag_pairs and contract.trump is not None and \
+            tag_pairs['Play'] in ('N', 'E', 'S', 'W'):
+        play_history = _parse_play(Player[tag_pairs['Play']],
+                                   contract.trump,
+                                   sections.get('Play', []))
+    dda: Optional[Dict[Player, Dict[Suit, int]]] = None
+    if 'OptimumResultTable' in tag_pairs:
+        dda = _parse_optimum_result_table(
+            tag_pairs['OptimumResultTable'],
+            sections.get('OptimumResultTable', []))
+    scores: Optional[Dict[Pair, int]] = None
+    if 'Score' in tag_pairs:
+        side, score = _side_value('Score', tag_pairs['Score'])
+        # a score without the side is the score of the declarer
+        if side is None and declarer is not None:
+            side = declarer.pair
+        if side is Pair.EW:
+            score = -score
+        scores = {Pair.NS: score, Pair.EW: -score}
+
+    return BoardLog(board_id=board_setting.board_id,
+                    hands=board_setting.hands,
+                    dealer=board_setting.dealer,
+                    vul=vul,
+                    declarer=declarer,
+                    contract=contract,
+                    taken_trick=taken_trick,
+                    players=players,
+                    bid_history=bid_history,
+                    play_history=play_history,
+                    dda=dda,
+                    score_type=tag_pairs.get('Scoring'),
+                    scores=scores)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import datetime
+import io
+import os
 from enum import Enum
-from typing import IO, List, Optional
+from typing import Dict, IO, List, Optional, Sequence, Union
 
 from . import _VERSION
 from ..abstract_classes import Writer
-from ... import Contract, Hands, Player
+from ... import Bid, Contract, Hands, Pair, Player, Suit
+from ...playing_phase import PlayingHistory, TrickHistory
+
+_PLAYERS = (Player.N, Player.E, Player.S, Player.W)
+_STRAINS = (Suit.C, Suit.D, Suit.H, Suit.S, Suit.NT)
 
 
 class PbnWriter(Writer):
@@ -63,7 +69,7 @@ class PbnWriter(Writer):
                            event: str,
                            site: str,
                            date: datetime.date,
-                           board_num: int,
+                           board_num: Union[int, str],
                            west_player: str,
                            north_player: str,
                            east_player: str,
@@ -72,7 +78,13 @@ class PbnWriter(Writer):
                            deal: Hands,
                            scoring: Scoring,
                            contract: Contract,
-                           taken_tricks: Optional[int]) -> None:
+                           taken_tricks: Optional[int],
+                           bid_history: Optional[List[Bid]] = None,
+                           play_history: Optional[
+                               Sequence[TrickHistory]] = None,
+                           scores: Optional[Dict[Pair, int]] = None,
+                           dda: Optional[
+                               Dict[Player, Dict[Suit, int]]] = None) -> None:
         """Writes board result.
 
         The 15 tag names of the mandatory tag set are (in order):
@@ -92,10 +104,13 @@ class PbnWriter(Writer):
          (14) Contract   (the contract)
          (15) Result     (the result of the game)
 
+        The optional tags follow in alphabetical order:
+         Auction, OptimumResultTable, Play and Score.
+
         :param event: The name of the tournament or match.
         :param site: Location of the event.
         :param date: Starting date of the game
-        :param board_num: Board number.
+        :param board_num: Board number. A board id is also accepted.
         :param west_player: West player's name.
         :param north_player: North player's name.
         :param east_player: East player's name.
@@ -106,12 +121,16 @@ class PbnWriter(Writer):
         :param contract: Contract of the game. Contract object has the
             information about vulnerability and declarer.
         :param taken_tricks: Tricks taken by the declarer's team.
+        :param bid_history: History of the auction. (optional)
+        :param play_history: Tricks played. (optional)
+        :param scores: Scores of two teams. (optional)
+        :param dda: Double dummy analysis results of the board. (optional)
         :return: None.
         """
         self.write_tag_pair('Event', event)
         self.write_tag_pair('Site', site)
         self.write_tag_pair('Date', date.strftime('%Y.%m.%d'))  # "YYYY.MM.DD"
-        assert board_num > 0
+        assert not isinstance(board_num, int) or board_num > 0
         self.write_tag_pair('Board', str(board_num))
         self.write_tag_pair('West', west_player)
         self.write_tag_pair('North', north_player)
@@ -136,7 +155,199 @@ class PbnWriter(Writer):
         self.write_tag_pair('Result',
                             '' if contract.is_passed_out() else str(
                                 taken_tricks))
-        # TODO: Implement optional fields.
+
+        if bid_history is not None:
+            self.write_auction(dealer, bid_history)
+        if dda is not None:
+            self.write_optimum_result_table(dda)
+        if play_history and not contract.is_passed_out():
+            self.write_play(play_history)
+        if scores is not None:
+            self.write_tag_pair('Score', f'NS {scores[Pair.NS]}')
+
+    def write_auction(self, dealer: Player, bid_history: List[Bid]) -> None:
+        """Writes Auction tag and section.
+
+        Calls are written from the dealer, 4 calls in a line.
+
+        :param dealer: Dealer, the first player to call.
+        :param bid_history: Calls in the auction.
+        :return: None.
+        """
+        self.write_tag_pair('Auction', str(dealer))
+        for i in range(0, len(bid_history), 4):
+            self.write_line(' '.join(str(bid) for bid in bid_history[i:i + 4]))
+
+    def write_play(self, play_history: Sequence[TrickHistory]) -> None:
+        """Writes Play tag and section.
+
+        A line is a trick, whose cards are in the columns of the players from
+        the opening leader. A card not played is '-', and '*' ends the play if
+        it is not complete.
+
+        :param play_history: Tricks played. It must not be empty.
+        :return: None.
+        """
+        opening_leader = play_history[0].leader
+        self.write_tag_pair('Play', str(opening_leader))
+        for trick_history in play_history:
+            row = ['-'] * 4
+            start = trick_history.leader.value - opening_leader.value
+            for i, card in enumerate(trick_history.cards):
+                row[(start + i) % 4] = str(card)
+            self.write_line(' '.join(row))
+        if len(play_history) < 13 or len(play_history[-1].cards) < 4:
+            self.write_line('*')
+
+    def write_optimum_result_table(self,
+                                   dda: Dict[Player, Dict[Suit, int]]) -> None:
+        """Writes OptimumResultTable tag and section.
+
+        A line has a declarer, a strain and the number of tricks taken by the
+        declarer's team, for example "N NT  9".
+
+        :param dda: Double dummy analysis results of the board.
+        :return: None.
+        """
+        self.write_tag_pair('OptimumResultTable',
+                            r'Declarer;Denomination\2R;Result\2R')
+        for player in _PLAYERS:
+            for strain in _STRAINS:
+                self.write_line(
+                    f'{player} {str(strain):>2} {dda[player][strain]:>2}')
+
+
+class PbnLogWriter(PbnWriter):
+    """Writer for logs in PBN export format.
+
+    Games are written to a buffer, which is written to the output stream in
+    batches of flush_interval games, so the file has only whole games after
+    each flush. os.fsync is called after each flush if fsync is True.
+
+    :param writer: Output stream.
+    :param event: The name of the tournament or match.
+    :param site: Location of the event.
+    :param date: Starting date of the games. Today if None.
+    :param flush_interval: The number of games written between flushes.
+    :param fsync: Whether the file is synchronized to the disk after flushes.
+    """
+
+    def __init__(self,
+                 writer: IO[str],
+                 event: str = '?',
+                 site: str = '?',
+                 date: Optional[datetime.date] = None,
+                 flush_interval: int = 1,
+                 fsync: bool = False):
+        # games are written to the buffer until they are flushed
+        self._buffer = io.StringIO()
+        super().__init__(self._buffer)
+        if flush_interval < 1:
+            raise ValueError('flush_interval must be positive.')
+        self._stream = writer
+        self.event = event
+        self.site = site
+        self.date = datetime.date.today() if date is None else date
+        self._flush_interval = flush_interval
+        self._fsync = fsync
+        self._unflushed = 0
+        self._open = False
+        self._first_game = True
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self):
+        self.write_header()
+        self._open = True
+        self._first_game = True
+
+    def close(self):
+        self.flush()
+        self._open = False
+
+    def flush(self) -> None:
+        """Writes buffered games to the output stream and flushes it.
+
+        :return: None.
+        """
+        self._stream.write(self._buffer.getvalue())
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._stream.flush()
+        if self._fsync:
+            os.fsync(self._stream.fileno())
+        self._unflushed = 0
+
+    def write(self,
+              board_id: str,
+              west_player: str,
+              north_player: str,
+              east_player: str,
+              south_player: str,
+              dealer: Player,
+              deal: Hands,
+              scoring: Scoring,
+              bid_history: List[Bid],
+              contract: Contract,
+              play_history: Optional[PlayingHistory],
+              taken_trick_num: Optional[int],
+              scores: Dict[Pair, int],
+              dda: Optional[
+                  Dict[Player, Dict[Suit, int]]] = None) -> None:
+        """Writes a game.
+
+        The arguments are the same as JsonLogWriter.write.
+
+        :param board_id: Board id in the board setting.
+        :param west_player: West player name.
+        :param north_player: North player name.
+        :param east_player: East player name.
+        :param south_player: South player name.
+        :param dealer: Dealer of the board.
+        :param deal: Deal of the board.
+        :param scoring: Scoring style.
+        :param bid_history: History of bidding (auction) phase.
+        :param contract: Contract of the board.
+        :param play_history: History of playing phase.
+        :param taken_trick_num: The number of taken tricks by declarers' team.
+        :param scores: Scores of two teams, which follows the scoring style.
+        :param dda: Double dummy analysis results of the board. (optional)
+        :return: None.
+        """
+        if not self._open:
+            raise Exception('PbnLogWriter does not open the file.')
+        if self._first_game:
+            self._first_game = False
+        else:
+            # games are separated by an empty line
+            self.writer.write('\n')
+        self.write_board_result(
+            event=self.event,
+            site=self.site,
+            date=self.date,
+            board_num=board_id,
+            west_player=west_player,
+            north_player=north_player,
+            east_player=east_player,
+            south_player=south_player,
+            dealer=dealer,
+            deal=deal,
+            scoring=scoring,
+            contract=contract,
+            taken_tricks=taken_trick_num,
+            bid_history=bid_history,
+            play_history=None if play_history is None
+            else play_history.history,
+            scores=scores,
+            dda=dda)
+        self._unflushed += 1
+        if self._unflushed >= self._flush_interval:
+            self.flush()
 
 
 class Scoring(Enum):
@@ -0,0 +1,203 @@
+"""Persistent cache of double dummy analysis.
+
+DDACache stores DDA tables of complete deals in a sqlite3 database. The key is
+the 12-byte ordinal of the canonical form of the deal (see
+bridge_env.canonical_deal), so deals equivalent under rotation of seats and
+relabelling of suits share a table. The value is the 20 trick numbers of the
+table of the canonical deal. The least recently used tables are evicted
+when the cache exceeds its maximum size::
+
+    >>> with DDACache('dda.sqlite3', max_size=1000000) as cache:
+    ...     dda = calc_dda(hands, cache=cache)
+    ...     print(cache.hits, cache.misses)
+
+A default cache is used by calc_dda and the bridge-dda command if no cache is
+given. It is set by set_default_cache, or opened at the path of the
+environment variable BRIDGE_ENV_DDA_CACHE.
+"""
+from __future__ import annotations
+
+import atexit
+import os
+import pathlib
+import sqlite3
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+from .canonical_deal import DealTransform, canonicalize_masks
+from .deal_ordinal import ORDINAL_BYTES, masks_to_ordinal
+from .player import Player
+from .suit import Suit
+
+# Environment variable of the path of the default cache.
+CACHE_PATH_ENV = 'BRIDGE_ENV_DDA_CACHE'
+
+# Order of trick numbers in a stored table.
+_PLAYERS = (Player.N, Player.E, Player.S, Player.W)
+_SUITS = (Suit.C, Suit.D, Suit.H, Suit.S, Suit.NT)
+
+# Fraction of the maximum size evicted at once beyond the overflow, so that
+# tables are not evicted on every insertion into a full cache.
+_EVICTION_RATIO = 0.01
+
+
+def _to_key(masks: Sequence[int]) -> Tuple[bytes, DealTransform]:
+    canonical, transform = canonicalize_masks(masks)
+    return masks_to_ordinal(canonical).to_bytes(ORDINAL_BYTES, 'big'), \
+        transform
+
+
+def _encode(dda: Dict[Player, Dict[Suit, int]]) -> bytes:
+    return bytes(dda[p][s] for p in _PLAYERS for s in _SUITS)
+
+
+def _decode(data: bytes) -> Dict[Player, Dict[Suit, int]]:
+    return {p: {s: data[i * 5 + j] for j, s in enumerate(_SUITS)}
+            for i, p in enumerate(_PLAYERS)}
+
+
+class DDACache:
+    """Cache of DDA tables in a sqlite3 database.
+
+    :param path: Path of the database file. ':memory:' makes an in-memory
+        cache.
+    :param max_size: The maximum number of stored tables. If None, tables are
+        never evicted. When the cache exceeds it, the least recently used
+        tables are evicted in a batch of about 1% of max_size.
+    """
+
+    def __init__(self,
+                 path: Union[str, pathlib.Path] = ':memory:',
+                 max_size: Optional[int] = None):
+        if max_size is not None and max_size < 1:
+            raise ValueError('max_size must be positive.')
+        self._max_size = max_size
+        self._connection = sqlite3.connect(str(path))
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS dda ('
+            'deal BLOB PRIMARY KEY, '
+            'tricks BLOB NOT NULL, '
+            'last_used INTEGER NOT NULL)')
+        self._connection.execute(
+            'CREATE INDEX IF NOT EXISTS dda_last_used ON dda (last_used)')
+        self._connection.commit()
+        # logical clock of uses, which orders tables by recency
+        self._clock = self._connection.execute(
+            'SELECT COALESCE(MAX(last_used), 0) FROM dda').fetchone()[0]
+        self._size = len(self)
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> DDACache:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM dda').fetchone()[0]
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """The maximum number of stored tables."""
+        return self._max_size
+
+    def get(self, masks: Sequence[int]
+            ) -> Optional[Dict[Player, Dict[Suit, int]]]:
+        """Looks up the DDA table of a deal.
+
+        :param masks: 52-bit masks of hands in the order of N, E, S and W.
+            The deal must be complete.
+        :return: DDA table of the deal. None if it is not stored.
+        """
+        key, transform = _to_key(masks)
+        row = self._connection.execute(
+            'SELECT tricks FROM dda WHERE deal = ?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._clock += 1
+        self._connection.execute(
+            'UPDATE dda SET last_used = ? WHERE deal = ?', (self._clock, key))
+        self._connection.commit()
+        return transform.to_original_dda(_decode(row[0]))
+
+    def put(self, masks: Sequence[int],
+            dda: Dict[Player, Dict[Suit, int]]) -> None:
+        """Stores the DDA table of a deal.
+
+        :param masks: 52-bit masks of hands in the order of N, E, S and W.
+            The deal must be complete.
+        :param dda: DDA table of the deal.
+        :return: None.
+        """
+        key, transform = _to_key(masks)
+        self._clock += 1
+        tricks = _encode(transform.to_canonical_dda(dda))
+        cursor = self._connection.execute(
+            'INSERT OR IGNORE INTO dda (deal, tricks, last_used) '
+            'VALUES (?, ?, ?)', (key, tricks, self._clock))
+        if cursor.rowcount:
+            self._size += 1
+        else:
+            self._connection.execute(
+                'UPDATE dda SET tricks = ?, last_used = ? WHERE deal = ?',
+                (tricks, self._clock, key))
+        if self._max_size is not None and self._size > self._max_size:
+            num = self._size - self._max_size + \
+                int(self._max_size * _EVICTION_RATIO)
+            cursor = self._connection.execute(
+                'DELETE FROM dda WHERE deal IN ('
+                'SELECT deal FROM dda ORDER BY last_used LIMIT ?)', (num,))
+            self._size -= cursor.rowcount
+        self._connection.commit()
+
+    def clear(self) -> None:
+        """Removes all tables.
+
+        :return: None.
+        """
+        self._connection.execute('DELETE FROM dda')
+        self._connection.commit()
+        self._size = 0
+
+    def close(self) -> None:
+        """Closes the database. Closing a closed cache does nothing.
+
+        :return: None.
+        """
+        self._connection.close()
+
+
+_default_cache: Optional[DDACache] = None
+_default_cache_loaded = False
+
+
+def set_default_cache(cache: Optional[DDACache]) -> None:
+    """Sets the default cache.
+
+    :param cache: Cache used by default. None disables the default cache.
+    :return: None.
+    """
+    global _default_cache, _default_cache_loaded
+    _default_cache = cache
+    _default_cache_loaded = True
+
+
+def get_default_cache() -> Optional[DDACache]:
+    """The default cache.
+
+    If it is not set, a cache is opened at the path of the environment
+    variable BRIDGE_ENV_DDA_CACHE, and it is closed at exit.
+
+    :return: The default cache. None if there is no default cache.
+    """
+    global _default_cache, _default_cache_loaded
+    if not _default_cache_loaded:
+        path = os.environ.get(CACHE_PATH_ENV)
+        _default_cache = DDACache(path) if path else None
+        if _default_cache is not None:
+            atexit.register(_default_cache.close)
+        _default_cache_loaded = True
+    return _default_cache
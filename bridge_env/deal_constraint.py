@@ -0,0 +1,287 @@
+"""Constraint-filtered deal generation.
+
+Deals are generated in batches by the vectorized deal generator
+(bridge_env.deal_generator) and filtered by constraints evaluated as numpy
+predicates over the whole batch. The batch size is adapted to the observed
+acceptance rate, so rare constraints don't need many small batches.
+
+Generate 2NT openers (20-21 HCP, balanced) in north opposite game forcing
+hands in south, and write them as board settings::
+
+    >>> constraint = DealConstraint(hands={
+    ...     Player.N: HandConstraint(hcp=(20, 21),
+    ...                              shapes=('any 4333', 'any 4432',
+    ...                                      'any 5332')),
+    ...     Player.S: HandConstraint(hcp=(13, 37))})
+    >>> with open('boards.json', 'w') as fw:
+    ...     with JsonBoardSettingWriter(fw) as writer:
+    ...         for setting in iter_board_settings(100, constraint, rng=1):
+    ...             writer.write_board_setting(setting)
+"""
+from __future__ import annotations
+
+import itertools
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, Optional, \
+    Sequence, Set, Tuple
+
+import numpy as np
+
+from .card import Card
+from .data_handler.abstract_classes import BoardSetting
+from .deal_generator import RngLike, generate_owners, owners_to_hands
+from .hand_features import hcp, suit_lengths
+from .hands import Hands
+from .player import Player
+from .suit import Suit
+from .vul import Vul
+
+# Shape pattern. Lengths in the order of S, H, D and C. 'x' is any length,
+# and lengths of 10 or more are in parentheses (ex: '(10)210').
+# 'any ' prefix matches any permutation of the lengths.
+_LENGTH_PATTERN = r'[0-9x]|\(1[0-3]\)'
+SHAPE_PATTERN = rf'(any )?((?:{_LENGTH_PATTERN}){{4}})'
+
+_MIN_BATCH_SIZE = 1 << 10
+_MAX_BATCH_SIZE = 1 << 20
+
+# All shapes. Lengths in the order of C, D, H and S.
+_ALL_SHAPES = tuple(shape for shape in itertools.product(range(14), repeat=4)
+                    if sum(shape) == 13)
+
+
+def parse_shape(pattern: str) -> Set[Tuple[int, int, int, int]]:
+    """Converts a shape pattern to a set of suit lengths.
+
+    | '5431': 5 spades, 4 hearts, 3 diamonds and 1 club.
+    | '5xxx': 5 spades and any other lengths.
+    | 'any 4333': any 4-3-3-3 shape.
+    | '(10)210': 10 spades, 2 hearts, 1 diamond and no clubs.
+
+    :param pattern: Shape pattern.
+    :return: Set of suit lengths in the order of C, D, H and S. The sum of
+        lengths is 13.
+    """
+    match = re.fullmatch(SHAPE_PATTERN, pattern.strip())
+    if not match:
+        raise ValueError(f'Parse exception. "{pattern}" does not match '
+                         f'the pattern.')
+    chars = [c.strip('()') for c in re.findall(_LENGTH_PATTERN,
+                                               match.group(2))]
+    patterns = set(itertools.permutations(chars)) if match.group(1) else {
+        tuple(chars)}
+    return {shape for shape in _ALL_SHAPES
+            if any(all(c == 'x' or int(c) == length
+                       for c, length in zip(p, reversed(shape)))
+                   for p in patterns)}
+
+
+@lru_cache(maxsize=None)
+def _shape_table(patterns: Tuple[str, ...]) -> np.ndarray:
+    # Lookup table indexed by lengths of C, D, H and S in base 14.
+    table = np.zeros(14 ** 4, dtype=bool)
+    for pattern in patterns:
+        for c, d, h, s in parse_shape(pattern):
+            table[((c * 14 + d) * 14 + h) * 14 + s] = True
+    return table
+
+
+@dataclass(frozen=True)
+class HandConstraint:
+    """Constraint on a hand. All conditions must be satisfied.
+
+    :param hcp: Inclusive range of high card points.
+    :param lengths: Inclusive ranges of suit lengths.
+    :param shapes: Shape patterns (see parse_shape). One of them must match.
+    :param cards: Cards which must be held.
+    """
+    hcp: Optional[Tuple[int, int]] = None
+    lengths: Optional[Dict[Suit, Tuple[int, int]]] = None
+    shapes: Optional[Sequence[str]] = None
+    cards: FrozenSet[Card] = frozenset()
+
+    def __post_init__(self):
+        if self.lengths is not None and Suit.NT in self.lengths:
+            raise ValueError('Suit of lengths must not be NT.')
+        if self.shapes is not None:
+            _shape_table(tuple(self.shapes))  # validates patterns
+
+    def evaluate(self, binary: np.ndarray) -> np.ndarray:
+        """Evaluates the constraint.
+
+        :param binary: (N, 52) binary array of hands.
+        :return: (N,) bool array. True if the hand satisfies the constraint.
+        """
+        accepted = np.ones(binary.shape[0], dtype=bool)
+        if self.cards:
+            accepted &= binary[:, [int(c) for c in self.cards]].all(axis=1)
+        if self.hcp is not None:
+            points = hcp(binary)
+            accepted &= (self.hcp[0] <= points) & (points <= self.hcp[1])
+        if self.lengths is None and self.shapes is None:
+            return accepted
+
+        lengths = suit_lengths(binary)
+        if self.lengths is not None:
+            for suit, (low, high) in self.lengths.items():
+                length = lengths[:, suit.value - 1]
+                accepted &= (low <= length) & (length <= high)
+        if self.shapes is not None:
+            codes = ((lengths[:, 0] * 14 + lengths[:, 1]) * 14
+                     + lengths[:, 2]) * 14 + lengths[:, 3]
+            accepted &= _shape_table(tuple(self.shapes))[codes]
+        return accepted
+
+
+@dataclass(frozen=True)
+class DealConstraint:
+    """Constraint on a deal.
+
+    :param hands: Constraints on hands of players.
+    :param predicate: Additional predicate on a deal, such as combined high
+        card points of a pair. It takes (N, 52) owner array (see
+        bridge_env.deal_generator) and returns (N,) bool array.
+    """
+    hands: Dict[Player, HandConstraint] = field(default_factory=dict)
+    predicate: Optional[Callable[[np.ndarray], np.ndarray]] = None
+
+    def evaluate(self, owners: np.ndarray) -> np.ndarray:
+        """Evaluates the constraint.
+
+        Rejected deals are dropped before the next condition is evaluated.
+
+        :param owners: (N, 52) owner array.
+        :return: (N,) bool array. True if the deal satisfies the constraint.
+        """
+        idxes = np.arange(owners.shape[0])
+        for player, constraint in self.hands.items():
+            binary = owners[idxes] == player.value - 1
+            idxes = idxes[constraint.evaluate(binary)]
+        if self.predicate is not None:
+            idxes = idxes[self.predicate(owners[idxes])]
+        accepted = np.zeros(owners.shape[0], dtype=bool)
+        accepted[idxes] = True
+        return accepted
+
+
+def iter_constrained_owners(
+        n: int,
+        constraint: DealConstraint,
+        rng: RngLike = None,
+        max_generated: Optional[int] = None) -> Iterator[np.ndarray]:
+    """Generates deals satisfying a constraint by rejection sampling.
+
+    The size of the next batch is estimated from the acceptance rate observed
+    so far to generate the remaining deals at once.
+
+    :param n: The number of deals.
+    :param constraint: Constraint on deals.
+    :param rng: Seed or numpy.random.Generator.
+    :param max_generated: Maximum number of generated deals including rejected
+        ones. If None, there is no limit.
+    :return: (M, 52) owner arrays of accepted deals (yield). Total M is n.
+    """
+    rng = np.random.default_rng(rng)
+    remaining = n
+    generated = 0
+    accepted = 0
+    while remaining > 0:
+        if max_generated is not None and generated >= max_generated:
+            raise Exception('Generation exception. '
+                            f'{generated} deals are generated but only '
+                            f'{accepted} deals satisfy the constraint.')
+        rate = (accepted + 1) / (generated + 2)
+        size = int(remaining / rate * 1.1) + 1
+        size = min(max(size, _MIN_BATCH_SIZE), _MAX_BATCH_SIZE)
+        if max_generated is not None:
+            size = min(size, max_generated - generated)
+
+        owners = generate_owners(size, rng)
+        owners = owners[constraint.evaluate(owners)][:remaining]
+        generated += size
+        accepted += owners.shape[0]
+        remaining -= owners.shape[0]
+        if owners.shape[0] > 0:
+            yield owners
+
+
+def generate_constrained_owners(n: int,
+                                constraint: DealConstraint,
+                                rng: RngLike = None,
+                                max_generated: Optional[int] = None
+                                ) -> np.ndarray:
+    """Generates deals satisfying a constraint as an owner array.
+
+    :param n: The number of deals.
+    :param constraint: Constraint on deals.
+    :param rng: Seed or numpy.random.Generator.
+    :param max_generated: Maximum number of generated deals including rejected
+        ones. If None, there is no limit.
+    :return: (n, 52) owner array.
+    """
+    batches = list(iter_constrained_owners(n, constraint, rng, max_generated))
+    if len(batches) == 0:
+        return np.empty((0, 52), dtype=np.uint8)
+    return np.concatenate(batches)
+
+
+def iter_constrained_hands(n: int,
+                           constraint: DealConstraint,
+                           rng: RngLike = None,
+                           max_generated: Optional[int] = None
+                           ) -> Iterator[Hands]:
+    """Generates deals satisfying a constraint as Hands objects.
+
+    :param n: The number of deals.
+    :param constraint: Constraint on deals.
+    :param rng: Seed or numpy.random.Generator.
+    :param max_generated: Maximum number of generated deals including rejected
+        ones. If None, there is no limit.
+    :return: Hands (yield).
+    """
+    for owners in iter_constrained_owners(n, constraint, rng, max_generated):
+        for deal in owners:
+            yield owners_to_hands(deal)
+
+
+# Vulnerability of boards 1-16 in duplicate bridge.
+_BOARD_VUL = (Vul.NONE, Vul.NS, Vul.EW, Vul.BOTH,
+              Vul.NS, Vul.EW, Vul.BOTH, Vul.NONE,
+              Vul.EW, Vul.BOTH, Vul.NONE, Vul.NS,
+              Vul.BOTH, Vul.NONE, Vul.NS, Vul.EW)
+
+
+def iter_board_settings(n: int,
+                        constraint: DealConstraint,
+                        rng: RngLike = None,
+                        first_board_num: int = 1,
+                        dealer: Optional[Player] = None,
+                        vul: Optional[Vul] = None,
+                        max_generated: Optional[int] = None
+                        ) -> Iterator[BoardSetting]:
+    """Generates board settings of deals satisfying a constraint.
+
+    Board id is the board number. Dealer and vulnerability follow the
+    duplicate bridge rotation of the board number unless they are set.
+
+    :param n: The number of boards.
+    :param constraint: Constraint on deals.
+    :param rng: Seed or numpy.random.Generator.
+    :param first_board_num: Board number of the first board.
+    :param dealer: Dealer of all boards. If None, dealer rotates.
+    :param vul: Vulnerability of all boards. If None, vulnerability rotates.
+    :param max_generated: Maximum number of generated deals including rejected
+        ones. If None, there is no limit.
+    :return: Board settings (yield).
+    """
+    board_num = first_board_num
+    for hands in iter_constrained_hands(n, constraint, rng, max_generated):
+        yield BoardSetting(
+            hands=hands,
+            dealer=Player((board_num - 1) % 4 + 1) if dealer is None
+            else dealer,
+            vul=_BOARD_VUL[(board_num - 1) % 16] if vul is None else vul,
+            board_id=str(board_num))
+        board_num += 1
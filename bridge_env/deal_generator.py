@@ -0,0 +1,224 @@
+"""Vectorized deal generation module.
+
+A batch of N deals is represented by an owner array, a (N, 52) uint8 numpy
+array where owners[i, c] is the seat index of the player who holds the card c
+(int(card)) in the i-th deal. Seat index is Player.value - 1, that is,
+N = 0, E = 1, S = 2 and W = 3.
+
+Generate 1000 deals with a seed::
+
+    >>> batch = DealBatch.generate(1000, rng=1)
+    >>> batch.owners.shape
+    (1000, 52)
+    >>> hands = batch[0]  # Hands object is created only when requested.
+"""
+from __future__ import annotations
+
+from typing import Iterator, List, Sequence, Union
+
+import numpy as np
+
+from .bit_hands import BitHands
+from .card import Card
+from .hands import Hands
+from .player import Player
+
+RngLike = Union[None, int, np.random.Generator]
+
+# Maximum number of deals shuffled at once. It bounds temporary arrays.
+_CHUNK_SIZE = 1 << 16
+_SEATS = np.arange(4, dtype=np.uint8)
+_SHIFTS = np.arange(52, dtype=np.uint64)
+
+
+def generate_owners(n: int, rng: RngLike = None) -> np.ndarray:
+    """Generates deals randomly as an owner array.
+
+    Each deal is a uniformly random permutation of the deck computed by
+    argsort of random keys. Its position in the permutation decides the owner
+    of a card (0-12 -> N, 13-25 -> E, 26-38 -> S, 39-51 -> W).
+
+    :param n: The number of deals.
+    :param rng: Seed or numpy.random.Generator. If None, fresh entropy is used.
+    :return: (n, 52) uint8 owner array.
+    """
+    if n < 0:
+        raise ValueError('The number of deals must be non-negative.')
+    rng = np.random.default_rng(rng)
+    owners = np.empty((n, 52), dtype=np.uint8)
+    for start in range(0, n, _CHUNK_SIZE):
+        stop = min(start + _CHUNK_SIZE, n)
+        keys = rng.random((stop - start, 52))
+        owners[start:stop] = np.argsort(keys, axis=1) // 13
+    return owners
+
+
+def owners_to_tensor(owners: np.ndarray) -> np.ndarray:
+    """Converts an owner array to a binary tensor.
+
+    :param owners: (N, 52) owner array.
+    :return: (N, 4, 52) bool array. [i, s, c] is True if the seat s holds the
+        card c in the i-th deal.
+    """
+    return owners[:, np.newaxis, :] == _SEATS[np.newaxis, :, np.newaxis]
+
+
+def tensor_to_owners(tensor: np.ndarray) -> np.ndarray:
+    """Converts a binary tensor to an owner array.
+
+    :param tensor: (N, 4, 52) binary array of complete deals.
+    :return: (N, 52) uint8 owner array.
+    """
+    return np.argmax(tensor, axis=1).astype(np.uint8)
+
+
+def owners_to_masks(owners: np.ndarray) -> np.ndarray:
+    """Converts an owner array to 52-bit masks of hands (see BitHands).
+
+    :param owners: (N, 52) owner array.
+    :return: (N, 4) uint64 array of masks in the order of N, E, S and W.
+    """
+    bits = owners_to_tensor(owners).astype(np.uint64) << _SHIFTS
+    return np.bitwise_or.reduce(bits, axis=2)
+
+
+def owners_to_hands(owners: np.ndarray) -> Hands:
+    """Converts a deal in the owner format to Hands object.
+
+    :param owners: (52,) owner array of a deal.
+    :return: Hands object.
+    """
+    hands = [{Card.int_to_card(int(c)) for c in np.flatnonzero(owners == s)}
+             for s in range(4)]
+    return Hands(north_hand=hands[0],
+                 east_hand=hands[1],
+                 south_hand=hands[2],
+                 west_hand=hands[3])
+
+
+def hands_to_owners(hands: Hands) -> np.ndarray:
+    """Converts a complete deal of Hands object to the owner format.
+
+    :param hands: Hands object of a complete deal.
+    :return: (52,) uint8 owner array.
+    """
+    owners = np.empty(52, dtype=np.uint8)
+    seen = np.zeros(52, dtype=bool)
+    for p in Player:
+        idxes = [int(card) for card in hands[p]]
+        owners[idxes] = p.value - 1
+        seen[idxes] = True
+    if not seen.all():
+        raise ValueError('Hands must have all 52 cards.')
+    return owners
+
+
+class DealBatch:
+    """Batch of deals in the owner format.
+
+    Hands objects are created lazily, only when a deal is accessed by index
+    or iteration.
+
+    :param owners: (N, 52) uint8 owner array.
+    """
+
+    def __init__(self, owners: np.ndarray):
+        if owners.ndim != 2 or owners.shape[1] != 52:
+            raise ValueError('Owner array must have the shape (N, 52).')
+        self._owners = owners
+
+    def __len__(self) -> int:
+        return self._owners.shape[0]
+
+    def __getitem__(self, item: int) -> Hands:
+        return owners_to_hands(self._owners[item])
+
+    def __iter__(self) -> Iterator[Hands]:
+        for owners in self._owners:
+            yield owners_to_hands(owners)
+
+    @property
+    def owners(self) -> np.ndarray:
+        """(N, 52) uint8 owner array."""
+        return self._owners
+
+    def to_tensor(self) -> np.ndarray:
+        """Converts to a binary tensor.
+
+        :return: (N, 4, 52) bool array.
+        """
+        return owners_to_tensor(self._owners)
+
+    def to_masks(self) -> np.ndarray:
+        """Converts to 52-bit masks of hands.
+
+        :return: (N, 4) uint64 array.
+        """
+        return owners_to_masks(self._owners)
+
+    def bit_hands(self, item: int) -> BitHands:
+        """Converts a deal to BitHands object.
+
+        :param item: Index of the deal. A negative index counts from the end.
+        :return: BitHands object.
+        :raise IndexError: If item is out of range.
+        """
+        return BitHands(*(int(m) for m in owners_to_masks(
+            self._owners[item][np.newaxis])[0]))
+
+    def to_hands_list(self) -> List[Hands]:
+        """Converts all deals to Hands objects.
+
+        :return: List of Hands.
+        """
+        return list(self)
+
+    @classmethod
+    def generate(cls, n: int, rng: RngLike = None) -> DealBatch:
+        """Generates deals randomly.
+
+        :param n: The number of deals.
+        :param rng: Seed or numpy.random.Generator.
+        :return: Batch of randomly generated deals.
+        """
+        return cls(generate_owners(n, rng))
+
+    @classmethod
+    def from_hands(cls, hands_list: Sequence[Hands]) -> DealBatch:
+        """Creates a batch from Hands objects.
+
+        :param hands_list: Sequence of Hands objects of complete deals.
+        :return: Batch of the deals.
+        """
+        owners = np.empty((len(hands_list), 52), dtype=np.uint8)
+        for i, hands in enumerate(hands_list):
+            owners[i] = hands_to_owners(hands)
+        return cls(owners)
+
+    @classmethod
+    def concatenate(cls, batches: Sequence[DealBatch]) -> DealBatch:
+        """Concatenates batches.
+
+        :param batches: Batches of deals.
+        :return: A batch which has all deals of the batches.
+        """
+        if len(batches) == 0:
+            return cls(np.empty((0, 52), dtype=np.uint8))
+        return cls(np.concatenate([b.owners for b in batches]))
+
+
+def generate_deals(n: int, rng: RngLike = None,
+                   tensor: bool = False) -> np.ndarray:
+    """Generates deals randomly as numpy arrays.
+
+    :param n: The number of deals.
+    :param rng: Seed or numpy.random.Generator.
+    :param tensor: If True, returns (n, 4, 52) bool tensor. Otherwise returns
+        (n, 52) uint8 owner array.
+    :return: Randomly generated deals.
+    """
+    owners = generate_owners(n, rng)
+    if tensor:
+        return owners_to_tensor(owners)
+    return owners
+
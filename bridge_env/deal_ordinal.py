@@ -0,0 +1,159 @@
+"""Deal ordinal encoding.
+
+A complete deal is encoded to an int in [0, DEAL_COUNT), where DEAL_COUNT is
+52! / (13!)^4 (about 5.36e28), so an ordinal fits in 96 bits (12 bytes).
+
+The encoding follows the scheme of Pavlicek and Andrews. The north hand is
+ranked as a combination of 13 cards out of 52, the east hand as a combination
+of 13 cards out of the 39 cards north doesn't hold, and the south hand as a
+combination of 13 cards out of the remaining 26. The west hand is decided by
+the other hands. The ordinal is the mixed radix number of the three ranks::
+
+    ordinal = (rank_n * C(39, 13) + rank_e) * C(26, 13) + rank_s
+
+Each combination is ranked in the colexicographic order of positions of the
+cards among the available cards (ordered by int(card)).
+"""
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+# Binomial coefficients. BINOMIAL[n][k] = C(n, k), n in [0, 52], k in [0, 13].
+BINOMIAL: Tuple[Tuple[int, ...], ...]
+_rows: List[Tuple[int, ...]] = [(1,) + (0,) * 13]
+for _ in range(52):
+    _prev = _rows[-1]
+    _rows.append((1,) + tuple(_prev[k - 1] + _prev[k] for k in range(1, 14)))
+BINOMIAL = tuple(_rows)
+del _rows, _prev
+
+_BINOMIAL_NP = np.array(BINOMIAL, dtype=np.int64)
+
+_C39 = BINOMIAL[39][13]
+_C26 = BINOMIAL[26][13]
+
+# The number of deals. 52! / (13!)^4
+DEAL_COUNT = BINOMIAL[52][13] * _C39 * _C26
+# Bytes of an ordinal.
+ORDINAL_BYTES = 12
+
+_FULL_DECK = (1 << 52) - 1
+
+
+def _rank_hand(hand: int, free: int) -> int:
+    # colex rank of the cards of hand among the cards of free
+    rank = 0
+    held = 0
+    position = 0
+    while free:
+        low = free & -free
+        if hand & low:
+            held += 1
+            rank += BINOMIAL[position][held]
+        position += 1
+        free ^= low
+    return rank
+
+
+def _unrank_hand(rank: int, free: int) -> int:
+    cards = []
+    while free:
+        low = free & -free
+        cards.append(low)
+        free ^= low
+    hand = 0
+    position = len(cards)
+    for k in range(13, 0, -1):
+        position -= 1
+        while BINOMIAL[position][k] > rank:
+            position -= 1
+        rank -= BINOMIAL[position][k]
+        hand |= cards[position]
+    return hand
+
+
+def masks_to_ordinal(masks: Sequence[int]) -> int:
+    """Encodes a deal to an ordinal.
+
+    :param masks: 52-bit masks of hands in the order of N, E, S and W
+        (see BitHands).
+    :return: Ordinal of the deal.
+    """
+    north, east, south, west = masks
+    if any(bin(mask).count('1') != 13 for mask in masks) or \
+            north | east | south | west != _FULL_DECK:
+        raise ValueError('Deal must be complete. Each hand has 13 cards.')
+    rank_n = _rank_hand(north, _FULL_DECK)
+    rank_e = _rank_hand(east, _FULL_DECK ^ north)
+    rank_s = _rank_hand(south, south | west)
+    return (rank_n * _C39 + rank_e) * _C26 + rank_s
+
+
+def ordinal_to_masks(ordinal: int) -> Tuple[int, int, int, int]:
+    """Decodes an ordinal to a deal.
+
+    :param ordinal: Ordinal of a deal.
+    :return: 52-bit masks of hands in the order of N, E, S and W.
+    """
+    if ordinal < 0 or DEAL_COUNT <= ordinal:
+        raise ValueError(f'Ordinal is from 0 to {DEAL_COUNT - 1}.')
+    rest, rank_s = divmod(ordinal, _C26)
+    rank_n, rank_e = divmod(rest, _C39)
+    north = _unrank_hand(rank_n, _FULL_DECK)
+    east = _unrank_hand(rank_e, _FULL_DECK ^ north)
+    south = _unrank_hand(rank_s, _FULL_DECK ^ north ^ east)
+    return north, east, south, _FULL_DECK ^ north ^ east ^ south
+
+
+def owners_to_ordinals(owners: np.ndarray) -> np.ndarray:
+    """Encodes deals in the owner format (see bridge_env.deal_generator).
+
+    Ranks of hands are computed by numpy over the whole batch.
+
+    :param owners: (N, 52) owner array of complete deals.
+    :return: (N,) object array of ordinals (int).
+    """
+    owners = np.asarray(owners)
+    if owners.ndim != 2 or owners.shape[1] != 52:
+        raise ValueError('Owner array must have the shape (N, 52).')
+    if not (np.sort(owners, axis=1) == np.repeat(np.arange(4), 13)).all():
+        raise ValueError('Deal must be complete. Each hand has 13 cards.')
+    ranks = []
+    for seat in range(3):
+        held = owners == seat
+        # position among available cards, and the number of held cards so far
+        positions = np.cumsum(owners >= seat, axis=1) - 1
+        counts = np.cumsum(held, axis=1)
+        ranks.append(np.where(held, _BINOMIAL_NP[positions, counts], 0).sum(
+            axis=1))
+    ordinals = (ranks[0].astype(object) * _C39 + ranks[1]) * _C26 + ranks[2]
+    return ordinals
+
+
+def ordinals_to_owners(ordinals: Sequence[int]) -> np.ndarray:
+    """Decodes ordinals to deals in the owner format.
+
+    :param ordinals: Ordinals of deals.
+    :return: (N, 52) uint8 owner array.
+    """
+    n = len(ordinals)
+    ranks = np.empty((3, n), dtype=np.int64)
+    for i, ordinal in enumerate(ordinals):
+        ordinal = int(ordinal)
+        if ordinal < 0 or DEAL_COUNT <= ordinal:
+            raise ValueError(f'Ordinal is from 0 to {DEAL_COUNT - 1}.')
+        rest, ranks[2, i] = divmod(ordinal, _C26)
+        ranks[0, i], ranks[1, i] = divmod(rest, _C39)
+
+    owners = np.full((n, 52), 3, dtype=np.uint8)
+    rows = np.arange(n)
+    for seat, free_num in enumerate((52, 39, 26)):
+        # free cards of each deal in ascending order
+        free_cards = np.nonzero(owners == 3)[1].reshape(n, free_num)
+        rank = ranks[seat].copy()
+        for k in range(13, 0, -1):
+            column = _BINOMIAL_NP[:free_num, k]
+            positions = np.searchsorted(column, rank, side='right') - 1
+            rank -= column[positions]
+            owners[rows, free_cards[rows, positions]] = seat
+    return owners
@@ -0,0 +1,679 @@
+"""Double dummy solver.
+
+Complete deals are solved by DDS (a double dummy solver written in C++) if the
+optional package endplay is installed (``pip install '.[dds]'``). It takes 0.5
+to 1.5 seconds per deal on average to calculate a DDA table. DoubleDummySolver
+below is a pure Python solver, which is used for positions with fewer than 13
+cards in hands and as a slow fallback without DDS. It takes minutes per
+complete deal (from 2 to 16 minutes per DDA table measured) and is practical
+only for endings of a few tricks.
+
+DoubleDummySolver works on 52-bit hand masks (see BitHands and PlayEngine) and
+finds the number of tricks taken by NS with perfect play of all players. The
+search is a null-window alpha-beta search which answers whether NS can take a
+target number of tricks, and the exact value is found by repeating it around a
+guess (MTD(f)). It uses
+
+* a transposition table of positions at trick boundaries. Cards are replaced
+  by their relative ranks among the remaining cards of the suit, and a search
+  result records which ranks were relevant to it (the ranks of cards which won
+  tricks by beating cards of the same suit). An entry matches every position
+  with the same lengths of suits and the same holders of the relevant top
+  cards, so positions which differ only in small cards share entries. The
+  table keeps lower and upper bounds of NS tricks and is shared by all leaders
+  of a strain.
+* quick tricks of the leader's side and top trumps, which cut off the search
+  at trick boundaries.
+* equivalence of touching cards. Only one card of a sequence is searched.
+* move ordering, which tries winners and leads to the partner's winners
+  first and cheap cards otherwise.
+
+Calculate the table of double dummy analysis of a deal::
+
+    >>> calc_dda(hands)
+    {<Player.N: 1>: {<Suit.C: 1>: 9, ...}, ...}
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from logging import getLogger
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .bit_hands import SUIT_BITS, BitHands, cards_to_mask, popcount
+from .dda_cache import DDACache, get_default_cache
+from .hands import Hands
+from .play_engine import NT_STRAIN, PlayEngine
+from .player import Player
+from .suit import Suit
+
+try:
+    from endplay.dds import calc_dd_table as _calc_dd_table
+    from endplay.types import Deal as _Deal, Denom as _Denom, \
+        Player as _DDSPlayer
+except ImportError:
+    _calc_dd_table = None
+
+logger = getLogger(__file__)
+
+# Suits of DDA tables.
+DDA_SUITS = (Suit.C, Suit.D, Suit.H, Suit.S, Suit.NT)
+
+# Whether DDS is available to calc_dda_masks.
+DDS_AVAILABLE = _calc_dd_table is not None
+
+if DDS_AVAILABLE:
+    _DDS_DENOMS = {Suit.C: _Denom.clubs, Suit.D: _Denom.diamonds,
+                   Suit.H: _Denom.hearts, Suit.S: _Denom.spades,
+                   Suit.NT: _Denom.nt}
+    _DDS_PLAYERS = {Player.N: _DDSPlayer.north, Player.E: _DDSPlayer.east,
+                    Player.S: _DDSPlayer.south, Player.W: _DDSPlayer.west}
+
+# Whether the fallback to DoubleDummySolver for complete deals was warned.
+_fallback_warned = False
+
+_SUIT_MASKS = tuple(SUIT_BITS << suit * 13 for suit in range(4))
+_CARD_SUIT_MASKS = tuple(SUIT_BITS << card // 13 * 13 for card in range(52))
+
+# int.bit_count is faster than popcount (Python >= 3.10).
+_popcount = getattr(int, 'bit_count', popcount)
+
+# Masks of relative ranks of the top k cards of a suit in all hands. Indexed by
+# k.
+_TOP_RANK_MASKS = tuple(
+    sum((SUIT_BITS >> k ^ SUIT_BITS) << shift for shift in (0, 13, 26, 39))
+    for k in range(14))
+
+
+@lru_cache(maxsize=1 << 16)
+def _relative_suit(packed: int) -> Tuple[int, int]:
+    # Replaces cards of a suit by their relative ranks. The highest remaining
+    # card becomes the ace and holders of cards keep the same order. Returns
+    # the relative ranks in the same packing and the lengths of the suit in 4
+    # hands packed in 4-bit fields. The key is 4 13-bit suit masks of N, E, S
+    # and W packed in an int.
+    hands = [packed >> shift & SUIT_BITS for shift in (0, 13, 26, 39)]
+    holders = [seat for rank in range(13) for seat in range(4)
+               if hands[seat] >> rank & 1]
+    relative = 0
+    for rank, seat in enumerate(holders, 13 - len(holders)):
+        relative |= 1 << (seat * 13 + rank)
+    lengths = 0
+    for seat in range(4):
+        lengths |= _popcount(hands[seat]) << seat * 4
+    return relative, lengths
+
+
+@lru_cache(maxsize=1 << 16)
+def _sequences(cards: int, others: int) -> Tuple[Tuple[int, int], ...]:
+    # Sequences of touching cards of a 13-bit suit mask, which no cards of
+    # others split. The lowest rank and the mask of each sequence in
+    # ascending order.
+    sequences: List[Tuple[int, int]] = []
+    previous = -1
+    while cards:
+        low = cards & -cards
+        cards ^= low
+        rank = low.bit_length() - 1
+        if sequences and not others & (low - (2 << previous)):
+            sequences[-1] = (sequences[-1][0], sequences[-1][1] | low)
+        else:
+            sequences.append((rank, low))
+        previous = rank
+    return tuple(sequences)
+
+
+@lru_cache(maxsize=None)  # at most 2 ** 13 * 14 entries
+def _top_cards(cards: int, k: int) -> int:
+    # The highest k cards of a 13-bit suit mask.
+    for _ in range(popcount(cards) - k):
+        cards &= cards - 1
+    return cards
+
+
+class DoubleDummySolver:
+    """Double dummy solver of a position at a trick boundary.
+
+    All hands must have the same number of cards.
+
+    :param hands: 52-bit masks of hands in the order of N, E, S and W.
+    :param trump: Strain of the trump. Suit.value - 1, and 4 is no trump.
+    :param table: Transposition table (DoubleDummySolver.table) of another
+        solver of the same deal. Positions without trumps are the same in all
+        strains, so solvers of the strains of a deal can share the table.
+    """
+
+    def __init__(self, hands: Sequence[int], trump: int,
+                 table: Optional[Dict[int, Dict[int, Dict[int, list]]]] = None
+                 ):
+        if len(hands) != 4:
+            raise ValueError('Hands of 4 players are required.')
+        if len({_popcount(hand) for hand in hands}) != 1:
+            raise ValueError('All hands must have the same number of cards.')
+        if hands[0] & hands[1] or hands[0] & hands[2] or \
+                hands[0] & hands[3] or hands[1] & hands[2] or \
+                hands[1] & hands[3] or hands[2] & hands[3]:
+            raise ValueError('A card is held by more than one player.')
+        if trump < 0 or NT_STRAIN < trump:
+            raise ValueError('trump strain is from 0 to 4')
+        self._hands: List[int] = list(hands)
+        self._trump = trump
+        self._trump_mask = 0 if trump == NT_STRAIN else _SUIT_MASKS[trump]
+        # transposition table. The key is the strain (no trump if no trumps
+        # remain), the leader and the lengths of suits, and entries are
+        # grouped by masks of relevant relative ranks. An entry [lower bound,
+        # upper bound, the numbers of relevant top cards of suits] matches
+        # positions whose masked relative ranks are the key of the entry.
+        self._table: Dict[int, Dict[int, Dict[int, list]]] = \
+            dict() if table is None else table
+        # the lead which cut off the last search of a position. It is tried
+        # first when the position is searched again for another target.
+        self._best_leads: Dict[Tuple[int, int], int] = dict()
+        self._best_lead = -1
+        self.nodes = 0  # the number of searched cards
+
+    @property
+    def table(self) -> Dict[int, Dict[int, Dict[int, list]]]:
+        """Transposition table, which can be shared with solvers of the same
+        deal."""
+        return self._table
+
+    @property
+    def trick_num(self) -> int:
+        """The number of remaining tricks."""
+        return _popcount(self._hands[0])
+
+    def ns_tricks(self, leader: int, guess: Optional[int] = None) -> int:
+        """Tricks taken by NS with double dummy play.
+
+        :param leader: Seat index of the leader (Player.value - 1).
+        :param guess: Guess of the result. A good guess saves time.
+        :return: The number of tricks taken by NS out of the remaining tricks.
+        """
+        lower, upper = 0, self.trick_num
+        table_key, relative = self._key(self._hands, leader)
+        for mask, entries in self._table.get(table_key, dict()).items():
+            entry = entries.get(relative & mask)
+            if entry is not None:
+                lower = max(lower, entry[0])
+                upper = min(upper, entry[1])
+        value = (lower + upper + 1) // 2 if guess is None else guess
+        while lower < upper:
+            target = min(max(value, lower + 1), upper)
+            bound = self._search_trick(leader, target)[0]
+            if bound >= target:
+                lower = bound
+                value = bound + 1
+            else:
+                upper = bound
+                value = bound
+        return lower
+
+    def declarer_tricks(self, declarer: Player,
+                        guess: Optional[int] = None) -> int:
+        """Tricks taken by the declarer's side.
+
+        The leader is the next player of the declarer.
+
+        :param declarer: Declarer.
+        :param guess: Guess of the result.
+        :return: The number of tricks taken by the declarer's side.
+        """
+        leader = declarer.next_player.value - 1
+        is_ns = declarer is Player.N or declarer is Player.S
+        if guess is not None and not is_ns:
+            guess = self.trick_num - guess
+        tricks = self.ns_tricks(leader, guess)
+        return tricks if is_ns else self.trick_num - tricks
+
+    def _key(self, hands: Sequence[int], leader: int) -> Tuple[int, int]:
+        # Key of the table and relative ranks of the hands. Suit s is at bit
+        # 52 * s of the relative ranks.
+        n, e, s, w = hands
+        strain = self._trump if (n | e | s | w) & self._trump_mask \
+            else NT_STRAIN
+        key = strain << 2 | leader
+        relative = 0
+        for shift in (39, 26, 13, 0):
+            suit_relative, lengths = _relative_suit(
+                (n >> shift & SUIT_BITS) | (e >> shift & SUIT_BITS) << 13
+                | (s >> shift & SUIT_BITS) << 26
+                | (w >> shift & SUIT_BITS) << 39)
+            key = key << 16 | lengths
+            relative = relative << 52 | suit_relative
+        return key, relative
+
+    def _store(self, table_key: int, relative: int, relevant: int,
+               remaining: int, bound: int, target: int) -> None:
+        # Stores a bound of a search for the target. Ranks of cards lower than
+        # relevant cards in each suit don't change the bound.
+        hands = self._hands
+        cards = hands[0] | hands[1] | hands[2] | hands[3]
+        mask = 0
+        tops = []
+        for suit, suit_mask in enumerate(_SUIT_MASKS):
+            suit_relevant = relevant & suit_mask
+            if suit_relevant:
+                lowest = (suit_relevant & -suit_relevant).bit_length() - 1
+                k = _popcount((cards & suit_mask) >> lowest)
+                mask |= _TOP_RANK_MASKS[k] << suit * 52
+            else:
+                k = 0
+            tops.append(k)
+        entries = self._table.setdefault(table_key, dict()).setdefault(
+            mask, dict())
+        entry = entries.get(relative & mask)
+        if entry is None:
+            entry = entries[relative & mask] = [0, remaining, tops]
+        if bound >= target:
+            entry[0] = max(entry[0], bound)
+        else:
+            entry[1] = min(entry[1], bound)
+
+    def _relevant_cards(self, tops: List[int]) -> int:
+        # Cards relevant to a table entry at the current position.
+        hands = self._hands
+        cards = hands[0] | hands[1] | hands[2] | hands[3]
+        relevant = 0
+        for shift, k in zip((0, 13, 26, 39), tops):
+            if k:
+                relevant |= _top_cards(cards >> shift & SUIT_BITS, k) << shift
+        return relevant
+
+    def _quick_tricks(self, leader: int) -> Tuple[int, int]:
+        # Tricks which the leader's side can cash from the top, and the cards
+        # of the tricks. Cards higher than all cards of the other players
+        # count, so the partner never overtakes, and the rest of the suit
+        # counts if the opponents and the partner are void after the top
+        # cards. In a trump contract, winners of a side suit are cashed first
+        # while the opponents who have trumps follow suit and the partner
+        # doesn't have to ruff, and then top trumps are cashed.
+        hands = self._hands
+        hand = hands[leader]
+        partner = hands[(leader + 2) & 3]
+        lho = hands[(leader + 1) & 3]
+        rho = hands[(leader + 3) & 3]
+        opponents = lho | rho
+        others = partner | opponents
+        trump_mask = self._trump_mask
+        ruffers = [opponent for opponent in (lho, rho)
+                   if opponent & trump_mask]
+        tricks = 0
+        side_tricks = 0
+        winners = 0
+        for suit_mask in _SUIT_MASKS:
+            own = hand & suit_mask
+            if not own:
+                continue
+            suit_others = others & suit_mask
+            if suit_others:
+                top = own >> suit_others.bit_length() << \
+                    suit_others.bit_length()
+                winners |= top
+                suit_tricks = _popcount(top)
+                if suit_tricks >= _popcount(partner & suit_mask) and \
+                        suit_tricks >= _popcount(lho & suit_mask) and \
+                        suit_tricks >= _popcount(rho & suit_mask):
+                    suit_tricks = _popcount(own)
+            else:
+                suit_tricks = _popcount(own)
+            if suit_mask == trump_mask:
+                tricks += suit_tricks
+                continue
+            for ruffer in ruffers:
+                suit_tricks = min(suit_tricks, _popcount(ruffer & suit_mask))
+            side_tricks += suit_tricks
+        if partner & trump_mask:
+            side_tricks = min(side_tricks, _popcount(partner & ~trump_mask))
+        tricks += side_tricks
+
+        # Then the leader leads a low card to the winners of the partner, if
+        # the opponents can't ruff and the partner keeps the winners.
+        if opponents & trump_mask:
+            return tricks, winners
+        partner_tricks = 0
+        partner_winners = 0
+        partner_num = _popcount(partner)
+        for suit_mask in _SUIT_MASKS:
+            own = hand & suit_mask
+            partner_suit = partner & suit_mask
+            if not own or not partner_suit:
+                continue
+            lower = (own | opponents) & suit_mask
+            top = partner_suit >> lower.bit_length() << lower.bit_length()
+            top_tricks = _popcount(top)
+            if not top_tricks:
+                continue
+            if top_tricks >= _popcount(own) and \
+                    top_tricks >= _popcount(lho & suit_mask) and \
+                    top_tricks >= _popcount(rho & suit_mask):
+                suit_tricks = _popcount(partner_suit)
+            else:
+                suit_tricks = top_tricks
+            if suit_tricks > partner_tricks and \
+                    partner_num - suit_tricks >= tricks:
+                partner_tricks = suit_tricks
+                partner_winners = top
+        return tricks + partner_tricks, winners | partner_winners
+
+    def _search_trick(self, leader: int, target: int) -> Tuple[int, int]:
+        # Searches whether NS can take target tricks out of the remaining
+        # tricks. Returns a bound of NS tricks, which is a lower bound not less
+        # than the target if NS can, or an upper bound less than the target
+        # otherwise, and cards whose ranks are relevant to the bound.
+        hands = self._hands
+        remaining = _popcount(hands[leader])
+        if target <= 0:
+            return 0, 0
+        if target > remaining:
+            return remaining, 0
+        if remaining == 1:
+            win_seat, relevant = self._last_trick(leader)
+            return 1 - (win_seat & 1), relevant
+
+        table_key, relative = self._key(hands, leader)
+        masks = self._table.get(table_key)
+        if masks is not None:
+            for mask, entries in masks.items():
+                entry = entries.get(relative & mask)
+                if entry is not None:
+                    if entry[0] >= target:
+                        return entry[0], self._relevant_cards(entry[2])
+                    if entry[1] < target:
+                        return entry[1], self._relevant_cards(entry[2])
+
+        quick_tricks, winners = self._quick_tricks(leader)
+        if leader & 1 == 0:
+            if quick_tricks >= target:
+                self._store(table_key, relative, winners, remaining,
+                            quick_tricks, target)
+                return quick_tricks, winners
+        elif remaining - quick_tricks < target:
+            self._store(table_key, relative, winners, remaining,
+                        remaining - quick_tricks, target)
+            return remaining - quick_tricks, winners
+
+        if self._trump_mask:
+            # top trumps of a player take tricks whoever leads
+            seat, trumps, relevant = self._top_trumps()
+            if seat & 1 == 0:
+                if trumps >= target:
+                    self._store(table_key, relative, relevant, remaining,
+                                trumps, target)
+                    return trumps, relevant
+            elif remaining - trumps < target:
+                self._store(table_key, relative, relevant, remaining,
+                            remaining - trumps, target)
+                return remaining - trumps, relevant
+
+        position_key = (table_key, relative)
+        self._best_lead = self._best_leads.get(position_key, -1)
+        bound, relevant = self._search_card(leader, 0, 0, -1, -1, 0, target)
+        if self._best_lead >= 0:
+            self._best_leads[position_key] = self._best_lead
+        self._store(table_key, relative, relevant, remaining, bound, target)
+        return bound, relevant
+
+    def _top_trumps(self) -> Tuple[int, int, int]:
+        # Seat index of the player who has the highest trump, the number of
+        # tricks taken by the trumps higher than all trumps of the other
+        # players, and the trumps if their ranks are relevant.
+        hands = self._hands
+        trumps = (hands[0] | hands[1] | hands[2] | hands[3]) & \
+            self._trump_mask
+        if not trumps:
+            return -1, 0, 0
+        top = trumps.bit_length() - 1
+        seat = 0
+        while not hands[seat] >> top & 1:
+            seat += 1
+        own = hands[seat] & trumps
+        others = trumps ^ own
+        if not others:
+            return seat, _popcount(own), 0
+        own = own >> others.bit_length() << others.bit_length()
+        return seat, _popcount(own), own
+
+    def _last_trick(self, leader: int) -> Tuple[int, int]:
+        # Seat index of the winner of the last trick, and the winning card if
+        # its rank is relevant.
+        hands = self._hands
+        win_seat = leader
+        win_card = hands[leader].bit_length() - 1
+        for position in (1, 2, 3):
+            seat = (leader + position) & 3
+            card = hands[seat].bit_length() - 1
+            if self._beats(card, win_card):
+                win_seat, win_card = seat, card
+        suit_cards = (hands[0] | hands[1] | hands[2] | hands[3]) & \
+            _CARD_SUIT_MASKS[win_card]
+        return win_seat, suit_cards & (suit_cards - 1) and 1 << win_card
+
+    def _beats(self, card: int, win_card: int) -> bool:
+        bit = 1 << card
+        if bit & _CARD_SUIT_MASKS[win_card]:
+            return card > win_card
+        return bool(bit & self._trump_mask)
+
+    def _search_card(self, leader: int, position: int, lead_mask: int,
+                     win_seat: int, win_card: int, trick_mask: int,
+                     target: int) -> Tuple[int, int]:
+        # Searches plays in a trick. trick_mask is cards played in the trick.
+        # Returns a bound of NS tricks including the trick and relevant cards
+        # in the same way as _search_trick.
+        hands = self._hands
+        seat = (leader + position) & 3
+        hand = hands[seat]
+        trump_mask = self._trump_mask
+        is_ns = seat & 1 == 0
+        best = -1 if is_ns else 14
+        all_relevant = 0
+        moves = self._ordered_moves(seat, position, lead_mask, win_seat,
+                                    win_card, trick_mask)
+        if position == 0:
+            first = self._best_lead
+            self._best_lead = -1
+            if first >= 0:
+                moves.sort(key=lambda move: not move[1] >> first & 1)
+        for card, sequence in moves:
+            self.nodes += 1
+            bit = 1 << card
+            hands[seat] = hand ^ bit
+            if position == 0:
+                next_win_seat, next_win_card = seat, card
+                next_lead_mask = _CARD_SUIT_MASKS[card]
+            elif (bit & _CARD_SUIT_MASKS[win_card] and card > win_card) or \
+                    (bit & trump_mask and not 1 << win_card & trump_mask):
+                next_win_seat, next_win_card = seat, card
+                next_lead_mask = lead_mask
+            else:
+                next_win_seat, next_win_card = win_seat, win_card
+                next_lead_mask = lead_mask
+            if position == 3:
+                ns_win = 1 - (next_win_seat & 1)
+                bound, relevant = self._search_trick(next_win_seat,
+                                                     target - ns_win)
+                bound += ns_win
+                # The winning card is relevant if it beats a card of the same
+                # suit.
+                suit_cards = (trick_mask | bit) & \
+                    _CARD_SUIT_MASKS[next_win_card]
+                if suit_cards & (suit_cards - 1):
+                    relevant |= 1 << next_win_card
+            else:
+                bound, relevant = self._search_card(
+                    leader, position + 1, next_lead_mask, next_win_seat,
+                    next_win_card, trick_mask | bit, target)
+            hands[seat] = hand
+            # The result is the same for the other cards of the sequence, if
+            # they swap for the card.
+            if relevant & sequence:
+                relevant |= sequence
+            if (bound >= target) is is_ns:
+                if position == 0:
+                    self._best_lead = card
+                return bound, relevant
+            best = max(best, bound) if is_ns else min(best, bound)
+            all_relevant |= relevant
+        return best, all_relevant
+
+    def _ordered_moves(self, seat: int, position: int, lead_mask: int,
+                       win_seat: int, win_card: int, trick_mask: int
+                       ) -> List[Tuple[int, int]]:
+        # Cards to search and masks of their sequences of touching cards.
+        hands = self._hands
+        hand = hands[seat]
+        legal = hand & lead_mask or hand
+        others = (hands[0] | hands[1] | hands[2] | hands[3] | trick_mask) \
+            ^ hand
+        trump_mask = self._trump_mask
+
+        # Cards are split into good cards (winners of the suit on lead, or
+        # cards beating the current winner) and the others, in ascending
+        # order. Only the lowest card of touching cards is searched.
+        good: List[Tuple[int, int]] = []
+        bad: List[Tuple[int, int]] = []
+        to_partner: List[Tuple[int, int]] = []
+        partner_hand = hands[(seat + 2) & 3]
+        opponents = hands[(seat + 1) & 3] | hands[(seat + 3) & 3]
+        for shift in (0, 13, 26, 39):
+            own = legal >> shift & SUIT_BITS
+            if not own:
+                continue
+            suit_others = others >> shift & SUIT_BITS
+            sequences = _sequences(own, suit_others)
+            if position == 0:
+                # the highest sequence wins if no other cards are higher
+                top_rank, top = sequences[-1]
+                if not suit_others >> top_rank:
+                    good.append((top_rank + shift, top << shift))
+                    sequences = sequences[:-1]
+                partner_suit = partner_hand >> shift & SUIT_BITS
+                moves = to_partner if partner_suit and \
+                    partner_suit.bit_length() > \
+                    (opponents >> shift & SUIT_BITS).bit_length() else bad
+                for rank, sequence in sequences:
+                    moves.append((rank + shift, sequence << shift))
+            elif 1 << shift & trump_mask and not 1 << win_card & trump_mask:
+                # trumps over a winner of another suit
+                for rank, sequence in sequences:
+                    good.append((rank + shift, sequence << shift))
+            else:
+                beats = shift <= win_card < shift + 13
+                for rank, sequence in sequences:
+                    if beats and rank + shift > win_card:
+                        good.append((rank + shift, sequence << shift))
+                    else:
+                        bad.append((rank + shift, sequence << shift))
+
+        if position == 0:
+            # winners first, leads to the partner's winners, then low cards
+            return good + to_partner + bad
+        if position == 1 or (win_seat - seat) & 1 == 0:
+            # second hand low, or the partner is winning
+            return bad + good
+        return good + bad
+
+
+def solve_position(engine: PlayEngine) -> int:
+    """Tricks taken by NS from a position of the playing phase.
+
+    :param engine: PlayEngine at a trick boundary.
+    :return: The number of tricks taken by NS out of the remaining tricks.
+    """
+    if engine.trick_cards:
+        raise ValueError('The position must be at a trick boundary.')
+    return DoubleDummySolver(engine.hands, engine.trump).ns_tricks(
+        engine.leader)
+
+
+def calc_dda_masks_python(hands: Sequence[int]
+                          ) -> Dict[Player, Dict[Suit, int]]:
+    """Calculates double dummy analysis by DoubleDummySolver.
+
+    It takes minutes for a complete deal. Use calc_dda_masks, which solves
+    complete deals by DDS if it is installed.
+
+    :param hands: 52-bit masks of hands in the order of N, E, S and W.
+    :return: Tricks taken by the declarer's side for each declarer and strain.
+    """
+    results: Dict[Tuple[Player, Suit], int] = dict()
+    table = None
+    # no trump is solved first, since positions of the other strains share
+    # the table after trumps are drawn.
+    for suit in reversed(DDA_SUITS):
+        solver = DoubleDummySolver(hands, suit.value - 1, table)
+        table = solver.table
+        guess = None
+        # a player and the partner often take the same tricks as declarers.
+        for declarer in (Player.N, Player.S, Player.E, Player.W):
+            tricks = solver.declarer_tricks(declarer, guess)
+            results[declarer, suit] = tricks
+            guess = tricks if declarer is not Player.S else \
+                solver.trick_num - tricks
+    return {p: {s: results[p, s] for s in DDA_SUITS} for p in Player}
+
+
+def calc_dda_masks_dds(hands: Sequence[int]) -> Dict[Player, Dict[Suit, int]]:
+    """Calculates double dummy analysis of a complete deal by DDS.
+
+    :param hands: 52-bit masks of hands in the order of N, E, S and W.
+    :return: Tricks taken by the declarer's side for each declarer and strain.
+    :raise ImportError: If endplay is not installed.
+    :raise ValueError: If a hand does not have 13 cards.
+    """
+    if _calc_dd_table is None:
+        raise ImportError("DDS is not available. Install endplay "
+                          "(pip install '.[dds]').")
+    if any(_popcount(hand) != 13 for hand in hands):
+        raise ValueError('DDS solves complete deals of 13 cards per hand.')
+    table = _calc_dd_table(_Deal(BitHands(*hands).to_pbn()))
+    return {p: {s: table[_DDS_DENOMS[s], _DDS_PLAYERS[p]] for s in DDA_SUITS}
+            for p in Player}
+
+
+def calc_dda_masks(hands: Sequence[int]) -> Dict[Player, Dict[Suit, int]]:
+    """Calculates double dummy analysis of all declarers and strains.
+
+    Complete deals are solved by DDS if it is available (see DDS_AVAILABLE),
+    and the others by DoubleDummySolver, which takes minutes for a complete
+    deal.
+
+    :param hands: 52-bit masks of hands in the order of N, E, S and W.
+    :return: Tricks taken by the declarer's side for each declarer and strain.
+    """
+    complete = all(_popcount(hand) == 13 for hand in hands)
+    if complete and DDS_AVAILABLE:
+        return calc_dda_masks_dds(hands)
+    if complete:
+        global _fallback_warned
+        if not _fallback_warned:
+            logger.warning('DDS is not installed (pip install endplay). '
+                           'Complete deals are solved by the slow Python '
+                           'solver, which takes minutes per deal.')
+            _fallback_warned = True
+    return calc_dda_masks_python(hands)
+
+
+def calc_dda(hands: Hands, cache: Optional[DDACache] = None
+             ) -> Dict[Player, Dict[Suit, int]]:
+    """Calculates double dummy analysis of a deal.
+
+    The result is looked up in and stored to the cache.
+
+    :param hands: Hands of 4 players.
+    :param cache: Cache of DDA tables. If None, the default cache is used
+        (see bridge_env.dda_cache).
+    :return: Tricks taken by the declarer's side for each declarer and strain,
+        the same format as BoardSetting.dda.
+    """
+    masks = (cards_to_mask(hands.north), cards_to_mask(hands.east),
+             cards_to_mask(hands.south), cards_to_mask(hands.west))
+    if cache is None:
+        cache = get_default_cache()
+    if cache is None:
+        return calc_dda_masks(masks)
+    dda = cache.get(masks)
+    if dda is None:
+        dda = calc_dda_masks(masks)
+        cache.put(masks, dda)
+    return dda
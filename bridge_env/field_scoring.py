@@ -0,0 +1,188 @@
+"""Scoring of a field of results on each board.
+
+Results are given as flat arrays of board ids and NS scores, one element per
+table and board. All results of a board are compared with each other after
+one sort of the whole field, so each method is O(n log n)::
+
+    >>> boards = np.array([1, 1, 1, 2, 2])
+    >>> scores = np.array([420, 420, -50, 110, 140])
+    >>> matchpoints(boards, scores)
+    array([1.5, 1.5, 0. , 0. , 1. ])
+
+Scores of EW are the opposite of NS, for example the EW matchpoints are
+(the number of results on the board - 1) - NS matchpoints.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple, Sequence, Union
+
+import numpy as np
+
+from .score import IMPS_THRESHOLDS, imps
+
+ArrayLike = Union[Sequence, np.ndarray]
+
+
+class _Field(NamedTuple):
+    # results sorted by the board and the score. Queries in the sorted order
+    # are fast since they access the keys sequentially.
+    order: np.ndarray  # indices of results in the sorted order
+    group: np.ndarray  # group index of the board of each sorted result
+    scores: np.ndarray  # sorted scores
+    keys: np.ndarray  # sorted keys of (group, score)
+    start: np.ndarray  # position of the first result of the board in keys
+    size: np.ndarray  # the number of results of the board
+    scale: int
+    offset: int
+
+    def count_less(self, values: np.ndarray) -> np.ndarray:
+        # the number of results of the board whose scores are < values
+        return np.searchsorted(
+            self.keys, self.group * self.scale + values + self.offset,
+            side='left') - self.start
+
+    def count_greater(self, values: np.ndarray) -> np.ndarray:
+        # the number of results of the board whose scores are > values
+        return self.start + self.size - np.searchsorted(
+            self.keys, self.group * self.scale + values + self.offset,
+            side='right')
+
+    def unsort(self, values: np.ndarray) -> np.ndarray:
+        result = np.empty_like(values)
+        result[self.order] = values
+        return result
+
+
+def _field(boards: ArrayLike, scores: ArrayLike, margin: int = 0) -> _Field:
+    boards = np.asarray(boards)
+    scores = np.asarray(scores, dtype=np.int64)
+    if boards.shape != scores.shape or scores.ndim != 1:
+        raise ValueError('boards and scores must be 1-D arrays of the same '
+                         'length.')
+    _, group = np.unique(boards, return_inverse=True)
+    # scores +- margin fit in [0, scale) after the offset
+    offset = int(np.abs(scores).max(initial=0)) + margin
+    scale = 2 * offset + 1
+    keys = group.reshape(-1) * scale + scores + offset
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    group = keys // scale
+    counts = np.bincount(group)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return _Field(order=order, group=group, scores=keys % scale - offset,
+                  keys=keys, start=starts[group], size=counts[group],
+                  scale=scale, offset=offset)
+
+
+def matchpoints(boards: ArrayLike, scores: ArrayLike) -> np.ndarray:
+    """Calculates matchpoints of NS.
+
+    A result gets 1 point for each result of the board it beats and 0.5 points
+    for each other result it ties.
+
+    :param boards: Board ids of results.
+    :param scores: NS scores of results.
+    :return: Matchpoints of NS.
+    """
+    field = _field(boards, scores)
+    return field.unsort(_matchpoints(field))
+
+
+def _matchpoints(field: _Field) -> np.ndarray:
+    less = field.count_less(field.scores)
+    ties = field.size - less - field.count_greater(field.scores) - 1
+    return less + ties * 0.5
+
+
+def percentages(boards: ArrayLike, scores: ArrayLike) -> np.ndarray:
+    """Calculates matchpoint percentages of NS.
+
+    A result which is the only one on the board gets 50%.
+
+    :param boards: Board ids of results.
+    :param scores: NS scores of results.
+    :return: Matchpoint percentages of NS. [0-100]
+    """
+    field = _field(boards, scores)
+    tops = field.size - 1
+    return field.unsort(np.where(
+        tops > 0, _matchpoints(field) * 100 / np.maximum(tops, 1), 50.))
+
+
+def cross_imps(boards: ArrayLike,
+               scores: ArrayLike,
+               average: bool = False) -> np.ndarray:
+    """Calculates cross-IMPs of NS.
+
+    Each result is compared with all other results of the board.
+
+    :param boards: Board ids of results.
+    :param scores: NS scores of results.
+    :param average: Whether to divide the IMPs by the number of comparisons.
+    :return: Total (or average) IMPs of NS.
+    """
+    field = _field(boards, scores, margin=IMPS_THRESHOLDS[-1])
+    total = np.zeros(len(field.keys), dtype=np.int64)
+    # IMPs are the number of thresholds the point difference reaches
+    for threshold in IMPS_THRESHOLDS:
+        total += field.count_less(field.scores - threshold + 1)
+        total -= field.count_greater(field.scores + threshold - 1)
+    if average:
+        comparisons = field.size - 1
+        return field.unsort(np.where(
+            comparisons > 0, total / np.maximum(comparisons, 1), 0.))
+    return field.unsort(total)
+
+
+def datums(boards: ArrayLike, scores: ArrayLike, trim: int = 1) -> np.ndarray:
+    """Calculates Butler datums of the boards of results.
+
+    A datum is the mean of NS scores of the board without the trim highest and
+    the trim lowest ones, rounded to the nearest 10. All scores are used if
+    the board has no more than 2 * trim results.
+
+    :param boards: Board ids of results.
+    :param scores: NS scores of results.
+    :param trim: The number of results dropped at each end.
+    :return: Datum of the board of each result.
+    """
+    if trim < 0:
+        raise ValueError('trim must not be negative.')
+    field = _field(boards, scores)
+    rank = np.arange(len(field.keys)) - field.start
+    used = (field.size <= 2 * trim) | \
+        ((trim <= rank) & (rank < field.size - trim))
+    sums = np.bincount(field.group, weights=np.where(used, field.scores, 0))
+    nums = np.bincount(field.group, weights=used)
+    means = sums / np.maximum(nums, 1)
+    rounded = (np.floor(means / 10 + 0.5) * 10).astype(np.int64)
+    return field.unsort(rounded[field.group])
+
+
+def butler_imps(boards: ArrayLike,
+                scores: ArrayLike,
+                trim: int = 1) -> np.ndarray:
+    """Calculates Butler IMPs of NS against the datum of each board.
+
+    :param boards: Board ids of results.
+    :param scores: NS scores of results.
+    :param trim: The number of results dropped at each end for the datum.
+    :return: IMPs of NS.
+    """
+    return imps(np.asarray(scores, dtype=np.int64) -
+                datums(boards, scores, trim))
+
+
+def bam(scores: ArrayLike, other_scores: ArrayLike) -> np.ndarray:
+    """Calculates board-a-match points of teams.
+
+    A team sits NS at the table of scores and EW at the table of other_scores.
+
+    :param scores: NS scores at the first table.
+    :param other_scores: NS scores at the second table of the same boards.
+    :return: Points of the team. 1 if it wins the board, 0.5 if it ties and 0
+        if it loses.
+    """
+    net = np.asarray(scores, dtype=np.int64) - \
+        np.asarray(other_scores, dtype=np.int64)
+    return (np.sign(net) + 1) / 2
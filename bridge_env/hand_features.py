@@ -0,0 +1,181 @@
+"""Hand evaluation features computed over numpy arrays.
+
+Functions accept a binary array whose last axis is 52 dims, where the index is
+the int representation of a card (int(card)). The array can be a hand (52,), a
+batch of hands (N, 52) or a batch of deals (N, 4, 52). Features are computed
+over the last axis by matrix products with precomputed weights, so the other
+axes are kept in outputs.
+
+Features of a single hand are also available from a 52-bit mask of the hand
+(see BitHands). The results are cached by the mask::
+
+    >>> hand_features(binary_to_mask(hand))  # hand is 52 dims binary vector
+    HandFeatures(hcp=..., suit_lengths=..., shape=..., controls=..., ltc=...)
+"""
+from functools import lru_cache
+from typing import NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+# High card points. A = 4, K = 3, Q = 2, J = 1.
+HCP_WEIGHTS = np.tile(np.array([0] * 9 + [1, 2, 3, 4], dtype=np.float32), 4)
+# Controls. A = 2, K = 1.
+CONTROL_WEIGHTS = np.tile(np.array([0] * 11 + [1, 2], dtype=np.float32), 4)
+# (52, 4) indicator matrix of suits (C, D, H, S).
+SUIT_WEIGHTS = np.repeat(np.eye(4, dtype=np.float32), 13, axis=0)
+# (52, 12) matrix to extract A, K and Q of each suit.
+# Column suit * 3 + (0: A, 1: K, 2: Q).
+_HONOR_WEIGHTS = np.zeros((52, 12), dtype=np.float32)
+_HONOR_WEIGHTS[[s * 13 + r for s in range(4) for r in (12, 11, 10)],
+               np.arange(12)] = 1
+
+# Columns of extract_features.
+FEATURE_NAMES = ('hcp',
+                 'length_c', 'length_d', 'length_h', 'length_s',
+                 'shape_1', 'shape_2', 'shape_3', 'shape_4',
+                 'controls', 'ltc')
+
+
+def _suit_losers(length: int, ace: bool, king: bool, queen: bool) -> int:
+    # Losing trick count of a suit. Only the top min(length, 3) cards count.
+    # A singleton has a loser unless it is the ace, and a doubleton counts
+    # the ace and the king.
+    honors = (ace, king, queen)[:min(length, 3)]
+    return min(length, 3) - sum(honors)
+
+
+# LTC table indexed by min(length, 3) * 8 + A * 4 + K * 2 + Q.
+_LTC_TABLE = np.array([_suit_losers(length, bool(h & 4), bool(h & 2),
+                                    bool(h & 1))
+                       for length in range(4) for h in range(8)],
+                      dtype=np.int32)
+
+
+def _as_float(binary: np.ndarray) -> np.ndarray:
+    return np.asarray(binary).astype(np.float32, copy=False)
+
+
+def hcp(binary: np.ndarray) -> np.ndarray:
+    """High card points.
+
+    :param binary: Binary array whose last axis is 52 dims.
+    :return: High card points. The shape is binary.shape[:-1].
+    """
+    return (_as_float(binary) @ HCP_WEIGHTS).astype(np.int32)
+
+
+def controls(binary: np.ndarray) -> np.ndarray:
+    """Controls. An ace is 2 controls and a king is 1 control.
+
+    :param binary: Binary array whose last axis is 52 dims.
+    :return: Controls. The shape is binary.shape[:-1].
+    """
+    return (_as_float(binary) @ CONTROL_WEIGHTS).astype(np.int32)
+
+
+def suit_lengths(binary: np.ndarray) -> np.ndarray:
+    """Lengths of suits.
+
+    :param binary: Binary array whose last axis is 52 dims.
+    :return: Lengths of suits in the order of C, D, H and S.
+        The shape is binary.shape[:-1] + (4,).
+    """
+    return (_as_float(binary) @ SUIT_WEIGHTS).astype(np.int32)
+
+
+def shape(binary: np.ndarray) -> np.ndarray:
+    """Shape of hands. Lengths of suits sorted in descending order.
+
+    :param binary: Binary array whose last axis is 52 dims.
+    :return: Sorted lengths. The shape is binary.shape[:-1] + (4,).
+    """
+    return -np.sort(-suit_lengths(binary), axis=-1)
+
+
+def ltc(binary: np.ndarray) -> np.ndarray:
+    """Losing trick count.
+
+    Each suit has losers in its top min(length, 3) cards which are not the
+    ace, the king or the queen.
+
+    :param binary: Binary array whose last axis is 52 dims.
+    :return: Losing trick count. The shape is binary.shape[:-1].
+    """
+    return _ltc(suit_lengths(binary), _as_float(binary))
+
+
+def _ltc(lengths: np.ndarray, binary: np.ndarray) -> np.ndarray:
+    honors = (binary @ _HONOR_WEIGHTS).astype(np.int32)
+    honors = honors.reshape(honors.shape[:-1] + (4, 3))
+    codes = np.minimum(lengths, 3) * 8 + honors @ np.array([4, 2, 1])
+    return _LTC_TABLE[codes].sum(axis=-1)
+
+
+def extract_features(binary: np.ndarray) -> np.ndarray:
+    """Extracts all features at once.
+
+    :param binary: Binary array whose last axis is 52 dims.
+    :return: int32 array of features. The shape is binary.shape[:-1] + (11,).
+        Columns are FEATURE_NAMES, that is, HCP, lengths of C, D, H and S,
+        shape (sorted lengths), controls and LTC.
+    """
+    binary = _as_float(binary)
+    lengths = (binary @ SUIT_WEIGHTS).astype(np.int32)
+    return np.concatenate([
+        (binary @ HCP_WEIGHTS).astype(np.int32)[..., np.newaxis],
+        lengths,
+        -np.sort(-lengths, axis=-1),
+        (binary @ CONTROL_WEIGHTS).astype(np.int32)[..., np.newaxis],
+        _ltc(lengths, binary)[..., np.newaxis]], axis=-1)
+
+
+class HandFeatures(NamedTuple):
+    """Features of a hand."""
+    hcp: int
+    suit_lengths: Tuple[int, int, int, int]  # C, D, H, S
+    shape: Tuple[int, int, int, int]  # sorted lengths in descending order
+    controls: int
+    ltc: int
+
+
+def binary_to_mask(binary: Sequence[int]) -> int:
+    """Converts a 52 dims binary vector of a hand to a 52-bit mask.
+
+    :param binary: 52 dims binary vector.
+    :return: 52-bit mask (see BitHands).
+    """
+    mask = 0
+    for i, b in enumerate(binary):
+        if b:
+            mask |= 1 << i
+    return mask
+
+
+@lru_cache(maxsize=None)
+def _suit_features(bits: int) -> Tuple[int, int, int, int]:
+    # length, HCP, controls and losers of a 13-bit suit mask.
+    length = bin(bits).count('1')
+    ace, king, queen, jack = (bool(bits >> i & 1) for i in (12, 11, 10, 9))
+    return (length,
+            4 * ace + 3 * king + 2 * queen + jack,
+            2 * ace + king,
+            _suit_losers(length, ace, king, queen))
+
+
+@lru_cache(maxsize=1 << 16)
+def hand_features(mask: int) -> HandFeatures:
+    """Features of a hand. The result is cached by the mask.
+
+    :param mask: 52-bit mask of a hand (see BitHands).
+    :return: Features of the hand.
+    """
+    suits = [_suit_features(mask >> shift & 0x1fff)
+             for shift in (0, 13, 26, 39)]
+    lengths = (suits[0][0], suits[1][0], suits[2][0], suits[3][0])
+    s1, s2, s3, s4 = sorted(lengths, reverse=True)
+    return HandFeatures(
+        hcp=sum(s[1] for s in suits),
+        suit_lengths=lengths,
+        shape=(s1, s2, s3, s4),
+        controls=sum(s[2] for s in suits),
+        ltc=sum(s[3] for s in suits))
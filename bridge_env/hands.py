@@ -7,6 +7,7 @@ from typing import Dict, List, Set, Tuple
 import numpy as np
 
 from .card import Card
+from .deal_ordinal import masks_to_ordinal, ordinal_to_masks
 from .player import Player
 from .suit import Suit
 
@@ -110,6 +111,36 @@ class Hands:
                 Player.S: self.south,
                 Player.W: self.west}
 
+    def to_ordinal(self) -> int:
+        """Converts a complete deal to the ordinal.
+
+        The ordinal is a bijective index of the deal among all deals, which
+        fits in 96 bits. See bridge_env.deal_ordinal for the encoding.
+
+        :return: Ordinal of the deal.
+        """
+        masks = []
+        for hand in (self.north, self.east, self.south, self.west):
+            mask = 0
+            for card in hand:
+                mask |= 1 << int(card)
+            masks.append(mask)
+        return masks_to_ordinal(masks)
+
+    @classmethod
+    def from_ordinal(cls, ordinal: int) -> Hands:
+        """Converts an ordinal to Hands object.
+
+        :param ordinal: Ordinal of a deal.
+        :return: Hands instance of the ordinal.
+        """
+        hands = [{Card.int_to_card(i) for i in range(52) if mask >> i & 1}
+                 for mask in ordinal_to_masks(ordinal)]
+        return Hands(north_hand=hands[0],
+                     east_hand=hands[1],
+                     south_hand=hands[2],
+                     west_hand=hands[3])
+
     @classmethod
     def convert_binary(cls,
                        binary_hands: Dict[Player, Tuple[int, ...]]) -> Hands:
@@ -185,22 +216,15 @@ class Hands:
 
     @staticmethod
     def _hand_parser(pbn_hand: str) -> Set[Card]:
-        cards: Set[Card] = set()
         if pbn_hand == '-':
-            return cards
+            return set()
         match = re.match(HAND_PATTERN, pbn_hand)
         if not match:
             raise Exception(f'Parse exception. "{pbn_hand}" does not match '
                             f'the pattern.')
-        mapped_ranks = {Suit.S: match.group(1),
-                        Suit.H: match.group(2),
-                        Suit.D: match.group(3),
-                        Suit.C: match.group(4)}
-
-        for suit, rank in mapped_ranks.items():
-            for r in rank:
-                cards.add(Card(Card.rank_str_to_int(r), suit))
-        return cards
+        # holdings are in the order of S, H, D and C
+        return {Card.str_to_card(suit + r)
+                for suit, ranks in zip('SHDC', match.groups()) for r in ranks}
 
     @classmethod
     def generate_random_hands(cls) -> Hands:
@@ -215,8 +239,8 @@ class Hands:
 
         :return: Randomly generated Hands.
         """
-        cards = [Card(rank, suit) for rank in range(2, 15) for suit in Suit
-                 if suit is not Suit.NT]
+        cards = [Card.rank_suit_to_card(rank, suit) for rank in range(2, 15)
+                 for suit in Suit if suit is not Suit.NT]
         random.shuffle(cards)
         return Hands(north_hand=set(cards[0:13]),
                      east_hand=set(cards[13: 26]),
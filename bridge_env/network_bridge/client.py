@@ -148,7 +148,8 @@ class Client(SocketInterface, MessageInterface):
             for rank in ranks:
                 if rank == '-':
                     continue
-                card = Card(Card.rank_str_to_int(rank), suit)
+                card = Card.rank_suit_to_card(Card.rank_str_to_int(rank),
+                                              suit)
                 hand_set.add(card)
                 hand_list[int(card)] = 1
         return hand_set, tuple(hand_list)
@@ -11,16 +11,18 @@ import time
 from logging import getLogger
 from queue import Queue
 from threading import Event, Thread
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from .socket_interface import MessageInterface, SocketInterface
 from .. import Bid, BiddingPhase, BiddingPhaseState, Card, Contract, Hands, \
     Pair, Player, Suit, Vul
 from ..data_handler.abstract_classes import BoardSetting, Parser
-from ..data_handler.json_handler.parser import JsonParser
-from ..data_handler.json_handler.writer import JsonLogWriter
+from ..data_handler.board_index import IndexedBoardSettings
+from ..data_handler.json_handler.parser import JsonLinesParser, JsonParser
+from ..data_handler.json_handler.writer import JsonLinesLogWriter, \
+    JsonLogWriter, recover_json_lines
 from ..data_handler.pbn_handler.parser import PbnParser
-from ..data_handler.pbn_handler.writer import Scoring
+from ..data_handler.pbn_handler.writer import PbnLogWriter, Scoring
 from ..playing_phase import PlayingHistory, PlayingPhaseWithHands
 from ..score import calc_score
 
@@ -367,20 +369,29 @@ class Server(SocketInterface):
                  ip_address: str,
                  port: int,
                  output_file_path: pathlib.Path,
-                 board_settings: Optional[List[BoardSetting]] = None):
+                 board_settings: Optional[Sequence[BoardSetting]] = None,
+                 append_log: bool = False):
         """
 
         :param ip_address:
         :param port: The port numbers should be within the standard range of
             1024 to 5000.
+        :param output_file_path: Path of the log file (.json, .jsonl or
+            .pbn).
+        :param board_settings: Board settings to play.
+        :param append_log: Whether logs are appended to the existing log file.
+            The log file must be JSON Lines (.jsonl).
         """
         super().__init__(ip_address=ip_address, port=port)
 
         self.board_settings = board_settings
 
-        if output_file_path.suffix != '.json':
-            raise NotImplementedError('PBN format is not supported.')
+        if output_file_path.suffix not in ('.json', '.jsonl', '.pbn'):
+            raise ValueError('Log file is neither PBN, JSON or JSON Lines.')
+        if append_log and output_file_path.suffix != '.jsonl':
+            raise ValueError('Logs can be appended only to a JSON Lines file.')
         self.output_file_path = output_file_path
+        self.append_log = append_log
 
         self.sent_message_queues: Dict[Player, Queue] = {Player.N: Queue(),
                                                          Player.E: Queue(),
@@ -620,8 +631,16 @@ class Server(SocketInterface):
         max_board_num = 101 if self.board_settings is None else len(
             self.board_settings) + 1
 
-        with open(self.output_file_path, 'w') as fw:
-            game_log_writer = JsonLogWriter(fw)
+        with open(self.output_file_path, 'a' if self.append_log else 'w') \
+                as fw:
+            game_log_writer: Union[JsonLogWriter, PbnLogWriter]
+            if self.output_file_path.suffix == '.jsonl':
+                game_log_writer = JsonLinesLogWriter(fw)
+            elif self.output_file_path.suffix == '.pbn':
+                # games are streamed to the file as they finish
+                game_log_writer = PbnLogWriter(fw)
+            else:
+                game_log_writer = JsonLogWriter(fw)
             game_log_writer.open()
             for board_number in range(1, max_board_num):
                 cards, vul, dealer, board_id, dda = None, None, None, None, None
@@ -703,6 +722,32 @@ class Server(SocketInterface):
             thread.join()
 
 
+def resume_index(log_path: pathlib.Path,
+                 board_settings: Sequence[BoardSetting]) -> int:
+    """Finds the index of the board to resume a session.
+
+    An incomplete last line of the log is removed.
+
+    :param log_path: Path of the log file (.jsonl).
+    :param board_settings: Board settings of the session.
+    :return: Index of the board after the last completed board. 0 if the log
+        doesn't exist or is empty.
+    """
+    if log_path.suffix != '.jsonl':
+        raise Exception('File type error. Only JSON Lines log can be resumed.')
+    if not log_path.exists():
+        return 0
+    last = recover_json_lines(log_path)
+    if last is None:
+        return 0
+    for i, board_setting in enumerate(board_settings):
+        if board_setting.board_id == last['board_id']:
+            logger.info(f'The last completed board is {last["board_id"]}.')
+            return i + 1
+    raise Exception(f'Board {last["board_id"]} in the log is not found in the '
+                    f'board settings.')
+
+
 def main() -> None:
     """Script to run a network bridge server.
 
@@ -722,18 +767,25 @@ def main() -> None:
     parser.add_argument('-b', '--board_setting',
                         default='',
                         type=str,
-                        help='Board settings file (.json or .pbn).')
-    parser.add_argument('-r', '--restart_index',
-                        default=0,
-                        type=int,
-                        help='Index of board settings to restart. '
-                             '(0-idx, default=0)')
+                        help='Board settings file (.json, .jsonl or .pbn).')
+    start_group = parser.add_mutually_exclusive_group()
+    start_group.add_argument('-r', '--restart_index',
+                             default=0,
+                             type=int,
+                             help='Index of board settings to restart. '
+                                  '(0-idx, default=0)')
     parser.add_argument('-o', '--output_file',
                         default='output.json',
                         type=str,
-                        help='Output file path (.json or .pbn file). '
-                             'File will be overwritten. '
+                        help='Output file path (.json, .jsonl or .pbn '
+                             'file). File will be overwritten. '
                              '(default="output.json")')
+    start_group.add_argument('--resume',
+                             action='store_true',
+                             help='Resume the session after the last '
+                                  'completed board in the output file '
+                                  '(.jsonl). Logs are appended to the file. '
+                                  'Not allowed with --restart_index.')
 
     # TODO: Implement a selection to proceed a next board on cli
     # TODO: Add an option to save board results.
@@ -748,17 +800,30 @@ def main() -> None:
             board_setting_parser = PbnParser()
         elif path.suffix == '.json':
             board_setting_parser = JsonParser()
+        elif path.suffix == '.jsonl':
+            board_setting_parser = JsonLinesParser()
         else:
             raise Exception('File type error. '
                             'Board setting file is neither PBN or JSON.')
-        # TODO: Consider streaming
-        with open(path, 'r') as fp:
-            board_settings = board_setting_parser.parse_board_settings(fp)
+        try:
+            # boards are parsed on access with the sidecar index
+            board_settings = IndexedBoardSettings.open(path,
+                                                       board_setting_parser)
+        except ValueError as e:
+            logger.info(f'Board settings are not indexed. {e}')
+            with open(path, 'r') as fp:
+                board_settings = board_setting_parser.parse_board_settings(fp)
 
         original_len = len(board_settings)
 
         # Set board settings with restart index.
         restart_idx = args.restart_index
+        if args.resume:
+            restart_idx = resume_index(pathlib.Path(args.output_file),
+                                       board_settings)
+            if restart_idx == len(board_settings):
+                logger.info(f'All boards in {path} are already played.')
+                return
         if restart_idx < 0 or len(board_settings) <= restart_idx:
             raise IndexError('Restart index is out of range.')
         board_settings = board_settings[restart_idx:]
@@ -766,6 +831,8 @@ def main() -> None:
         logger.info(f'Board settings are imported from {path}. '
                     f'Board nums = {original_len}. '
                     f'First board index = {restart_idx} (0-idx).')
+    elif args.resume:
+        raise Exception('Board setting file is required to resume.')
     else:
         logger.info('File of board settings is not set. '
                     'Board settings will be randomly generated. '
@@ -774,5 +841,6 @@ def main() -> None:
     with Server(ip_address=args.ip_address,
                 port=args.port,
                 board_settings=board_settings,
-                output_file_path=pathlib.Path(args.output_file)) as server:
+                output_file_path=pathlib.Path(args.output_file),
+                append_log=args.resume) as server:
         server.run()
@@ -144,5 +144,5 @@ class MessageInterface:
         match = MessageInterface.parse_match_base(pattern, content)
         card_str = match.group(1).upper()
         if card_str[0] in {'S', 'H', 'D', 'C'}:
-            return Card(Card.rank_str_to_int(card_str[1]), Suit[card_str[0]])
-        return Card(Card.rank_str_to_int(card_str[0]), Suit[card_str[1]])
+            return Card.str_to_card(card_str[:2])
+        return Card.str_to_card(card_str[1] + card_str[0])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Tuple
 
 from .vul import Vul
 
@@ -24,7 +25,7 @@ class Pair(Enum):
         :return: Opponent pair of the pair.
         :rtype: Pair
         """
-        return Pair(3 - self.value)
+        return _OPPONENT_PAIR[self._value_ - 1]
 
     def is_vul(self, vul: Vul) -> bool:
         """Check the pair is vulnerable.
@@ -33,4 +34,11 @@ class Pair(Enum):
         :return: Whether the pair is vulnerable.
         :rtype: bool
         """
-        return vul is Vul.BOTH or vul.name == self.name
+        return _VULNERABLE[self._value_ - 1][vul._value_ - 1]
+
+
+_OPPONENT_PAIR: Tuple[Pair, ...] = (Pair.EW, Pair.NS)
+# _VULNERABLE[pair.value - 1][vul.value - 1]
+_VULNERABLE: Tuple[Tuple[bool, ...], ...] = (
+    tuple(v is Vul.BOTH or v is Vul.NS for v in Vul),
+    tuple(v is Vul.BOTH or v is Vul.EW for v in Vul))
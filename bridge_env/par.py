@@ -0,0 +1,216 @@
+"""Par score calculation from double dummy analysis.
+
+Par is the result of the auction when both sides know the DDA table and bid
+perfectly. A contract is doubled if it goes down, and either side may outbid
+the other side, for example with a sacrifice::
+
+    >>> result = calc_par(board_setting.dda, board_setting.vul)
+    >>> result.score  # NS score
+    500
+    >>> [f'{c} {c.declarer}' for c in result.contracts]
+    ['4NTX E', '4NTX W', '5HX E', '5HX W']
+
+The auction is modeled as a game where a side bids a contract and the other
+side either passes or outbids it. The side of the dealer bids first, which
+matters only in rare deals where both sides can make the same contracts.
+
+calc_par_scores calculates par scores of many boards at once from an array of
+DDA tables with the shape (N, 4, 5), indexed by [board, declarer, strain] in
+the order of N, E, S, W and C, D, H, S, NT.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, NamedTuple, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from .bid import BIDS
+from .contract import Contract
+from .player import Player
+from .score import SCORE_TABLE
+from .suit import Suit
+from .vul import Vul
+
+_PLAYERS = (Player.N, Player.E, Player.S, Player.W)
+_STRAINS = (Suit.C, Suit.D, Suit.H, Suit.S, Suit.NT)
+_BID_INDICES = np.arange(35)
+_BID_STRAINS = _BID_INDICES % 5
+_BID_LEVELS = _BID_INDICES // 5 + 1
+
+# Declarer's score indexed by [bid.idx, vul, taken tricks]. The contract is
+# not doubled if it makes, and is doubled if it goes down.
+_PAR_SCORE_TABLE = np.where(
+    np.arange(14)[None, None, :] >= _BID_LEVELS[:, None, None] + 6,
+    SCORE_TABLE[:, 0], SCORE_TABLE[:, 1])
+
+
+class ParResult(NamedTuple):
+    """Par of a board.
+
+    :param score: Par score of NS.
+    :param contracts: Par contracts with the declarers. Empty if passed out.
+    """
+    score: int
+    contracts: List[Contract]
+
+
+def _sign(side: int) -> int:
+    # sign of scores of the side in NS scores
+    return 1 if side == 0 else -1
+
+
+def _is_vul(vul: Vul, ns: bool) -> bool:
+    return vul is Vul.BOTH or vul is (Vul.NS if ns else Vul.EW)
+
+
+def _side_arrays(vul: Union[Vul, Sequence[Vul]],
+                 dealer: Union[Player, Sequence[Player]],
+                 n: int) -> Tuple[np.ndarray, np.ndarray]:
+    vuls = [vul] * n if isinstance(vul, Vul) else vul
+    dealers = [dealer] * n if isinstance(dealer, Player) else dealer
+    if len(vuls) != n or len(dealers) != n:
+        raise ValueError('The numbers of boards, vul and dealers differ.')
+    side_vul = np.array([[_is_vul(v, True) for v in vuls],
+                         [_is_vul(v, False) for v in vuls]], dtype=np.int64)
+    dealer_ew = np.array([d in (Player.E, Player.W) for d in dealers])
+    return side_vul, dealer_ew
+
+
+def _final_scores(tricks: np.ndarray, side_vul: np.ndarray) -> np.ndarray:
+    # NS scores when the side declares the contract and it is passed,
+    # indexed by [side, bid.idx, board].
+    side_tricks = np.stack([np.maximum(tricks[:, 0], tricks[:, 2]),
+                            np.maximum(tricks[:, 1], tricks[:, 3])])
+    scores = _PAR_SCORE_TABLE[_BID_INDICES[:, None],
+                              side_vul[:, None, :],
+                              side_tricks[:, :, _BID_STRAINS].transpose(
+                                  0, 2, 1)]
+    scores[1] *= -1
+    return scores
+
+
+def _auction_values(final: np.ndarray
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+    # values[s, r]: NS score when the side s bids the contract r and the other
+    # side is to act. best[s]: NS score when the side s bids its best contract
+    opts = (np.maximum, np.minimum)
+    values = np.empty_like(final)
+    best = [None, None]
+    for r in range(34, -1, -1):
+        for s in range(2):
+            o = 1 - s
+            value = final[s, r]
+            if best[o] is not None:
+                value = opts[o](value, best[o])
+            values[s, r] = value
+        for s in range(2):
+            best[s] = values[s, r] if best[s] is None \
+                else opts[s](best[s], values[s, r])
+    return values, np.stack(best)
+
+
+def _par_scores(best: np.ndarray, dealer_ew: np.ndarray) -> np.ndarray:
+    # the auction is passed out after each side passes twice
+    ns, ew = best
+    ns_first = np.maximum(ns, np.minimum(ew, np.maximum(ns,
+                                                        np.minimum(ew, 0))))
+    ew_first = np.minimum(ew, np.maximum(ns, np.minimum(ew,
+                                                        np.maximum(ns, 0))))
+    return np.where(dealer_ew, ew_first, ns_first)
+
+
+def _to_tricks(dda: Dict[Player, Dict[Suit, int]]) -> np.ndarray:
+    return np.array([[[dda[p][s] for s in _STRAINS] for p in _PLAYERS]],
+                    dtype=np.int64)
+
+
+def calc_par_scores(tricks: np.ndarray,
+                    vul: Union[Vul, Sequence[Vul]],
+                    dealer: Union[Player, Sequence[Player]] = Player.N
+                    ) -> np.ndarray:
+    """Calculates par scores of boards.
+
+    :param tricks: Tricks taken by the declarer's side with the shape
+        (N, 4, 5), indexed by [board, declarer, strain].
+    :param vul: Vulnerability of all boards or of each board.
+    :param dealer: Dealer of all boards or of each board.
+    :return: Par scores of NS with the shape (N,).
+    """
+    tricks = np.asarray(tricks, dtype=np.int64)
+    if tricks.ndim != 3 or tricks.shape[1:] != (4, 5):
+        raise ValueError('The shape of tricks must be (N, 4, 5).')
+    side_vul, dealer_ew = _side_arrays(vul, dealer, len(tricks))
+    _, best = _auction_values(_final_scores(tricks, side_vul))
+    return _par_scores(best, dealer_ew)
+
+
+def calc_par(dda: Dict[Player, Dict[Suit, int]],
+             vul: Vul,
+             dealer: Player = Player.N) -> ParResult:
+    """Calculates the par score and the par contracts of a board.
+
+    Par contracts of the same side and strain are the lowest ones, and a
+    sacrifice is a par contract only if it outbids a better contract of the
+    other side.
+
+    :param dda: Tricks taken by the declarer's side for each declarer and
+        strain, the same format as BoardSetting.dda.
+    :param vul: Vulnerability.
+    :param dealer: Dealer.
+    :return: Par of the board.
+    """
+    tricks = _to_tricks(dda)
+    side_vul, dealer_ew = _side_arrays(vul, dealer, 1)
+    final = _final_scores(tricks, side_vul)
+    values, best = _auction_values(final)
+    score = int(_par_scores(best, dealer_ew)[0])
+    final, values, best = final[:, :, 0], values[:, :, 0], best[:, 0]
+
+    found: Set[Tuple[int, int]] = set()
+    visited: Set[Tuple[int, int]] = set()
+
+    def collect(r: int, s: int) -> None:
+        # optimal continuations after the side s bids the contract r
+        if (r, s) in visited:
+            return
+        visited.add((r, s))
+        if final[s, r] == score:
+            found.add((r, s))
+        for higher in range(r + 1, 35):
+            if values[1 - s, higher] == score:
+                collect(higher, 1 - s)
+
+    first = int(dealer_ew[0])
+    second = 1 - first
+    opts = (max, min)
+    # NS score when the first side passes
+    passed = opts[second](int(best[second]), opts[first](
+        int(best[first]), opts[second](int(best[second]), 0)))
+    for s, optimal in ((first, True), (second, passed == score)):
+        if optimal and best[s] == score:
+            for r in range(35):
+                if values[s, r] == score:
+                    collect(r, s)
+
+    lowest: Dict[Tuple[int, int], int] = dict()
+    for r, s in found:
+        if _sign(s) * final[s, r] < 0 and \
+                not (_sign(1 - s) * (final[1 - s, :r] - score) > 0).any():
+            # a sacrifice must outbid a better contract of the other side
+            continue
+        key = (s, r % 5)
+        lowest[key] = min(lowest.get(key, r), r)
+    contracts = []
+    for (s, strain), r in sorted(lowest.items(), key=lambda x: x[1]):
+        bid = BIDS[r]
+        assert bid.level is not None
+        side_tricks = max(tricks[0, s, strain], tricks[0, s + 2, strain])
+        for player in (_PLAYERS[s], _PLAYERS[s + 2]):
+            if tricks[0, player.value - 1, strain] == side_tricks:
+                contracts.append(Contract(
+                    final_bid=bid,
+                    x=side_tricks < bid.level + 6,
+                    vul=vul,
+                    declarer=player))
+    contracts.sort(key=lambda c: (c.final_bid.idx, c.declarer.value))
+    return ParResult(score=score, contracts=contracts)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Tuple
 
 from .pair import Pair
 from .vul import Vul
@@ -37,15 +38,7 @@ class Player(Enum):
             'North', 'East', 'South' or 'West'.
         :rtype: str
         """
-        if self.name == 'N':
-            return 'North'
-        elif self.name == 'E':
-            return 'East'
-        elif self.name == 'S':
-            return 'South'
-        elif self.name == 'W':
-            return 'West'
-        raise ValueError(f'Unexpected value {self.name} is used.')
+        return _FORMAL_NAMES[self._value_ - 1]
 
     @property
     def next_player(self) -> Player:
@@ -54,7 +47,7 @@ class Player(Enum):
         :return: The next player, who is on the left of the player
         :rtype: Player
         """
-        return self.left
+        return _LEFT[self._value_ - 1]
 
     @property
     def partner(self) -> Player:
@@ -63,7 +56,7 @@ class Player(Enum):
         :return: The partner player
         :rtype: Player
         """
-        return Player((self.value + 1) % 4 + 1)
+        return _PARTNER[self._value_ - 1]
 
     @property
     def left(self) -> Player:
@@ -72,7 +65,7 @@ class Player(Enum):
         :return: A player who is on the left of the player
         :rtype: Player
         """
-        return Player(self.value % 4 + 1)
+        return _LEFT[self._value_ - 1]
 
     @property
     def right(self):
@@ -81,7 +74,7 @@ class Player(Enum):
         :return: A player who is on the right of the player
         :rtype: Player
         """
-        return Player((self.value + 2) % 4 + 1)
+        return _RIGHT[self._value_ - 1]
 
     @property
     def pair(self) -> Pair:
@@ -90,7 +83,7 @@ class Player(Enum):
         :return: a pair of the player
         :rtype: Pair
         """
-        return Pair((self.value + 1) % 2 + 1)
+        return _PAIR[self._value_ - 1]
 
     @property
     def opponent_pair(self) -> Pair:
@@ -108,7 +101,7 @@ class Player(Enum):
         :return: Whether a player is the partner or one's self.
         :rtype: bool
         """
-        return player.value % 2 == self.value % 2
+        return player._value_ % 2 == self._value_ % 2
 
     def is_vul(self, vul: Vul) -> bool:
         """Check whether the player is vulnerable
@@ -130,3 +123,20 @@ class Player(Enum):
         elif formal_name == 'West':
             return cls.W
         raise ValueError(f'Player\'s formal name is not correct: {formal_name}')
+
+
+# Players in the order of the 0-index of players (player.value - 1).
+PLAYERS: Tuple[Player, ...] = (Player.N, Player.E, Player.S, Player.W)
+
+# Lookup tables indexed by the 0-index of a player. Values are 0-indexes of
+# players (or pairs), so that engines can work on raw ints.
+LEFT_IDX: Tuple[int, ...] = (1, 2, 3, 0)
+PARTNER_IDX: Tuple[int, ...] = (2, 3, 0, 1)
+RIGHT_IDX: Tuple[int, ...] = (3, 0, 1, 2)
+PAIR_IDX: Tuple[int, ...] = (0, 1, 0, 1)  # pair.value - 1
+
+_LEFT = tuple(PLAYERS[i] for i in LEFT_IDX)
+_PARTNER = tuple(PLAYERS[i] for i in PARTNER_IDX)
+_RIGHT = tuple(PLAYERS[i] for i in RIGHT_IDX)
+_PAIR = tuple(Pair(i + 1) for i in PAIR_IDX)
+_FORMAL_NAMES = ('North', 'East', 'South', 'West')
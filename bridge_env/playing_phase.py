@@ -2,12 +2,14 @@ from dataclasses import dataclass
 from typing import List, Optional, Set, Tuple
 
 from . import Hands, Pair
+from ._dataclass_slots import add_slots
 from .card import Card
 from .contract import Contract
 from .player import Player
 from .suit import Suit
 
 
+@add_slots
 @dataclass(frozen=True)
 class TrickHistory:
     """History of a trick."""
@@ -1,5 +1,14 @@
-"""Contract bridge scoring module."""
-from .bid import Bid
+"""Contract bridge scoring module.
+
+Scores are looked up in SCORE_TABLE, which is precomputed at import.
+calc_scores and imps work on whole NumPy arrays of results at once.
+"""
+from bisect import bisect_right
+from typing import Union
+
+import numpy as np
+
+from .bid import BIDS, Bid
 from .contract import Contract
 
 _MINOR = 20
@@ -40,20 +49,22 @@ _DOWN_XX_VUL = (-400, -1000, -1600, -2200, -2800,
                 -3400, -4000, -4600, -5200, -5800,
                 -6400, -7000, -7600)
 
-_IMPS_LIST = (20, 50, 90, 130, 170,
-              220, 270, 320, 370, 430,
-              500, 600, 750, 900, 1100,
-              1300, 1500, 1750, 2000, 2250,
-              2500, 3000, 3500, 4000)
+# Least point differences of 1 to 24 IMPs.
+IMPS_THRESHOLDS = (20, 50, 90, 130, 170,
+                   220, 270, 320, 370, 430,
+                   500, 600, 750, 900, 1100,
+                   1300, 1500, 1750, 2000, 2250,
+                   2500, 3000, 3500, 4000)
 
 
-def calc_bid_score(bid: Bid,
-                   x: bool,
-                   xx: bool,
-                   vul: bool,
-                   taken_trick_num: int) -> int:
-    if bid in (Bid.Pass, Bid.X, Bid.XX):
-        raise ValueError('bid must not be {Pass, X, XX}.')
+_IMPS_ARRAY = np.array(IMPS_THRESHOLDS)
+
+
+def _calc_bid_score(bid: Bid,
+                    x: bool,
+                    xx: bool,
+                    vul: bool,
+                    taken_trick_num: int) -> int:
     assert bid.level is not None
     assert bid.suit is not None
 
@@ -106,6 +117,66 @@ def calc_bid_score(bid: Bid,
         return score
 
 
+def _build_score_table() -> np.ndarray:
+    table = np.empty((35, 3, 2, 14), dtype=np.int32)
+    for bid in BIDS[:35]:
+        for doubled in range(3):
+            for vul in range(2):
+                for tricks in range(14):
+                    table[bid.idx, doubled, vul, tricks] = _calc_bid_score(
+                        bid, x=doubled == 1, xx=doubled == 2, vul=vul == 1,
+                        taken_trick_num=tricks)
+    table.flags.writeable = False
+    return table
+
+
+# Scores of the declarer indexed by
+# [bid.idx, doubled state, vul, taken tricks]. Doubled state is 0 (not
+# doubled), 1 (doubled) or 2 (redoubled), and vul is 0 (not vulnerable) or 1
+# (vulnerable).
+SCORE_TABLE = _build_score_table()
+
+
+def calc_bid_score(bid: Bid,
+                   x: bool,
+                   xx: bool,
+                   vul: bool,
+                   taken_trick_num: int) -> int:
+    if bid in (Bid.Pass, Bid.X, Bid.XX):
+        raise ValueError('bid must not be {Pass, X, XX}.')
+    if not 0 <= taken_trick_num <= 13:
+        raise ValueError('taken_trick_num must be from 0 to 13.')
+    return int(SCORE_TABLE[bid.idx, 2 if xx else int(x), int(vul),
+                           taken_trick_num])
+
+
+def calc_scores(bid_idx: Union[int, np.ndarray],
+                x: Union[bool, np.ndarray],
+                xx: Union[bool, np.ndarray],
+                vul: Union[bool, np.ndarray],
+                tricks: Union[int, np.ndarray]) -> np.ndarray:
+    """Calculates scores of many results at once.
+
+    Arguments are broadcast against each other.
+
+    :param bid_idx: 0-index of final bids (bid.idx). [0-34]
+    :param x: Double.
+    :param xx: Redouble.
+    :param vul: Whether the declarer's side is vulnerable.
+    :param tricks: The number of taken tricks. [0-13]
+    :return: Scores of the declarer.
+    """
+    bid_idx = np.asarray(bid_idx)
+    if ((bid_idx < 0) | (bid_idx >= 35)).any():
+        raise ValueError('bid_idx must be from 0 to 34 (not Pass, X, XX).')
+    tricks = np.asarray(tricks)
+    if ((tricks < 0) | (tricks > 13)).any():
+        raise ValueError('tricks must be from 0 to 13.')
+    doubled = np.where(xx, 2, np.asarray(x, dtype=np.int64))
+    return SCORE_TABLE[bid_idx, doubled, np.asarray(vul, dtype=np.int64),
+                       tricks]
+
+
 def calc_score(contract: Contract, taken_tricks: int) -> int:
     """
 
@@ -126,13 +197,20 @@ def calc_score(contract: Contract, taken_tricks: int) -> int:
 
 
 def point_difference_to_imps(point_difference: int) -> int:
-    win: bool = point_difference >= 0
-    imps = 0
-    while imps < 24:
-        if abs(point_difference) < _IMPS_LIST[imps]:
-            break
-        imps += 1
-    return imps if win else -imps
+    imps = bisect_right(IMPS_THRESHOLDS, abs(point_difference))
+    return imps if point_difference >= 0 else -imps
+
+
+def imps(point_difference: Union[int, np.ndarray]) -> np.ndarray:
+    """Converts point differences to IMPs at once.
+
+    :param point_difference: Point differences.
+    :return: International match points.
+    """
+    point_difference = np.asarray(point_difference)
+    imps = np.searchsorted(_IMPS_ARRAY, np.abs(point_difference),
+                           side='right')
+    return np.where(point_difference >= 0, imps, -imps)
 
 
 def score_to_imp(first_score: int, second_score: int) -> int:
@@ -11,12 +11,14 @@ setup(
     install_requires=['numpy'],
     extras_require={
         'dev': ['flake8', 'mypy', 'pytest', 'pytest-mock'],
+        'dds': ['endplay'],
     },
     packages=find_packages(exclude=['tests']),
     entry_points={
         'console_scripts': [
             'bridge-server = bridge_env.network_bridge.server:main',
-            'bridge-client-ex = bridge_env.network_bridge.client:main'
+            'bridge-client-ex = bridge_env.network_bridge.client:main',
+            'bridge-dda = bridge_env.data_handler.dda_annotator:main'
         ]
     }
 )
@@ -0,0 +1,128 @@
+import pytest
+
+from bridge_env import Bid, Card, Contract, Pair, Player, Suit, Vul
+from bridge_env.data_handler.abstract_classes import BoardLog, BoardSetting
+from bridge_env.data_handler.binary_handler.parser import BoardArchive
+from bridge_env.data_handler.binary_handler.writer import BinaryWriter
+from bridge_env.playing_phase import TrickHistory
+from .. import HANDS1, HANDS2
+
+DDA_DICT = {Player.N:
+                {Suit.C: 1, Suit.D: 2, Suit.H: 3, Suit.S: 4, Suit.NT: 5},
+            Player.E:
+                {Suit.C: 6, Suit.D: 7, Suit.H: 8, Suit.S: 9, Suit.NT: 10},
+            Player.S:
+                {Suit.C: 11, Suit.D: 12, Suit.H: 1, Suit.S: 2, Suit.NT: 3},
+            Player.W:
+                {Suit.C: 4, Suit.D: 5, Suit.H: 6, Suit.S: 7, Suit.NT: 8}}
+
+BOARD_SETTING = BoardSetting(hands=HANDS1,
+                             dealer=Player.S,
+                             vul=Vul.EW,
+                             board_id='setting',
+                             dda=DDA_DICT)
+
+BOARD_LOG = BoardLog(
+    board_id='log',
+    hands=HANDS2,
+    dealer=Player.E,
+    vul=Vul.BOTH,
+    declarer=Player.W,
+    contract=Contract(final_bid=Bid.S4, x=True, xx=True, vul=Vul.BOTH,
+                      declarer=Player.W),
+    taken_trick=9,
+    players={Player.N: 'north', Player.E: 'east', Player.S: 'south',
+             Player.W: 'west'},
+    bid_history=[Bid.Pass, Bid.S1, Bid.Pass, Bid.S4, Bid.X, Bid.XX,
+                 Bid.Pass, Bid.Pass, Bid.Pass],
+    play_history=[TrickHistory(leader=Player.N,
+                               cards=(Card(2, Suit.C), Card(3, Suit.C),
+                                      Card(14, Suit.C), Card(4, Suit.C))),
+                  TrickHistory(leader=Player.S, cards=(Card(10, Suit.S),))],
+    dda=DDA_DICT,
+    score_type='IMP',
+    scores={Pair.NS: 1000, Pair.EW: -1000})
+
+PASSED_OUT_LOG = BoardLog(board_id='passed out',
+                          hands=HANDS1,
+                          dealer=Player.N,
+                          vul=Vul.NONE,
+                          declarer=None,
+                          contract=Contract(final_bid=None),
+                          taken_trick=None)
+
+
+@pytest.fixture
+def archive(tmp_path) -> BoardArchive:
+    path = tmp_path / 'boards.bin'
+    with BinaryWriter(path) as writer:
+        writer.write_board_setting(BOARD_SETTING)
+        writer.write_board_log(BOARD_LOG)
+        writer.write_board_log(PASSED_OUT_LOG)
+    return BoardArchive(path)
+
+
+class TestBoardArchive:
+    def test_len(self, archive: BoardArchive):
+        assert len(archive) == 3
+
+    def test_getitem(self, archive: BoardArchive):
+        assert archive[0] == BOARD_SETTING
+        assert archive[1] == BOARD_LOG
+        assert archive[2] == PASSED_OUT_LOG
+        assert archive[-1] == PASSED_OUT_LOG
+
+    def test_iter(self, archive: BoardArchive):
+        assert list(archive) == [BOARD_SETTING, BOARD_LOG, PASSED_OUT_LOG]
+
+    def test_board_setting(self, archive: BoardArchive):
+        assert archive.board_setting(1) == BoardSetting(hands=HANDS2,
+                                                        dealer=Player.E,
+                                                        vul=Vul.BOTH,
+                                                        board_id='log',
+                                                        dda=DDA_DICT)
+
+    def test_board_log(self, archive: BoardArchive):
+        assert archive.board_log(1) == BOARD_LOG
+        with pytest.raises(ValueError):
+            archive.board_log(0)
+
+    def test_records(self, archive: BoardArchive):
+        assert archive.records['dda'][0].tolist() == \
+            [[1, 2, 3, 4, 5], [6, 7, 8, 9, 10], [11, 12, 1, 2, 3],
+             [4, 5, 6, 7, 8]]
+        assert archive.records['contract'].tolist() == \
+            [255, Bid.S4.idx, 255]
+        assert archive.records['doubled'].tolist() == [0, 2, 0]
+        assert archive.records['taken_trick'].tolist() == [-1, 9, -1]
+        assert archive.records['scores'][1].tolist() == [1000, -1000]
+
+    def test_str_keys(self, tmp_path):
+        # logs parsed from JSON have str leaders and str score keys
+        path = tmp_path / 'boards.bin'
+        with BinaryWriter(path) as writer:
+            writer.write_board_log(BOARD_LOG._replace(
+                play_history=[TrickHistory(leader='N',
+                                           cards=(Card(2, Suit.C),))],
+                scores={'NS': 1000, 'EW': -1000}))
+        board_log = BoardArchive(path)[0]
+        assert board_log.play_history == \
+            [TrickHistory(leader=Player.N, cards=(Card(2, Suit.C),))]
+        assert board_log.scores == {Pair.NS: 1000, Pair.EW: -1000}
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / 'boards.bin'
+        with BinaryWriter(path):
+            pass
+        archive = BoardArchive(path)
+        assert len(archive) == 0
+        assert list(archive) == []
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / 'boards.json'
+        path.write_text('{"board_settings": []}' + ' ' * 64)
+        with pytest.raises(ValueError):
+            BoardArchive(path)
+        path.write_text('')
+        with pytest.raises(ValueError):
+            BoardArchive(path)
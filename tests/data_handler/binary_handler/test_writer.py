@@ -0,0 +1,45 @@
+import struct
+
+import numpy as np
+import pytest
+
+from bridge_env import Player, Vul
+from bridge_env.data_handler.abstract_classes import BoardSetting
+from bridge_env.data_handler.binary_handler import _HEADER, _MAGIC, \
+    _RECORD_DTYPE
+from bridge_env.data_handler.binary_handler.writer import BinaryWriter
+from .. import HANDS1, HANDS2
+
+
+class TestBinaryWriter:
+    def test_header(self, tmp_path):
+        path = tmp_path / 'boards.bin'
+        with BinaryWriter(path) as writer:
+            writer.write_board_setting(BoardSetting(
+                hands=HANDS1, dealer=Player.N, vul=Vul.NONE, board_id='1'))
+            writer.write_board_setting(BoardSetting(
+                hands=HANDS2, dealer=Player.E, vul=Vul.NS, board_id='22'))
+        data = path.read_bytes()
+        magic, board_num, extra_offset, records_offset = \
+            _HEADER.unpack_from(data)
+        assert magic == _MAGIC
+        assert board_num == 2
+        assert records_offset % 8 == 0
+        assert data[extra_offset:extra_offset + 3] == \
+            struct.pack('<H', 1) + b'1'
+        assert len(data) == records_offset + 2 * _RECORD_DTYPE.itemsize
+
+        records = np.frombuffer(data, dtype=_RECORD_DTYPE, count=2,
+                                offset=records_offset)
+        assert records['dealer'].tolist() == [0, 1]
+        assert records['vul'].tolist() == [0, 1]
+        assert records['flags'].tolist() == [0, 0]
+        assert records['extra_length'].tolist() == [3, 4]
+        assert int.from_bytes(records['deal'][1].tobytes(), 'big') == \
+            HANDS2.to_ordinal()
+
+    def test_not_open(self, tmp_path):
+        writer = BinaryWriter(tmp_path / 'boards.bin')
+        with pytest.raises(Exception):
+            writer.write_board_setting(BoardSetting(
+                hands=HANDS1, dealer=Player.N, vul=Vul.NONE, board_id='1'))
@@ -1,8 +1,15 @@
+import io
+import json
+
+import pytest
 from pytest_mock import MockFixture
 
-from bridge_env import Player, Suit, Vul
+from bridge_env import Contract, Player, Suit, Vul
 from bridge_env.data_handler.abstract_classes import BoardSetting
-from bridge_env.data_handler.json_handler.parser import JsonParser
+from bridge_env.data_handler.json_handler import parser
+from bridge_env.data_handler.json_handler.parser import JsonLinesParser, \
+    JsonParser
+from bridge_env.data_handler.json_handler.writer import JsonBoardSettingWriter
 from .. import HANDS1, HANDS2, JSON_HANDS1, JSON_HANDS2
 
 
@@ -51,3 +58,146 @@ class TestJsonParser:
                                  dda=dda)]
 
         assert json_parser.parse_board_settings(mock_io) == expected
+
+
+def write_board_settings(fp, n: int):
+    with JsonBoardSettingWriter(fp) as writer:
+        for i in range(n):
+            writer.write(board_id=str(i), dealer=Player.N,
+                         deal=HANDS1 if i % 2 == 0 else HANDS2,
+                         vul=Vul.NS)
+
+
+class TestIterBoards:
+    @pytest.mark.parametrize('chunk_size', [7, 100, 1 << 16])
+    def test_iter_board_settings(self, mocker: MockFixture, chunk_size):
+        mocker.patch.object(parser, '_CHUNK_SIZE', chunk_size)
+        fp = io.StringIO()
+        write_board_settings(fp, 5)
+        fp.seek(0)
+        expected = JsonParser().parse_board_settings(fp)
+        assert len(expected) == 5
+        fp.seek(0)
+        iterator = JsonParser().iter_board_settings(fp)
+        assert next(iterator) == expected[0]
+        assert list(iterator) == expected[1:]
+
+    def test_empty(self):
+        fp = io.StringIO()
+        write_board_settings(fp, 0)
+        fp.seek(0)
+        assert list(JsonParser().iter_board_settings(fp)) == []
+
+    def test_other_layouts(self):
+        data = {'board_settings': [{'board_id': str(i),
+                                    'dealer': 'S',
+                                    'deal': JSON_HANDS1,
+                                    'vulnerability': 'EW'}
+                                   for i in range(3)]}
+        expected = [BoardSetting(hands=HANDS1, dealer=Player.S, vul=Vul.EW,
+                                 board_id=str(i)) for i in range(3)]
+        # indented
+        fp = io.StringIO(json.dumps(data, indent=2))
+        assert list(JsonParser().iter_board_settings(fp)) == expected
+        # the list is not the first member
+        fp = io.StringIO(json.dumps({'version': 1, **data}))
+        assert list(JsonParser().iter_board_settings(fp)) == expected
+
+    def test_large_board(self, mocker: MockFixture):
+        mocker.patch.object(parser, '_CHUNK_SIZE', 16)
+        data = {'board_id': '0', 'dealer': 'N', 'deal': JSON_HANDS1,
+                'vulnerability': 'NS', 'comment': 'x' * 10000}
+        fp = io.StringIO(json.dumps({'board_settings': [data, data]}))
+        read = mocker.spy(fp, 'read')
+        settings = list(JsonParser().iter_board_settings(fp))
+        assert [s.hands for s in settings] == [HANDS1, HANDS1]
+        # chunks grow with the board, so it isn't read in 16 characters
+        assert read.call_count < 40
+
+    def test_truncated(self):
+        fp = io.StringIO()
+        write_board_settings(fp, 3)
+        fp = io.StringIO(fp.getvalue()[:-20])
+        iterator = JsonParser().iter_board_settings(fp)
+        assert next(iterator).board_id == '0'
+        with pytest.raises(ValueError):
+            list(iterator)
+
+    def test_iter_board_logs(self):
+        log = {'board_id': '1', 'dealer': 'N', 'deal': JSON_HANDS1,
+               'vulnerability': 'None', 'declarer': 'S', 'contract': '3NT',
+               'taken_trick': 9}
+        fp = io.StringIO(json.dumps({'logs': [log, log]}))
+        logs = list(JsonParser().iter_board_logs(fp))
+        assert len(logs) == 2
+        assert logs[0].contract == Contract.str_to_contract(
+            '3NT', vul=Vul.NONE, declarer=Player.S)
+        # logs are also board settings
+        fp.seek(0)
+        assert [s.hands for s in JsonParser().iter_board_settings(fp)] == \
+            [HANDS1, HANDS1]
+        fp = io.StringIO(json.dumps({'board_settings': []}))
+        with pytest.raises(KeyError):
+            list(JsonParser().iter_board_logs(fp))
+
+
+class TestBoardOffsets:
+    def test_board_offsets(self):
+        fp = io.StringIO()
+        write_board_settings(fp, 3)
+        data = fp.getvalue().encode()
+        offsets = JsonParser().board_offsets(io.BytesIO(data))
+        assert len(offsets) == 3
+        for i, offset in enumerate(offsets):
+            fp = io.StringIO(data[offset:].decode())
+            board_settings = list(JsonParser().iter_board_settings_at(fp))
+            assert [s.board_id for s in board_settings] == \
+                [str(j) for j in range(i, 3)]
+
+    def test_nested_values(self):
+        data = '{"logs": [{"a": "x\\"]}", "b": [1, {"c": 2}]}, 3, "s", ' \
+               '{"d": "\u00e9"}]}'.encode()
+        assert JsonParser().board_offsets(io.BytesIO(data)) == \
+            [10, 46, 49, 54]
+
+    def test_invalid_document(self):
+        fp = io.BytesIO(json.dumps({'version': 1,
+                                    'board_settings': []}).encode())
+        with pytest.raises(ValueError):
+            JsonParser().board_offsets(fp)
+        fp = io.BytesIO(b'{"board_settings": [{"board_id": "1"}')
+        with pytest.raises(ValueError):
+            JsonParser().board_offsets(fp)
+
+    def test_json_lines(self):
+        line = json.dumps({'board_id': '1', 'dealer': 'N',
+                           'deal': JSON_HANDS1, 'vulnerability': 'None'})
+        data = (line + '\n\n' + line + '\n' + line[:30]).encode()
+        assert JsonLinesParser().board_offsets(io.BytesIO(data)) == \
+            [0, len(line) + 2]
+
+
+class TestJsonLinesParser:
+    def test_parse(self):
+        log = {'board_id': '1', 'dealer': 'N', 'deal': JSON_HANDS1,
+               'vulnerability': 'None', 'declarer': None,
+               'contract': 'Passed_out', 'taken_trick': None}
+        text = json.dumps(log) + '\n\n' + json.dumps(
+            {**log, 'board_id': '2'}) + '\n'
+        logs = JsonLinesParser().parse_board_logs(io.StringIO(text))
+        assert [log.board_id for log in logs] == ['1', '2']
+        assert logs[0].contract.is_passed_out()
+        settings = JsonLinesParser().parse_board_settings(io.StringIO(text))
+        assert settings[1] == BoardSetting(hands=HANDS1, dealer=Player.N,
+                                           vul=Vul.NONE, board_id='2')
+        assert len(JsonLinesParser().parse_all(io.StringIO(text))) == 2
+
+    def test_incomplete_line(self):
+        line = json.dumps({'board_id': '1', 'dealer': 'N',
+                           'deal': JSON_HANDS1, 'vulnerability': 'None'})
+        # the last line is ignored
+        fp = io.StringIO(line + '\n' + line[:30])
+        assert len(list(JsonLinesParser().iter_board_settings(fp))) == 1
+        fp = io.StringIO(line[:30] + '\n' + line + '\n')
+        with pytest.raises(ValueError):
+            list(JsonLinesParser().iter_board_settings(fp))
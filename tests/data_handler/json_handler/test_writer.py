@@ -1,11 +1,14 @@
+import json
 from unittest.mock import call
 
 import pytest
 from pytest_mock import MockFixture
 
 from bridge_env import Bid, Card, Contract, Pair, Player, Suit, Vul
+from bridge_env.data_handler.abstract_classes import BoardSetting
 from bridge_env.data_handler.json_handler.writer import JsonBoardSettingWriter, \
-    JsonLogWriter
+    JsonLinesBoardSettingWriter, JsonLinesLogWriter, JsonLogWriter, \
+    recover_json_lines
 from bridge_env.data_handler.pbn_handler.writer import Scoring
 from bridge_env.playing_phase import PlayingHistory, TrickHistory
 from .. import HANDS1, HANDS2, JSON_HANDS1, JSON_HANDS2
@@ -64,6 +67,21 @@ class TestJsonBoardSettingWriter:
                  '}'),
             call('\n]}')])
 
+    def test_write_board_setting(self, mocker: MockFixture):
+        mock_write = mocker.patch('bridge_env.data_handler.json_handler.'
+                                  'writer.JsonBoardSettingWriter.write')
+        writer = JsonBoardSettingWriter(mocker.MagicMock())
+        writer.write_board_setting(BoardSetting(hands=HANDS1,
+                                                dealer=Player.W,
+                                                vul=Vul.EW,
+                                                board_id='test3',
+                                                dda=DDA_DICT))
+        mock_write.assert_called_once_with(board_id='test3',
+                                           dealer=Player.W,
+                                           deal=HANDS1,
+                                           vul=Vul.EW,
+                                           dda=DDA_DICT)
+
 
 class TestJsonLogWriter:
     @pytest.fixture(scope='function')
@@ -219,3 +237,73 @@ class TestJsonLogWriter:
                  '}'),
             call('\n]}')
         ])
+
+
+class TestJsonLinesWriter:
+    def test_board_settings(self, tmp_path):
+        path = tmp_path / 'boards.jsonl'
+        with open(path, 'w') as fp, JsonLinesBoardSettingWriter(fp) as writer:
+            writer.write(board_id='1', dealer=Player.N, deal=HANDS1,
+                         vul=Vul.NS)
+        # append to the file
+        with open(path, 'a') as fp, JsonLinesBoardSettingWriter(fp) as writer:
+            writer.write_board_setting(BoardSetting(
+                hands=HANDS2, dealer=Player.E, vul=Vul.NONE, board_id='2',
+                dda=DDA_DICT))
+        with open(path, 'r') as fp:
+            lines = fp.read().split('\n')
+        assert len(lines) == 3 and lines[2] == ''
+        assert json.loads(lines[0]) == {'board_id': '1',
+                                        'dealer': 'N',
+                                        'deal': JSON_HANDS1,
+                                        'vulnerability': 'NS'}
+        assert json.loads(lines[1])['dda']['E']['NT'] == 10
+
+    @pytest.mark.parametrize(('flush_interval', 'flushes'),
+                             [(1, 4), (2, 2), (5, 1)])
+    def test_flush(self, mocker: MockFixture, flush_interval, flushes):
+        mock_io = mocker.MagicMock()
+        mock_io.fileno.return_value = 100
+        fsync = mocker.patch('os.fsync')
+        with JsonLinesBoardSettingWriter(mock_io,
+                                         flush_interval=flush_interval,
+                                         fsync=True) as writer:
+            for i in range(3):
+                writer.write(board_id=str(i), dealer=Player.N, deal=HANDS1,
+                             vul=Vul.NS)
+        assert mock_io.flush.call_count == flushes
+        fsync.assert_called_with(100)
+        assert fsync.call_count == flushes
+        with pytest.raises(ValueError):
+            JsonLinesLogWriter(mock_io, flush_interval=0)
+
+    def test_not_open(self, mocker: MockFixture):
+        writer = JsonLinesBoardSettingWriter(mocker.MagicMock())
+        with pytest.raises(Exception):
+            writer.write(board_id='1', dealer=Player.N, deal=HANDS1,
+                         vul=Vul.NS)
+
+
+class TestRecoverJsonLines:
+    def test_incomplete_line(self, tmp_path):
+        path = tmp_path / 'log.jsonl'
+        lines = [json.dumps({'board_id': str(i), 'text': 'x' * 30000})
+                 for i in range(5)]
+        path.write_text('\n'.join(lines) + '\n' + lines[0][:100])
+        assert recover_json_lines(path) == json.loads(lines[4])
+        assert path.read_text() == '\n'.join(lines) + '\n'
+        assert recover_json_lines(path) == json.loads(lines[4])
+
+    def test_unterminated_line(self, tmp_path):
+        path = tmp_path / 'log.jsonl'
+        path.write_text('{"board_id": "1"}\n{"board_id": "2"}')
+        assert recover_json_lines(path) == {'board_id': '2'}
+        assert path.read_text() == '{"board_id": "1"}\n{"board_id": "2"}\n'
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / 'log.jsonl'
+        path.write_text('')
+        assert recover_json_lines(path) is None
+        path.write_text('{"board_id": ')
+        assert recover_json_lines(path) is None
+        assert path.read_text() == ''
@@ -1,9 +1,13 @@
+import io
 from unittest.mock import call
 
 import pytest
 from pytest_mock import MockFixture
 
+from bridge_env import Bid, Card, Contract, Hands, Pair, Player, Suit, Vul
+from bridge_env.data_handler.pbn_handler import parser as parser_module
 from bridge_env.data_handler.pbn_handler.parser import PbnParser
+from bridge_env.playing_phase import TrickHistory
 from .. import PBN_HANDS1, PBN_HANDS2
 
 
@@ -192,3 +196,263 @@ class TestPbnParser:
     def test_parse_all(self, path, expected, parser):
         with open(path, 'r') as fp:
             assert parser.parse_all(fp) == expected
+
+    @pytest.mark.parametrize(('path', 'expected'),
+                             [(PLAY_FILE_PATH, PLAY_FILE_EXPECTED),
+                              (RESULT_FILE_PATH, RESULT_FILE_EXPECTED)])
+    def test_board_offsets(self, path, expected, parser):
+        with open(path, 'rb') as fp:
+            offsets = parser.board_offsets(fp)
+        assert len(offsets) == len(expected)
+        with open(path, 'r') as fp:
+            for offset, ex in zip(offsets, expected):
+                fp.seek(offset)
+                assert next(parser.parse_stream(fp)) == ex
+
+    def test_board_offsets_in_comment(self, parser):
+        # a semi-empty line in a comment doesn't split games
+        data = b'[Board "1"] { comment\n\n}\n[Dealer "N"]\n\n' \
+               b'[Board "2"]\n\n'
+        assert parser.board_offsets(io.BytesIO(data)) == [0, 39]
+
+
+class TestParallel:
+    @pytest.fixture
+    def path(self, tmp_path):
+        # games with comments over semi-empty lines
+        games = ['[Board "{}"] {{ comment\n\n}}\n'
+                 '[Dealer "N"]\n'
+                 '[Vulnerable "None"] ; {{ not a comment\n'
+                 f'[Deal "{PBN_HANDS1}"]\n'.format(i) for i in range(30)]
+        path = tmp_path / 'boards.pbn'
+        path.write_text('% PBN 2.1\n' + '\n'.join(games))
+        return path
+
+    @pytest.mark.parametrize(('workers', 'chunk_size'),
+                             [(1, 1), (1, 1 << 20), (2, 100)])
+    def test_parse_file_parallel(self, path, workers, chunk_size):
+        with open(path, 'r') as fp:
+            expected = PbnParser().parse_all(fp)
+        assert len(expected) == 30
+        assert list(PbnParser().parse_file_parallel(
+            path, workers=workers, chunk_size=chunk_size)) == expected
+
+    def test_iter_board_settings_parallel(self, path):
+        with open(path, 'r') as fp:
+            expected = PbnParser().parse_board_settings(fp)
+        actual = list(PbnParser().iter_board_settings_parallel(
+            path, workers=2, chunk_size=200))
+        assert [b.board_id for b in actual] == [str(i) for i in range(30)]
+        assert actual == expected
+
+    def test_invalid_arguments(self, path):
+        with pytest.raises(ValueError):
+            list(PbnParser().parse_file_parallel(path, workers=0))
+        with pytest.raises(ValueError):
+            list(PbnParser().parse_file_parallel(path, chunk_size=0))
+
+
+class TestExportFormat:
+    EXPORT = ('% PBN 2.1\n'
+              '% EXPORT\n'
+              '[Event "test"]\n'
+              '[Board "1"]\n'
+              '[Dealer "N"]\n'
+              '[Vulnerable "None"]\n'
+              f'[Deal "{PBN_HANDS1}"]\n'
+              '[Dealer "E"]\n'  # duplicated tag is ignored
+              '[Auction "N"]\n'
+              '1S Pass { a comment with [Deal "N:..."]\n'
+              '\n'
+              'over lines} 2S Pass\n'
+              'Pass Pass\n'
+              '\n'
+              '{ a comment line }\n'
+              '[Board "2"] { a comment\n'
+              '[Dealer "W"] }\n'
+              '[Dealer "S"]\n'
+              '[Vulnerable "All"]\n'
+              f'[Deal "{PBN_HANDS2}"]\n')
+
+    def test_iter_board_settings(self):
+        board_settings = list(PbnParser().iter_board_settings(
+            io.StringIO(self.EXPORT)))
+        assert [(b.board_id, b.dealer, b.vul) for b in board_settings] == \
+            [('1', Player.N, Vul.NONE), ('2', Player.S, Vul.BOTH)]
+        assert board_settings[0].hands == Hands.convert_pbn(PBN_HANDS1)
+        assert board_settings[1].hands == Hands.convert_pbn(PBN_HANDS2)
+
+    def test_general_parser(self, mocker: MockFixture):
+        spy = mocker.spy(parser_module, '_iter_export_board_settings')
+        # the general parser gives the same board settings
+        expected = list(PbnParser().iter_board_settings(
+            io.StringIO(self.EXPORT)))
+        assert spy.call_count == 1
+        assert list(PbnParser(fast_export=False).iter_board_settings(
+            io.StringIO(self.EXPORT))) == expected
+        assert list(PbnParser().iter_board_settings(io.StringIO(
+            self.EXPORT.replace('% EXPORT\n', '')))) == expected
+        assert spy.call_count == 1
+
+    def test_braces(self):
+        # only '{ ' out of the start of a line or a comment opens a comment
+        text = ('% EXPORT\n'
+                '[Board "1"]\n'
+                '[Dealer "N"] {not a comment\n'
+                '[Vulnerable "None"]\n'
+                '{ not a comment\n'
+                f'[Deal "{PBN_HANDS1}"]\n'
+                '[Auction "N"]\n'
+                '1S Pass { a comment } { a comment\n'
+                '[Dealer "E"]\n'
+                '}{ not a comment\n'
+                '[Board "2"]\n'
+                '\n'
+                '[Board "3"]{ a comment\n'
+                '[Board "4"]}\n'
+                '[Dealer "S"]\n'
+                '[Vulnerable "All"]\n'
+                f'[Deal "{PBN_HANDS2}"]\n')
+        expected = list(PbnParser(fast_export=False).iter_board_settings(
+            io.StringIO(text)))
+        assert [(b.board_id, b.dealer, b.vul) for b in expected] == \
+            [('1', Player.N, Vul.NONE), ('3', Player.S, Vul.BOTH)]
+        assert list(PbnParser().iter_board_settings(io.StringIO(text))) == \
+            expected
+
+    def test_parallel(self, tmp_path):
+        path = tmp_path / 'boards.pbn'
+        path.write_text(self.EXPORT)
+        expected = list(PbnParser().iter_board_settings(
+            io.StringIO(self.EXPORT)))
+        assert list(PbnParser().iter_board_settings_parallel(
+            path, workers=1, chunk_size=1)) == expected
+
+    @pytest.mark.parametrize('text', [
+        '% EXPORT\n[Board "1"]\n[Dealer "N"]\n[Vulnerable "None"]\n',
+        '% EXPORT\n[Board "1"\n'])
+    def test_invalid(self, text):
+        with pytest.raises(ValueError):
+            list(PbnParser().iter_board_settings(io.StringIO(text)))
+
+
+def cards(*strs):
+    return tuple(Card.str_to_card(s) for s in strs)
+
+
+class TestBoardLogs:
+    def test_result_file(self):
+        with open(TestPbnParser.RESULT_FILE_PATH, 'r') as fp:
+            board_logs = PbnParser().parse_board_logs(fp)
+        assert len(board_logs) == 1
+        board_log = board_logs[0]
+        assert board_log.board_id == '16'
+        assert board_log.dealer is Player.W
+        assert board_log.vul is Vul.EW
+        assert board_log.declarer is Player.N
+        assert board_log.contract == Contract(final_bid=Bid.C5, x=True,
+                                              vul=Vul.EW, declarer=Player.N)
+        assert board_log.taken_trick == 11
+        assert board_log.players == {Player.N: 'Sun',
+                                     Player.E: 'Christiansen',
+                                     Player.S: 'Wang',
+                                     Player.W: 'Blakset'}
+        assert board_log.bid_history == [
+            Bid.D2, Bid.C3, Bid.H4, Bid.C5, Bid.Pass, Bid.Pass, Bid.X,
+            Bid.Pass, Bid.Pass, Bid.Pass]
+        # the leader of each trick is the winner of the previous trick
+        assert board_log.play_history == [
+            TrickHistory(leader=Player.E, cards=cards('SK', 'ST', 'S4', 'S2')),
+            TrickHistory(leader=Player.E, cards=cards('HK', 'H5', 'H2', 'C7')),
+            TrickHistory(leader=Player.N, cards=cards('S3', 'S6', 'C2', 'S5')),
+            TrickHistory(leader=Player.S, cards=cards('HA', 'H6', 'D4', 'H3'))]
+        assert board_log.scores == {Pair.NS: 550, Pair.EW: -550}
+        assert board_log.dda is None
+
+    def test_optimum_result_table(self):
+        with open(TestPbnParser.PLAY_FILE_PATH, 'r') as fp:
+            board_logs = list(PbnParser().iter_board_logs(fp))
+        assert len(board_logs) == 4
+        assert board_logs[0].contract.is_passed_out()
+        assert board_logs[0].taken_trick is None
+        assert board_logs[0].dda[Player.N] == {
+            Suit.C: 9, Suit.D: 6, Suit.H: 5, Suit.S: 6, Suit.NT: 6}
+        assert board_logs[0].dda[Player.W][Suit.NT] == 7
+
+    def test_notes_and_whitespaces(self):
+        text = (
+            '[Board "1"]\n'
+            '[Dealer "S"]\n'
+            '[Vulnerable "NS"]\n'
+            f'[Deal "{PBN_HANDS1}"]\n'
+            '[Scoring "IMP"]\n'
+            '[Declarer "E"] [Contract\t"3NT"]\n'
+            '[Result "NS 4"]\n'
+            '[Score "EW 600"]\n'
+            '[Auction "S"]  1C =1=   1S\n'
+            '\t2C! $1 3NT AP\n'
+            '[Note "1:could be short"]\n'
+            '[Note "2:not used"]\n'
+            '[Play "S"]\n'
+            'C5 C6 C2 CA\n'
+            'D2 - - D5\n'
+            '*\n')
+        board_log = PbnParser().parse_board_logs(io.StringIO(text))[0]
+        assert board_log.bid_history == [Bid.C1, Bid.S1, Bid.C2, Bid.NT3,
+                                         Bid.Pass, Bid.Pass, Bid.Pass]
+        assert board_log.contract == Contract(final_bid=Bid.NT3,
+                                              vul=Vul.NS, declarer=Player.E)
+        assert board_log.taken_trick == 9
+        assert board_log.score_type == 'IMP'
+        assert board_log.scores == {Pair.NS: -600, Pair.EW: 600}
+        # CA of E wins the first trick, and W doesn't play after E and S
+        assert board_log.play_history == [
+            TrickHistory(leader=Player.S, cards=(Card(5, Suit.C),
+                                                 Card(6, Suit.C),
+                                                 Card(2, Suit.C),
+                                                 Card(14, Suit.C))),
+            TrickHistory(leader=Player.E, cards=(Card(5, Suit.D),
+                                                 Card(2, Suit.D)))]
+
+    GAME = ('[Board "1"]\n'
+            '[Dealer "S"]\n'
+            '[Vulnerable "None"]\n'
+            f'[Deal "{PBN_HANDS1}"]\n'
+            '[Declarer "{declarer}"]\n'
+            '[Contract "3NT"]\n'
+            '[Result "{result}"]\n'
+            '[Score "{score}"]\n')
+
+    @pytest.mark.parametrize('declarer, result, score, taken_trick, ns_score',
+                             [('E', '9', '400', 9, -400),
+                              ('N', '8', '-50', 8, -50),
+                              ('W', 'NS 3', 'EW 400', 10, -400)])
+    def test_result_and_score(self, declarer, result, score, taken_trick,
+                              ns_score):
+        text = self.GAME.format(declarer=declarer, result=result, score=score)
+        board_log = PbnParser().parse_board_logs(io.StringIO(text))[0]
+        assert board_log.taken_trick == taken_trick
+        assert board_log.scores == {Pair.NS: ns_score, Pair.EW: -ns_score}
+
+    def test_no_result(self):
+        text = self.GAME.format(declarer='E', result='', score='400')
+        text = text.replace('[Result ""]\n', '')
+        board_log = PbnParser().parse_board_logs(io.StringIO(text))[0]
+        assert board_log.contract == Contract(final_bid=Bid.NT3,
+                                              vul=Vul.NONE, declarer=Player.E)
+        assert board_log.taken_trick is None
+        assert board_log.scores == {Pair.NS: -400, Pair.EW: 400}
+
+    @pytest.mark.parametrize('result, score', [('', '400'), ('9', ''),
+                                               ('NS ', '400'), ('9', 'EW x')])
+    def test_invalid_result_and_score(self, result, score):
+        text = self.GAME.format(declarer='E', result=result, score=score)
+        with pytest.raises(ValueError, match='is not a number'):
+            PbnParser().parse_board_logs(io.StringIO(text))
+
+    def test_parse_game(self):
+        parser = PbnParser()
+        parser.tag_pair_buffer = ['[Auction "N"]\n', '1C\n', 'Pass [Note ',
+                                  '"1:x"] [Auction "E"] 2C\n']
+        assert parser.parse_game() == ({'Auction': 'N', 'Note': '1:x'},
+                                       {'Auction': ['1C', 'Pass']})
@@ -1,14 +1,21 @@
+import copy
 import datetime
+import io
 from typing import Optional
 from unittest.mock import call
 
 import pytest
 from pytest_mock import MockFixture
 
-from bridge_env import Bid, Contract, Hands, Player, Vul
-from bridge_env.data_handler.pbn_handler.writer import PbnWriter, Scoring
+from bridge_env import Bid, Card, Contract, Hands, Pair, Player, Suit, Vul
+from bridge_env.data_handler.pbn_handler.parser import PbnParser
+from bridge_env.data_handler.pbn_handler.writer import PbnLogWriter, \
+    PbnWriter, Scoring
+from bridge_env.playing_phase import PlayingPhaseWithHands, TrickHistory
 from .. import HANDS1, HANDS2, PBN_HANDS1, PBN_HANDS2
 
+DDA = {p: {s: (p.value + s.value) % 14 for s in Suit} for p in Player}
+
 
 class TestPbnWriter:
     @pytest.fixture(scope='function')
@@ -114,3 +121,141 @@ class TestPbnWriter:
             [call(tag, content) for tag, content in expected_calls])
 
         mock_to_pbn.assert_called_once_with(dealer)
+
+    def test_write_auction(self):
+        stream = io.StringIO()
+        PbnWriter(stream).write_auction(
+            Player.E, [Bid.C1, Bid.Pass, Bid.NT1, Bid.X, Bid.XX, Bid.Pass,
+                       Bid.Pass, Bid.Pass])
+        assert stream.getvalue() == ('[Auction "E"]\n'
+                                     '1C Pass 1NT X\n'
+                                     'XX Pass Pass Pass\n')
+
+    def test_write_play(self):
+        stream = io.StringIO()
+        PbnWriter(stream).write_play(
+            [TrickHistory(Player.S, (Card.str_to_card('C5'),
+                                     Card.str_to_card('C6'),
+                                     Card.str_to_card('C2'),
+                                     Card.str_to_card('CA'))),
+             TrickHistory(Player.E, (Card.str_to_card('DT'),))])
+        # columns are S, W, N, E from the opening leader
+        assert stream.getvalue() == ('[Play "S"]\n'
+                                     'C5 C6 C2 CA\n'
+                                     '- - - DT\n'
+                                     '*\n')
+
+    def test_write_optimum_result_table(self):
+        stream = io.StringIO()
+        PbnWriter(stream).write_optimum_result_table(DDA)
+        lines = stream.getvalue().splitlines()
+        assert lines[0] == \
+            r'[OptimumResultTable "Declarer;Denomination\2R;Result\2R"]'
+        assert lines[1:6] == ['N  C  2', 'N  D  3', 'N  H  4', 'N  S  5',
+                              'N NT  6']
+        assert len(lines) == 21
+
+
+def play(contract: Contract, hands: Hands) -> PlayingPhaseWithHands:
+    playing_phase = PlayingPhaseWithHands(contract, copy.deepcopy(hands))
+    while not playing_phase.has_done():
+        player = playing_phase.active_player
+        card = min(playing_phase.current_available_cards_in_hand(player),
+                   key=lambda c: (c.suit.value, c.rank))
+        playing_phase.play_card_by_player(card, player)
+    return playing_phase
+
+
+class TestPbnLogWriter:
+    DATE = datetime.date(2020, 5, 1)
+
+    def write_game(self, writer: PbnLogWriter, board_id: str,
+                   contract: Contract, bid_history, dda=None) -> None:
+        if contract.is_passed_out():
+            play_history, taken_trick_num, score = None, None, 0
+        else:
+            playing_phase = play(contract, HANDS1)
+            play_history = playing_phase.playing_history
+            taken_trick_num = playing_phase.taken_tricks[
+                contract.declarer.pair]
+            score = 100 * taken_trick_num
+        writer.write(board_id=board_id,
+                     west_player='EW',
+                     north_player='NS',
+                     east_player='EW',
+                     south_player='NS',
+                     dealer=Player.N,
+                     deal=HANDS1,
+                     scoring=Scoring.IMP,
+                     bid_history=bid_history,
+                     contract=contract,
+                     play_history=play_history,
+                     taken_trick_num=taken_trick_num,
+                     scores={Pair.NS: score, Pair.EW: -score},
+                     dda=dda)
+
+    def test_round_trip(self):
+        stream = io.StringIO()
+        contract = Contract(Bid.H2, vul=Vul.NS, declarer=Player.E)
+        bid_history = [Bid.Pass, Bid.H1, Bid.Pass, Bid.H2, Bid.Pass, Bid.Pass,
+                       Bid.Pass]
+        passed_out = Contract(None, vul=Vul.NS)
+        with PbnLogWriter(stream, date=self.DATE) as writer:
+            self.write_game(writer, '1', contract, bid_history, dda=DDA)
+            self.write_game(writer, '2', passed_out, [Bid.Pass] * 4)
+        text = stream.getvalue()
+        assert text.startswith('% PBN 2.1\n% EXPORT\n[Event "?"]\n')
+        assert '[Date "2020.05.01"]' in text
+        assert '\n\n[Event "?"]' in text
+
+        board_log, passed_out_log = PbnParser().parse_board_logs(
+            io.StringIO(text))
+        expected_play = play(contract, HANDS1)
+        assert board_log.board_id == '1'
+        assert board_log.hands == HANDS1
+        assert board_log.contract == contract
+        assert board_log.taken_trick == \
+            expected_play.taken_tricks[Pair.EW]
+        assert board_log.bid_history == bid_history
+        assert board_log.play_history == \
+            list(expected_play.playing_history.history)
+        assert board_log.dda == DDA
+        assert board_log.score_type == 'IMP'
+        assert board_log.scores == {
+            Pair.NS: 100 * board_log.taken_trick,
+            Pair.EW: -100 * board_log.taken_trick}
+        assert board_log.players == {Player.N: 'NS', Player.E: 'EW',
+                                     Player.S: 'NS', Player.W: 'EW'}
+
+        assert passed_out_log.board_id == '2'
+        assert passed_out_log.contract.is_passed_out()
+        assert passed_out_log.bid_history == [Bid.Pass] * 4
+        assert passed_out_log.play_history is None
+        assert passed_out_log.dda is None
+
+    def test_flush_interval(self):
+        stream = io.StringIO()
+        writer = PbnLogWriter(stream, date=self.DATE, flush_interval=2)
+        writer.open()
+        self.write_game(writer, '1', Contract(None, vul=Vul.NONE),
+                        [Bid.Pass] * 4)
+        assert stream.getvalue() == ''
+        self.write_game(writer, '2', Contract(None, vul=Vul.NONE),
+                        [Bid.Pass] * 4)
+        flushed = stream.getvalue()
+        assert flushed.count('[Event ') == 2
+        self.write_game(writer, '3', Contract(None, vul=Vul.NONE),
+                        [Bid.Pass] * 4)
+        assert stream.getvalue() == flushed
+        writer.close()
+        assert len(PbnParser().parse_board_logs(
+            io.StringIO(stream.getvalue()))) == 3
+
+    def test_write_before_open(self):
+        with pytest.raises(Exception):
+            self.write_game(PbnLogWriter(io.StringIO()), '1',
+                            Contract(None, vul=Vul.NONE), [Bid.Pass] * 4)
+
+    def test_invalid_flush_interval(self):
+        with pytest.raises(ValueError):
+            PbnLogWriter(io.StringIO(), flush_interval=0)
@@ -0,0 +1,100 @@
+import io
+import json
+import os
+
+import pytest
+
+from bridge_env.data_handler.board_index import IndexedBoardSettings, \
+    build_offsets, index_path, load_offsets
+from bridge_env.data_handler.json_handler.parser import JsonLinesParser, \
+    JsonParser
+from bridge_env.data_handler.pbn_handler.parser import PbnParser
+
+PBN_PATH = 'tests/data_handler/pbn_handler/source/play_ex.pbn'
+JSON_PATH = 'tests/data_handler/json_handler/source/board_settings_ex.json'
+
+
+@pytest.fixture(params=[(PBN_PATH, PbnParser), (JSON_PATH, JsonParser)])
+def source(request, tmp_path):
+    path, parser_class = request.param
+    copied = tmp_path / os.path.basename(path)
+    with open(path, 'rb') as fp:
+        copied.write_bytes(fp.read())
+    return copied, parser_class()
+
+
+def test_index_path():
+    assert str(index_path('dir/boards.pbn')) == \
+        os.path.join('dir', 'boards.pbn.idx')
+
+
+def test_load_offsets(source, mocker):
+    path, parser = source
+    offsets = build_offsets(path, parser)
+    assert index_path(path).exists()
+
+    spy = mocker.spy(parser, 'board_offsets')
+    assert load_offsets(path, parser).tolist() == offsets.tolist()
+    spy.assert_not_called()
+
+    # the index is rebuilt after the file is changed
+    with open(path, 'ab') as fw:
+        fw.write(b'\n')
+    assert load_offsets(path, parser).tolist() == offsets.tolist()
+    spy.assert_called_once()
+
+
+def test_load_offsets_broken_sidecar(source):
+    path, parser = source
+    offsets = build_offsets(path, parser)
+    index_path(path).write_bytes(b'broken')
+    assert load_offsets(path, parser).tolist() == offsets.tolist()
+
+
+class TestIndexedBoardSettings:
+    def test_getitem(self, source):
+        path, parser = source
+        with open(path, 'r') as fp:
+            expected = parser.parse_board_settings(fp)
+        board_settings = IndexedBoardSettings.open(path, parser)
+        assert len(board_settings) == len(expected)
+        for i in range(len(expected)):
+            assert board_settings[i] == expected[i]
+        assert board_settings[-1] == expected[-1]
+        with pytest.raises(IndexError):
+            board_settings[len(expected)]
+
+    def test_slice(self, source):
+        path, parser = source
+        with open(path, 'r') as fp:
+            expected = parser.parse_board_settings(fp)
+        board_settings = IndexedBoardSettings.open(path, parser)
+        assert list(board_settings) == expected
+        assert list(board_settings[1:]) == expected[1:]
+        assert list(board_settings[::-1]) == expected[::-1]
+        assert list(board_settings[len(expected):]) == []
+
+    @pytest.mark.parametrize('encoding', ['utf-8', 'latin-1'])
+    def test_encoding(self, tmp_path, encoding):
+        with open(PBN_PATH, 'r') as fp:
+            text = fp.read().replace('[Site "#"]', '[Site "Saint-Étienne"]')
+        path = tmp_path / 'boards.pbn'
+        path.write_bytes(text.encode(encoding))
+        expected = PbnParser().parse_board_settings(io.StringIO(text))
+        board_settings = IndexedBoardSettings.open(path, PbnParser(),
+                                                   encoding=encoding)
+        assert list(board_settings[1:]) == expected[1:]
+        assert board_settings[-1] == expected[-1]
+
+    def test_json_lines(self, tmp_path):
+        path = tmp_path / 'boards.jsonl'
+        with open(JSON_PATH, 'r') as fp:
+            expected = JsonParser().parse_board_settings(fp)
+        with open(JSON_PATH, 'r') as fp:
+            boards = json.load(fp)['board_settings']
+        # an incomplete last line is ignored
+        path.write_text('\n'.join(json.dumps(board) for board in boards) +
+                        '\n\n{"board_id": ')
+        board_settings = IndexedBoardSettings.open(path, JsonLinesParser())
+        assert list(board_settings) == expected
+        assert board_settings[1] == expected[1]
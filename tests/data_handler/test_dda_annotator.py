@@ -0,0 +1,136 @@
+import random
+import sys
+from typing import Dict, Sequence
+
+import pytest
+from pytest_mock import MockFixture
+
+from bridge_env import Card, Hands, Player, Suit, Vul
+from bridge_env.data_handler.abstract_classes import BoardSetting
+from bridge_env.data_handler.dda_annotator import annotate_dda, main
+from bridge_env.data_handler.json_handler.parser import JsonParser
+from bridge_env.data_handler.json_handler.writer import JsonBoardSettingWriter
+from bridge_env.dda_cache import DDACache
+from bridge_env.double_dummy import DDA_SUITS
+
+
+def fake_solver(hands: Sequence[int]) -> Dict[Player, Dict[Suit, int]]:
+    # picklable solver depending on the hands
+    return {p: {s: (hands[p.value - 1] >> s.value) % 14 for s in DDA_SUITS}
+            for p in Player}
+
+
+def board_settings(n: int, seed: int = 0):
+    random.seed(seed)
+    return [BoardSetting(hands=Hands.generate_random_hands(),
+                         dealer=Player.N,
+                         vul=Vul.NONE,
+                         board_id=str(i)) for i in range(n)]
+
+
+def expected_dda(board_setting: BoardSetting):
+    hands = board_setting.hands
+    return fake_solver([sum(1 << int(c) for c in hands[p]) for p in Player])
+
+
+class TestAnnotateDda:
+    def test_serial(self):
+        settings = board_settings(3)
+        dda = fake_solver((0, 0, 0, 0))
+        settings[1] = settings[1]._replace(dda=dda)
+        results = list(annotate_dda(settings, solver=fake_solver))
+        assert [r.board_id for r in results] == ['0', '1', '2']
+        assert results[0].dda == expected_dda(settings[0])
+        # boards which have dda are not solved
+        assert results[1].dda is dda
+        results = list(annotate_dda(settings, overwrite=True,
+                                    solver=fake_solver))
+        assert results[1].dda == expected_dda(settings[1])
+
+    @pytest.mark.parametrize('max_pending', [1, 3, None])
+    def test_workers(self, max_pending):
+        settings = board_settings(10, seed=1)
+        results = list(annotate_dda(settings, workers=2,
+                                    max_pending=max_pending,
+                                    solver=fake_solver))
+        # in the input order
+        assert [r.board_id for r in results] == [s.board_id for s in settings]
+        for setting, result in zip(settings, results):
+            assert result.hands == setting.hands
+            assert result.dda == expected_dda(setting)
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_cache(self, workers):
+        settings = board_settings(4, seed=2)
+        cache = DDACache()
+        results = list(annotate_dda(settings[:2], workers=workers,
+                                    solver=fake_solver, cache=cache))
+        assert len(cache) == 2
+        # cached deals are not solved by the solver
+        results += annotate_dda(settings, workers=workers,
+                                solver=fake_solver, cache=cache)
+        assert (cache.hits, cache.misses) == (2, 4)
+        assert len(cache) == 4
+        for setting, result in zip(settings[:2] + settings, results):
+            assert result.board_id == setting.board_id
+            assert result.dda == expected_dda(setting)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            list(annotate_dda(board_settings(1), workers=0))
+        with pytest.raises(ValueError):
+            list(annotate_dda(board_settings(1), workers=2, max_pending=0))
+
+
+def test_main(mocker: MockFixture, tmp_path):
+    # each player has a whole suit, which is solved quickly.
+    hands = Hands(north_hand={Card(r, Suit.S) for r in range(2, 15)},
+                  east_hand={Card(r, Suit.H) for r in range(2, 15)},
+                  south_hand={Card(r, Suit.D) for r in range(2, 15)},
+                  west_hand={Card(r, Suit.C) for r in range(2, 15)})
+    input_path = tmp_path / 'boards.json'
+    output_path = tmp_path / 'output.json'
+    cache_path = tmp_path / 'dda.sqlite3'
+    with open(input_path, 'w') as fp, JsonBoardSettingWriter(fp) as writer:
+        writer.write(board_id='1', dealer=Player.N, deal=hands, vul=Vul.NONE)
+        writer.write(board_id='2', dealer=Player.E, deal=hands, vul=Vul.NS)
+    mocker.patch.object(sys, 'argv', ['bridge-dda', str(input_path),
+                                      '-o', str(output_path), '-w', '1',
+                                      '--cache', str(cache_path)])
+    main()
+
+    with open(output_path, 'r') as fp:
+        results = JsonParser().parse_board_settings(fp)
+    assert [r.board_id for r in results] == ['1', '2']
+    assert results[1].dealer is Player.E
+    for result in results:
+        assert result.hands == hands
+        assert result.dda[Player.N][Suit.S] == 13
+        assert result.dda[Player.N][Suit.H] == 0
+        assert result.dda[Player.E][Suit.NT] == 0
+    # the same deal is solved once
+    with DDACache(cache_path) as cache:
+        assert len(cache) == 1
+
+
+def test_main_without_dds(mocker: MockFixture, tmp_path):
+    input_path = tmp_path / 'boards.json'
+    output_path = tmp_path / 'output.json'
+    hands = Hands(north_hand={Card(r, Suit.S) for r in range(2, 15)},
+                  east_hand={Card(r, Suit.H) for r in range(2, 15)},
+                  south_hand={Card(r, Suit.D) for r in range(2, 15)},
+                  west_hand={Card(r, Suit.C) for r in range(2, 15)})
+    with open(input_path, 'w') as fp, JsonBoardSettingWriter(fp) as writer:
+        writer.write(board_id='1', dealer=Player.N, deal=hands, vul=Vul.NONE)
+    mocker.patch('bridge_env.data_handler.dda_annotator.DDS_AVAILABLE', False)
+    argv = ['bridge-dda', str(input_path), '-o', str(output_path), '-w', '1']
+    mocker.patch.object(sys, 'argv', argv)
+    with pytest.raises(SystemExit):
+        main()
+    assert not output_path.exists()
+
+    mocker.patch.object(sys, 'argv', argv + ['--python_solver'])
+    main()
+    with open(output_path, 'r') as fp:
+        results = JsonParser().parse_board_settings(fp)
+    assert results[0].dda[Player.N][Suit.S] == 13
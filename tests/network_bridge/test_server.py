@@ -1,8 +1,14 @@
+import json
+
 import pytest
 from pytest_mock import MockFixture
 
-from bridge_env import Card, Player, Suit
-from bridge_env.network_bridge.server import PlayerThread, Server
+from bridge_env import Card, Hands, Player, Suit, Vul
+from bridge_env.data_handler.abstract_classes import BoardSetting
+from bridge_env.network_bridge import server as server_module
+from bridge_env.network_bridge.server import PlayerThread, Server, \
+    resume_index
+from ..data_handler import JSON_HANDS1
 
 
 class TestThreadHandler:
@@ -78,3 +84,67 @@ class TestServer:
     ])
     def test_remove_alert_word(self, message, expected):
         assert Server.remove_alert_word(message) == expected
+
+
+def test_resume_index(tmp_path):
+    board_settings = [BoardSetting(hands=Hands.generate_random_hands(),
+                                   dealer=Player.N, vul=Vul.NONE,
+                                   board_id=f'b{i}') for i in range(3)]
+    path = tmp_path / 'log.jsonl'
+    assert resume_index(path, board_settings) == 0
+    path.write_text('{"board_id": "b0"}\n{"board_id": "b1"}\n{"board_')
+    assert resume_index(path, board_settings) == 2
+    # the incomplete line is removed
+    assert path.read_text() == '{"board_id": "b0"}\n{"board_id": "b1"}\n'
+    path.write_text('{"board_id": "x"}\n')
+    with pytest.raises(Exception):
+        resume_index(path, board_settings)
+    with pytest.raises(Exception):
+        resume_index(tmp_path / 'log.json', board_settings)
+
+
+def write_board_settings_file(tmp_path):
+    path = tmp_path / 'boards.jsonl'
+    path.write_text(''.join(
+        json.dumps({'board_id': f'b{i}', 'dealer': 'N', 'deal': JSON_HANDS1,
+                    'vulnerability': 'None'}) + '\n' for i in range(2)))
+    return path
+
+
+def test_main_resume(mocker: MockFixture, tmp_path):
+    server_class = mocker.patch.object(server_module, 'Server')
+    boards = write_board_settings_file(tmp_path)
+    log = tmp_path / 'log.jsonl'
+    log.write_text('{"board_id": "b0"}\n')
+    mocker.patch('sys.argv', ['server', '-b', str(boards), '-o', str(log),
+                              '--resume'])
+    server_module.main()
+    board_settings = server_class.call_args[1]['board_settings']
+    assert [s.board_id for s in board_settings] == ['b1']
+    # all boards are played
+    server_class.reset_mock()
+    log.write_text('{"board_id": "b0"}\n{"board_id": "b1"}\n')
+    server_module.main()
+    server_class.assert_not_called()
+
+
+def test_main_resume_with_restart_index(mocker: MockFixture, tmp_path):
+    boards = write_board_settings_file(tmp_path)
+    mocker.patch('sys.argv', ['server', '-b', str(boards), '-o',
+                              str(tmp_path / 'log.jsonl'), '--resume',
+                              '-r', '1'])
+    with pytest.raises(SystemExit):
+        server_module.main()
+
+
+@pytest.mark.parametrize('name', ['log.json', 'log.jsonl', 'log.pbn'])
+def test_output_file_path(name, tmp_path):
+    server = Server('localhost', 2000, tmp_path / name)
+    assert server.output_file_path == tmp_path / name
+
+
+def test_invalid_output_file_path(tmp_path):
+    with pytest.raises(ValueError):
+        Server('localhost', 2000, tmp_path / 'log.txt')
+    with pytest.raises(ValueError):
+        Server('localhost', 2000, tmp_path / 'log.pbn', append_log=True)
@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from bridge_env import Bid, BiddingPhase, BiddingPhaseState, Contract, \
+    Player, Vul
+from bridge_env.batch_bidding_phase import BatchBiddingPhase, \
+    MAX_AUCTION_LENGTH
+
+
+class TestBatchBiddingPhase:
+    def test_passed_out(self):
+        phase = BatchBiddingPhase(2, dealer=Player.E, vul=Vul.EW)
+        for _ in range(3):
+            states = phase.take_bids(np.array([Bid.Pass.idx] * 2))
+            assert (states == BiddingPhaseState.ONGOING.value).all()
+        states = phase.take_bids(np.array([Bid.Pass.idx] * 2))
+        assert (states == BiddingPhaseState.FINISHED.value).all()
+        assert phase.contract(0) == Contract(None, vul=Vul.EW)
+        # auto reset
+        assert (phase.bid_num == 0).all()
+        assert (phase.active_player == Player.E.value - 1).all()
+
+    def test_contract(self):
+        phase = BatchBiddingPhase(1, dealer=Player.S, vul=Vul.NS)
+        for bid in [Bid.Pass, Bid.D2, Bid.S2, Bid.H4, Bid.X, Bid.Pass,
+                    Bid.NT4, Bid.X, Bid.XX, Bid.Pass, Bid.Pass, Bid.C6,
+                    Bid.Pass, Bid.Pass]:
+            assert phase.take_bids(np.array([bid.idx]))[0] == \
+                BiddingPhaseState.ONGOING.value
+        assert phase.take_bids(np.array([Bid.Pass.idx]))[0] == \
+            BiddingPhaseState.FINISHED.value
+        assert phase.contract(0) == Contract(Bid.C6, vul=Vul.NS,
+                                             declarer=Player.E)
+
+    def test_illegal(self):
+        phase = BatchBiddingPhase(2)
+        phase.take_bids(np.array([Bid.H1.idx, Bid.Pass.idx]))
+        states = phase.take_bids(np.array([Bid.C1.idx, Bid.X.idx]))
+        assert list(states) == [BiddingPhaseState.ILLEGAL.value] * 2
+        assert list(phase.bid_num) == [1, 1]
+        assert list(phase.active_player) == [1, 1]
+
+    def test_without_auto_reset(self):
+        phase = BatchBiddingPhase(1, auto_reset=False)
+        for _ in range(4):
+            phase.take_bids(np.array([Bid.Pass.idx]))
+        assert phase.done[0]
+        with pytest.raises(Exception):
+            phase.take_bids(np.array([Bid.C1.idx]))
+        phase.reset(dealer=Player.W, vul=Vul.BOTH)
+        assert not phase.done[0]
+        assert phase.active_player[0] == Player.W.value - 1
+        assert phase.vul[0] == Vul.BOTH.value - 1
+
+    def test_different_lengths_without_auto_reset(self):
+        phase = BatchBiddingPhase(3, auto_reset=False)
+        auctions = [[Bid.Pass] * 4,
+                    [Bid.C1] + [Bid.Pass] * 3,
+                    [Bid.Pass, Bid.H1, Bid.S1, Bid.NT2] + [Bid.Pass] * 3]
+        finished = set()
+        for i in range(7):
+            bids = [a[i] if i < len(a) else Bid.Pass for a in auctions]
+            states = phase.take_bids(np.array([bid.idx for bid in bids]))
+            for j, a in enumerate(auctions):
+                if j in finished:
+                    assert phase.available_bid[j].tolist() == \
+                        [bid is Bid.Pass for bid in Bid]
+                if i >= len(a) - 1:
+                    finished.add(j)
+                assert states[j] == (BiddingPhaseState.FINISHED.value
+                                     if j in finished else
+                                     BiddingPhaseState.ONGOING.value)
+        assert phase.done.all()
+        assert phase.bid_num.tolist() == [4, 4, 7]
+        assert [phase.contract(j) for j in range(3)] == [
+            Contract(None),
+            Contract(Bid.C1, declarer=Player.N),
+            Contract(Bid.NT2, declarer=Player.W)]
+        # a bid other than Pass in a finished auction
+        with pytest.raises(Exception):
+            phase.take_bids(np.array([Bid.Pass.idx, Bid.C2.idx,
+                                      Bid.Pass.idx]))
+
+    def test_bid_range_exception(self):
+        phase = BatchBiddingPhase(1)
+        with pytest.raises(ValueError):
+            phase.take_bids(np.array([38]))
+        with pytest.raises(ValueError):
+            phase.take_bids(np.array([0, 1]))
+
+    def test_max_auction_length(self):
+        bids = [Bid.Pass] * 3
+        for i in range(35):
+            bids += [Bid.int_to_bid(i), Bid.Pass, Bid.Pass, Bid.X, Bid.Pass,
+                     Bid.Pass, Bid.XX, Bid.Pass, Bid.Pass]
+        bids.append(Bid.Pass)
+        assert len(bids) == MAX_AUCTION_LENGTH
+        phase = BatchBiddingPhase(1, auto_reset=False)
+        for bid in bids:
+            assert phase.take_bids(np.array([bid.idx]))[0] != \
+                BiddingPhaseState.ILLEGAL.value
+        assert phase.done[0]
+        assert phase.contract(0) == Contract(Bid.NT7, x=True, xx=True,
+                                             declarer=Player.W)
+
+    # compares with BiddingPhase on random auctions
+    def test_random_auctions(self):
+        n = 64
+        rng = np.random.default_rng(0)
+        dealers = rng.integers(4, size=n)
+        vuls = rng.integers(4, size=n)
+        batch = BatchBiddingPhase(n, dealer=dealers, vul=vuls)
+        phases = [BiddingPhase(Player(int(d) + 1), Vul(int(v) + 1))
+                  for d, v in zip(dealers, vuls)]
+        finished = 0
+        for _ in range(200):
+            # mostly legal bids, biased to Pass
+            bids = rng.integers(38, size=n)
+            bids[rng.random(n) < 0.6] = Bid.Pass.idx
+            for i, phase in enumerate(phases):
+                assert batch.active_player[i] == phase.active_player.value - 1
+                assert (batch.available_bid[i] ==
+                        phase.available_bid.astype(bool)).all()
+            states = batch.take_bids(bids)
+            for i in range(n):
+                state = phases[i].take_bid(Bid.int_to_bid(int(bids[i])))
+                assert states[i] == state.value
+                if state is BiddingPhaseState.FINISHED:
+                    assert batch.contract(i) == phases[i].contract()
+                    phases[i] = BiddingPhase(phases[i].dealer, phases[i].vul)
+                    finished += 1
+        assert finished > 0
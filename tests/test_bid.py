@@ -2,6 +2,7 @@ import pytest
 
 from bridge_env import Bid
 from bridge_env import Suit
+from bridge_env.bid import BID_LEVELS, BID_STRAINS, BIDS
 
 
 class TestBid:
@@ -75,6 +76,12 @@ class TestBid:
     def test_convert_level_suit_to_bid(self, num, suit, expected):
         assert Bid.level_suit_to_bid(num, suit) is expected
 
+    @pytest.mark.parametrize('level', [0, 8, -1])
+    @pytest.mark.parametrize('suit', list(Suit))
+    def test_convert_level_suit_to_bid_exception(self, level, suit):
+        with pytest.raises(ValueError):
+            Bid.level_suit_to_bid(level, suit)
+
     @pytest.mark.parametrize(('str_bid', 'expected'),
                              [('1C', Bid.C1),
                               ('7NT', Bid.NT7),
@@ -83,3 +90,19 @@ class TestBid:
                               ('XX', Bid.XX)])
     def test_str_to_bid(self, str_bid, expected):
         assert Bid.str_to_bid(str_bid) is expected
+
+    @pytest.mark.parametrize('bid', list(Bid))
+    def test_idx_tables(self, bid):
+        assert BIDS[bid.idx] is bid
+        if bid.level is None:
+            assert BID_LEVELS[bid.idx] == 0
+            assert BID_STRAINS[bid.idx] == -1
+        else:
+            assert BID_LEVELS[bid.idx] == bid.level
+            assert BID_STRAINS[bid.idx] == bid.suit.value - 1
+        assert Bid.str_to_bid(str(bid)) is bid
+
+    @pytest.mark.parametrize('str_bid', ['8C', '1N', 'P'])
+    def test_str_to_bid_exception(self, str_bid):
+        with pytest.raises(KeyError):
+            Bid.str_to_bid(str_bid)
@@ -1,5 +1,7 @@
-from bridge_env import Bid, BiddingPhase, BiddingPhaseState, Contract, Player, \
-    Suit, Vul
+import pytest
+
+from bridge_env import Bid, BiddingPhase, BiddingPhaseState, \
+    BiddingSnapshot, Contract, Player, Suit, Vul
 
 
 class TestBiddingPhase:
@@ -66,3 +68,79 @@ class TestBiddingPhase:
         assert contract.trump is Suit.C
         assert not contract.is_vul()
         assert str(contract) == '6C'
+
+    def test_undo_bid(self):
+        bp = BiddingPhase(dealer=Player.S, vul=Vul.NS)
+        for bid in [Bid.Pass, Bid.D2, Bid.S2, Bid.H4, Bid.X]:
+            bp.take_bid(bid)
+        available_bid = bp.available_bid.copy()
+        bp.take_bid(Bid.NT4)
+        assert bp.undo_bid() is Bid.NT4
+        assert (bp.available_bid == available_bid).all()
+        assert bp.active_player is Player.W
+        assert bp.take_bid(Bid.X) is BiddingPhaseState.ILLEGAL
+
+        for bid in [Bid.Pass, Bid.Pass, Bid.Pass]:
+            bp.take_bid(bid)
+        assert bp.has_done()
+        assert bp.undo_bid() is Bid.Pass
+        assert not bp.has_done()
+        assert bp.take_bid(Bid.XX) is BiddingPhaseState.ONGOING
+        assert bp.bid_history == [Bid.Pass, Bid.D2, Bid.S2, Bid.H4, Bid.X,
+                                  Bid.Pass, Bid.Pass, Bid.XX]
+
+        while bp.bid_history:
+            bp.undo_bid()
+        with pytest.raises(Exception):
+            bp.undo_bid()
+        assert bp.active_player is Player.S
+
+    def test_available_bid_after_finished(self):
+        bp = BiddingPhase(dealer=Player.N)
+        for bid in [Bid.C1, Bid.Pass, Bid.Pass, Bid.Pass]:
+            bp.take_bid(bid)
+        assert bp.has_done()
+        assert not bp.available_bid.any()
+        bp.undo_bid()
+        assert bp.available_bid[Bid.Pass.idx] == 1
+
+    def test_players_bid_history(self):
+        bp = BiddingPhase(dealer=Player.W)
+        for bid in [Bid.C1, Bid.D1, Bid.H1, Bid.S1, Bid.NT1]:
+            bp.take_bid(bid)
+        assert bp.players_bid_history == {Player.W: [Bid.C1, Bid.NT1],
+                                          Player.N: [Bid.D1],
+                                          Player.E: [Bid.H1],
+                                          Player.S: [Bid.S1]}
+        # a new list is returned
+        bp.bid_history.append(Bid.Pass)
+        assert bp.bid_history == [Bid.C1, Bid.D1, Bid.H1, Bid.S1, Bid.NT1]
+
+    def test_clone(self):
+        bp = BiddingPhase(dealer=Player.E)
+        for bid in [Bid.C1, Bid.Pass, Bid.Pass]:
+            bp.take_bid(bid)
+        clone = bp.clone()
+        assert clone.take_bid(Bid.Pass) is BiddingPhaseState.FINISHED
+        assert bp.take_bid(Bid.X) is BiddingPhaseState.ONGOING
+        assert clone.contract() == Contract(Bid.C1, declarer=Player.E)
+        assert bp.bid_history == [Bid.C1, Bid.Pass, Bid.Pass, Bid.X]
+        assert clone.players_bid_history[Player.N] == [Bid.Pass]
+
+    def test_snapshot(self):
+        bp = BiddingPhase(dealer=Player.W, vul=Vul.BOTH)
+        for bid in [Bid.H1, Bid.X, Bid.XX, Bid.S2]:
+            bp.take_bid(bid)
+        snapshot = bp.snapshot()
+        assert snapshot == BiddingSnapshot(Player.W, Vul.BOTH,
+                                           bytes([2, 36, 37, 8]))
+        assert hash(snapshot) == hash(bp.clone().snapshot())
+
+        restored = BiddingPhase.restore(snapshot)
+        assert restored.snapshot() == snapshot
+        assert restored.active_player is bp.active_player
+        assert (restored.available_bid == bp.available_bid).all()
+
+        with pytest.raises(ValueError):
+            BiddingPhase.restore(BiddingSnapshot(Player.N, Vul.NONE,
+                                                 bytes([2, 1])))
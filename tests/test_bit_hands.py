@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from bridge_env import BitHands, Card, Player, Suit
+from bridge_env.bit_hands import cards_to_mask, iter_bits, mask_to_cards, \
+    popcount
+from tests.data_handler import HANDS1, HANDS2, HANDS3, PBN_HANDS1, PBN_HANDS2, \
+    PBN_HANDS3
+from tests import test_hands
+
+
+class TestBitHands:
+    @pytest.mark.parametrize(('mask', 'expected'),
+                             [(0, []),
+                              (1, [0]),
+                              (0b1010, [1, 3]),
+                              (1 << 51 | 1 << 13, [13, 51])])
+    def test_iter_bits(self, mask, expected):
+        assert list(iter_bits(mask)) == expected
+        assert popcount(mask) == len(expected)
+
+    @pytest.mark.parametrize('hands', [HANDS1, HANDS2, HANDS3])
+    def test_mask_round_trip(self, hands):
+        for p in Player:
+            assert mask_to_cards(cards_to_mask(hands[p])) == hands[p]
+
+    @pytest.mark.parametrize('hands', [HANDS1, HANDS2, HANDS3])
+    def test_convert_hands(self, hands):
+        bit_hands = BitHands.convert_hands(hands)
+        assert bit_hands.to_hands() == hands
+        for p in Player:
+            assert bit_hands.cards(p) == hands[p]
+
+    @pytest.mark.parametrize(('hands', 'dealer', 'expected'),
+                             [(HANDS1, Player.N, PBN_HANDS1),
+                              (HANDS2, Player.E, PBN_HANDS2),
+                              (HANDS3, Player.W, PBN_HANDS3)])
+    def test_to_pbn(self, hands, dealer, expected):
+        assert BitHands.convert_hands(hands).to_pbn(dealer) == expected
+
+    @pytest.mark.parametrize(('pbn_hands', 'expected'),
+                             [(PBN_HANDS1, HANDS1),
+                              (PBN_HANDS2, HANDS2),
+                              (PBN_HANDS3, HANDS3)])
+    def test_convert_pbn(self, pbn_hands, expected):
+        assert BitHands.convert_pbn(pbn_hands) == \
+               BitHands.convert_hands(expected)
+
+    @pytest.mark.parametrize(('hands', 'expected'),
+                             [(HANDS1, test_hands.TestHands.BINARY_HANDS1),
+                              (HANDS2, test_hands.TestHands.BINARY_HANDS2),
+                              (HANDS3, test_hands.TestHands.BINARY_HANDS3)])
+    def test_to_binary(self, hands, expected):
+        bit_hands = BitHands.convert_hands(hands)
+        binary = bit_hands.to_binary()
+        np_binary = bit_hands.to_np_binary()
+        for p in Player:
+            assert binary[p] == expected[p]
+            np.testing.assert_array_equal(np_binary[p], expected[p])
+
+    def test_has_card_and_owner(self):
+        bit_hands = BitHands.convert_hands(HANDS1)
+        for p in Player:
+            for card in HANDS1[p]:
+                assert bit_hands.has_card(p, card)
+                assert bit_hands.owner(card) is p
+            assert not bit_hands.has_card(p.next_player,
+                                          next(iter(HANDS1[p])))
+        assert BitHands.convert_hands(HANDS3).owner(Card(9, Suit.S)) is None
+
+    def test_suit_lengths(self):
+        # N:4.KJ32.842.AQ743
+        bit_hands = BitHands.convert_hands(HANDS1)
+        assert bit_hands.suit_lengths(Player.N) == (5, 3, 4, 1)
+        assert bit_hands.suit_length(Player.N, Suit.H) == 4
+        assert bit_hands.hand_length(Player.N) == 13
+        # KJ32 of hearts: bits of 2, 3, J and K
+        assert bit_hands.suit_bits(Player.N, Suit.H) == 0b101000000011
+        with pytest.raises(ValueError):
+            bit_hands.suit_bits(Player.N, Suit.NT)
+
+    def test_hash(self):
+        assert hash(BitHands.convert_hands(HANDS1)) == hash(
+            BitHands.convert_pbn(PBN_HANDS1))
+        assert len({BitHands.convert_hands(HANDS1),
+                    BitHands.convert_pbn(PBN_HANDS1),
+                    BitHands.convert_hands(HANDS2)}) == 2
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            BitHands(1, 1, 0, 0)
+        with pytest.raises(ValueError):
+            BitHands(1 << 52, 0, 0, 0)
+        with pytest.raises(KeyError):
+            BitHands(0, 0, 0, 0)['N']
@@ -0,0 +1,86 @@
+import itertools
+import random
+
+from bridge_env import Card, Hands, Player, Suit
+from bridge_env.canonical_deal import DealTransform, canonical_key, \
+    canonicalize, canonicalize_masks
+from bridge_env.double_dummy import calc_dda_masks
+
+
+def random_masks(rng: random.Random, n: int = 13):
+    cards = list(range(52))
+    rng.shuffle(cards)
+    return tuple(sum(1 << c for c in cards[i * n:(i + 1) * n])
+                 for i in range(4))
+
+
+def random_transform(rng: random.Random) -> DealTransform:
+    suit_map = list(range(4))
+    rng.shuffle(suit_map)
+    return DealTransform(rng.randrange(4), tuple(suit_map))
+
+
+class TestDealTransform:
+    def test_player_and_suit(self):
+        transform = DealTransform(1, (3, 2, 1, 0))
+        assert transform.player(Player.E) is Player.N
+        assert transform.player(Player.N) is Player.W
+        assert transform.suit(Suit.C) is Suit.S
+        assert transform.suit(Suit.H) is Suit.D
+        assert transform.suit(Suit.NT) is Suit.NT
+
+    def test_apply_masks(self):
+        def mask(cards: str):
+            return sum(1 << int(Card.str_to_card(c)) for c in cards.split())
+
+        masks = (mask('SA'), mask('HK'), mask('D2'), mask('C3'))
+        transform = DealTransform(1, (3, 2, 1, 0))
+        assert transform.apply_masks(masks) == \
+            (mask('DK'), mask('H2'), mask('S3'), mask('CA'))
+
+    def test_dda(self):
+        rng = random.Random(0)
+        dda = {p: {s: rng.randint(0, 13) for s in Suit} for p in Player}
+        transform = random_transform(rng)
+        canonical = transform.to_canonical_dda(dda)
+        assert list(canonical) == list(Player)
+        assert list(canonical[Player.N]) == list(Suit)
+        for p, s in itertools.product(Player, Suit):
+            assert canonical[transform.player(p)][transform.suit(s)] == \
+                dda[p][s]
+        assert transform.to_original_dda(canonical) == dda
+
+
+class TestCanonicalize:
+    def test_equivalent_deals(self):
+        rng = random.Random(1)
+        for _ in range(20):
+            masks = random_masks(rng)
+            canonical, transform = canonicalize_masks(masks)
+            assert transform.apply_masks(masks) == canonical
+            other = random_transform(rng).apply_masks(masks)
+            assert canonicalize_masks(other)[0] == canonical
+            assert canonical_key(other) == canonical_key(masks)
+            assert len(canonical_key(masks)) == 12
+        assert canonical_key(random_masks(rng)) != \
+            canonical_key(random_masks(rng))
+
+    def test_dda(self):
+        rng = random.Random(2)
+        masks = random_masks(rng, 3)
+        canonical, transform = canonicalize_masks(masks)
+        assert transform.to_original_dda(calc_dda_masks(canonical)) == \
+            calc_dda_masks(masks)
+
+    def test_hands(self):
+        rng = random.Random(3)
+        masks = random_masks(rng)
+        hands = Hands.from_ordinal(int.from_bytes(canonical_key(masks),
+                                                  'big'))
+        canonical, transform = canonicalize(hands)
+        assert canonical == hands
+        rotated = Hands(north_hand=hands.east, east_hand=hands.south,
+                        south_hand=hands.west, west_hand=hands.north)
+        canonical, transform = canonicalize(rotated)
+        assert canonical == hands
+        assert transform.rotation == 3
@@ -1,4 +1,6 @@
+import copy
 import operator
+import pickle
 
 import pytest
 
@@ -88,3 +90,34 @@ class TestCard:
     def test_suit_exception(self):
         with pytest.raises(ValueError):
             Card(2, Suit.NT)
+
+    @pytest.mark.parametrize('x', [0, 12, 25, 38, 51])
+    def test_int_to_card_interned(self, x):
+        card = Card.int_to_card(x)
+        assert Card.int_to_card(x) is card
+        assert Card.str_to_card(str(card)) is card
+        assert Card.rank_suit_to_card(card.rank, card.suit) is card
+
+    @pytest.mark.parametrize(('rank', 'suit'), [(1, Suit.C), (15, Suit.S),
+                                                (2, Suit.NT)])
+    def test_rank_suit_to_card_exception(self, rank, suit):
+        with pytest.raises(ValueError):
+            Card.rank_suit_to_card(rank, suit)
+
+    @pytest.mark.parametrize('x', ['C1', 'S10', 'XA'])
+    def test_str_to_card_exception(self, x):
+        with pytest.raises((ValueError, KeyError)):
+            Card.str_to_card(x)
+
+    def test_copy(self):
+        card = Card.int_to_card(10)
+        assert copy.copy(card) is card
+        assert copy.deepcopy([card])[0] is card
+        assert pickle.loads(pickle.dumps(card)) is card
+
+    def test_slots(self):
+        card = Card(4, Suit.S)
+        assert not hasattr(card, '__dict__')
+        assert hash(card) == hash(Card.int_to_card(int(card)))
+        with pytest.raises(AttributeError):
+            card.rank = 5
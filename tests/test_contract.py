@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from bridge_env import Bid, Contract, Player, Vul
@@ -59,3 +61,8 @@ class TestContract:
     ])
     def test_str_to_contract(self, str_contract, vul, declarer, expected):
         assert Contract.str_to_contract(str_contract, vul, declarer) == expected
+
+    @pytest.mark.parametrize('contract', [CONTRACT_1CXX, CONTRACT_6S])
+    def test_pickle(self, contract):
+        assert not hasattr(contract, '__dict__')
+        assert pickle.loads(pickle.dumps(contract)) == contract
@@ -0,0 +1,124 @@
+import random
+
+import pytest
+from pytest_mock import MockFixture
+
+from bridge_env import Player, Suit
+from bridge_env import dda_cache
+from bridge_env.dda_cache import CACHE_PATH_ENV, DDACache, \
+    get_default_cache, set_default_cache
+
+
+def random_masks(rng: random.Random):
+    cards = list(range(52))
+    rng.shuffle(cards)
+    return tuple(sum(1 << c for c in cards[i * 13:(i + 1) * 13])
+                 for i in range(4))
+
+
+def random_dda(rng: random.Random):
+    return {p: {s: rng.randint(0, 13) for s in Suit} for p in Player}
+
+
+class TestDDACache:
+    def test_get_put(self):
+        rng = random.Random(0)
+        masks = random_masks(rng)
+        dda = random_dda(rng)
+        cache = DDACache()
+        assert cache.get(masks) is None
+        cache.put(masks, dda)
+        assert len(cache) == 1
+        assert cache.get(masks) == dda
+        assert list(cache.get(masks)) == list(Player)
+        assert (cache.hits, cache.misses) == (2, 1)
+        # a rotated deal shares the table
+        rotated = cache.get(masks[1:] + masks[:1])
+        assert rotated == {p: dda[p.next_player] for p in Player}
+        # swap a card of north and east
+        swap = (masks[0] & -masks[0]) | (masks[1] & -masks[1])
+        assert cache.get((masks[0] ^ swap, masks[1] ^ swap) + masks[2:]) \
+            is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_deal(self):
+        cache = DDACache()
+        with pytest.raises(ValueError):
+            cache.get((1, 2, 4, 8))
+
+    def test_lru(self):
+        rng = random.Random(1)
+        deals = [(random_masks(rng), random_dda(rng)) for _ in range(4)]
+        cache = DDACache(max_size=3)
+        for masks, dda in deals[:3]:
+            cache.put(masks, dda)
+        # deal 0 is used, so deal 1 is the least recently used.
+        assert cache.get(deals[0][0]) == deals[0][1]
+        cache.put(*deals[3])
+        assert len(cache) == 3
+        assert cache.get(deals[1][0]) is None
+        for masks, dda in (deals[0], deals[2], deals[3]):
+            assert cache.get(masks) == dda
+
+    def test_batch_eviction(self):
+        rng = random.Random(3)
+        deals = [(random_masks(rng), random_dda(rng)) for _ in range(201)]
+        cache = DDACache(max_size=200)
+        for masks, dda in deals[:200]:
+            cache.put(masks, dda)
+        # replacing a table doesn't evict
+        cache.put(*deals[0])
+        assert len(cache) == 200
+        # 1 overflowing table and 2 more tables are evicted
+        cache.put(*deals[200])
+        assert len(cache) == 198
+        for masks, _ in deals[1:4]:
+            assert cache.get(masks) is None
+        for masks, dda in [deals[0]] + deals[4:]:
+            assert cache.get(masks) == dda
+
+    def test_get_commits(self, tmp_path):
+        rng = random.Random(4)
+        masks = random_masks(rng)
+        dda = random_dda(rng)
+        with DDACache(tmp_path / 'dda.sqlite3') as cache:
+            cache.put(masks, dda)
+            cache.get(masks)
+            assert not cache._connection.in_transaction
+            cache.close()
+
+    def test_persistence(self, tmp_path):
+        rng = random.Random(2)
+        deals = [(random_masks(rng), random_dda(rng)) for _ in range(3)]
+        path = tmp_path / 'dda.sqlite3'
+        with DDACache(path) as cache:
+            for masks, dda in deals:
+                cache.put(masks, dda)
+            cache.get(deals[0][0])
+        # the recency is kept after reopening
+        with DDACache(path, max_size=2) as cache:
+            assert len(cache) == 3
+            cache.put(*deals[2])
+            assert len(cache) == 2
+            assert cache.get(deals[1][0]) is None
+            assert cache.get(deals[0][0]) == deals[0][1]
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            DDACache(max_size=0)
+
+
+def test_default_cache(mocker: MockFixture, tmp_path):
+    mocker.patch.object(dda_cache, '_default_cache', None)
+    mocker.patch.object(dda_cache, '_default_cache_loaded', False)
+    path = tmp_path / 'dda.sqlite3'
+    mocker.patch.dict('os.environ', {CACHE_PATH_ENV: str(path)})
+    register = mocker.patch.object(dda_cache.atexit, 'register')
+    cache = get_default_cache()
+    assert isinstance(cache, DDACache)
+    assert get_default_cache() is cache
+    register.assert_called_once_with(cache.close)
+    cache.close()
+    set_default_cache(None)
+    assert get_default_cache() is None
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from bridge_env import Card, Player, Suit, Vul
+from bridge_env.deal_constraint import DealConstraint, HandConstraint, \
+    generate_constrained_owners, iter_board_settings, \
+    iter_constrained_hands, parse_shape
+from bridge_env.hand_features import hcp, suit_lengths
+
+
+class TestParseShape:
+    @pytest.mark.parametrize(('pattern', 'expected'), [
+        ('5431', {(1, 3, 4, 5)}),
+        ('any 4333', {(4, 3, 3, 3), (3, 4, 3, 3), (3, 3, 4, 3),
+                      (3, 3, 3, 4)}),
+        ('7xx0', {(0, 0, 6, 7), (0, 1, 5, 7), (0, 2, 4, 7), (0, 3, 3, 7),
+                  (0, 4, 2, 7), (0, 5, 1, 7), (0, 6, 0, 7)}),
+        ('5555', set()),
+        ('(10)210', {(0, 1, 2, 10)}),
+        ('any (11)x00', {(0, 0, 2, 11), (0, 0, 11, 2), (0, 2, 0, 11),
+                         (0, 2, 11, 0), (0, 11, 0, 2), (0, 11, 2, 0),
+                         (2, 0, 0, 11), (2, 0, 11, 0), (2, 11, 0, 0),
+                         (11, 0, 0, 2), (11, 0, 2, 0), (11, 2, 0, 0)}),
+    ])
+    def test_parse_shape(self, pattern, expected):
+        assert parse_shape(pattern) == expected
+
+    def test_parse_shape_count(self):
+        assert len(parse_shape('any 4432')) == 12
+        assert len(parse_shape('xxxx')) == 560
+
+    @pytest.mark.parametrize('pattern', ['543', 'any 54321', '5a31', '(14)xxx',
+                                         '(9)xxx'])
+    def test_parse_shape_exception(self, pattern):
+        with pytest.raises(ValueError):
+            parse_shape(pattern)
+
+
+class TestDealConstraint:
+    def test_hand_constraint(self):
+        constraint = DealConstraint(hands={
+            Player.N: HandConstraint(hcp=(15, 17),
+                                     shapes=('any 4333', 'any 4432',
+                                             'any 5332')),
+            Player.E: HandConstraint(lengths={Suit.S: (6, 13)},
+                                     cards=frozenset([Card(14, Suit.S)])),
+        })
+        owners = generate_constrained_owners(50, constraint, rng=0)
+        assert owners.shape == (50, 52)
+        north = owners == 0
+        east = owners == 1
+        assert ((15 <= hcp(north)) & (hcp(north) <= 17)).all()
+        lengths = suit_lengths(north)
+        assert (lengths.max(axis=1) <= 5).all()
+        assert (lengths.min(axis=1) >= 2).all()
+        assert (suit_lengths(east)[:, 3] >= 6).all()
+        assert (owners[:, int(Card(14, Suit.S))] == 1).all()
+
+    def test_predicate(self):
+        def ns_hcp(owners):
+            return hcp((owners == 0) | (owners == 2)) >= 30
+
+        owners = generate_constrained_owners(
+            20, DealConstraint(predicate=ns_hcp), rng=1)
+        assert ns_hcp(owners).all()
+
+    def test_seed(self):
+        constraint = DealConstraint(hands={Player.S: HandConstraint(
+            hcp=(12, 14))})
+        np.testing.assert_array_equal(
+            generate_constrained_owners(10, constraint, rng=3),
+            generate_constrained_owners(10, constraint, rng=3))
+
+    def test_max_generated(self):
+        impossible = DealConstraint(hands={Player.N: HandConstraint(
+            shapes=('5555',))})
+        with pytest.raises(Exception):
+            generate_constrained_owners(1, impossible, max_generated=2000)
+
+    def test_iter_constrained_hands(self):
+        constraint = DealConstraint(hands={Player.W: HandConstraint(
+            lengths={Suit.H: (0, 0)})})
+        hands_list = list(iter_constrained_hands(5, constraint, rng=2))
+        assert len(hands_list) == 5
+        for hands in hands_list:
+            assert all(card.suit is not Suit.H for card in hands[Player.W])
+
+    def test_iter_board_settings(self):
+        settings = list(iter_board_settings(5, DealConstraint(), rng=4,
+                                            first_board_num=3))
+        assert [s.board_id for s in settings] == ['3', '4', '5', '6', '7']
+        assert [s.dealer for s in settings] == [Player.S, Player.W, Player.N,
+                                                Player.E, Player.S]
+        assert [s.vul for s in settings] == [Vul.EW, Vul.BOTH, Vul.NS,
+                                             Vul.EW, Vul.BOTH]
+        fixed = next(iter_board_settings(1, DealConstraint(), rng=4,
+                                         dealer=Player.W, vul=Vul.NONE))
+        assert fixed.dealer is Player.W
+        assert fixed.vul is Vul.NONE
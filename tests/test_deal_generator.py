@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from bridge_env import BitHands, DealBatch, Player
+from bridge_env.deal_generator import generate_deals, generate_owners, \
+    hands_to_owners, owners_to_hands, owners_to_masks, owners_to_tensor, \
+    tensor_to_owners
+from tests.data_handler import HANDS1, HANDS2, HANDS3
+
+
+class TestDealGenerator:
+    def test_generate_owners(self):
+        owners = generate_owners(100, rng=0)
+        assert owners.shape == (100, 52)
+        assert owners.dtype == np.uint8
+        for s in range(4):
+            np.testing.assert_array_equal((owners == s).sum(axis=1), 13)
+
+    def test_seed(self):
+        np.testing.assert_array_equal(generate_owners(10, rng=3),
+                                      generate_owners(10, rng=3))
+        assert not np.array_equal(generate_owners(10, rng=3),
+                                  generate_owners(10, rng=4))
+        rng = np.random.default_rng(5)
+        first = generate_owners(10, rng=rng)
+        assert not np.array_equal(first, generate_owners(10, rng=rng))
+
+    def test_generate_owners_exception(self):
+        with pytest.raises(ValueError):
+            generate_owners(-1)
+
+    def test_tensor(self):
+        owners = generate_owners(20, rng=1)
+        tensor = owners_to_tensor(owners)
+        assert tensor.shape == (20, 4, 52)
+        assert tensor.dtype == bool
+        np.testing.assert_array_equal(tensor.sum(axis=1), 1)
+        np.testing.assert_array_equal(tensor_to_owners(tensor), owners)
+        np.testing.assert_array_equal(generate_deals(20, rng=1, tensor=True),
+                                      tensor)
+
+    @pytest.mark.parametrize('hands', [HANDS1, HANDS2])
+    def test_hands_round_trip(self, hands):
+        owners = hands_to_owners(hands)
+        assert owners_to_hands(owners) == hands
+        masks = owners_to_masks(owners[np.newaxis])[0]
+        assert BitHands(*(int(m) for m in masks)) == \
+               BitHands.convert_hands(hands)
+
+    def test_hands_to_owners_exception(self):
+        with pytest.raises(ValueError):
+            hands_to_owners(HANDS3)
+
+
+class TestDealBatch:
+    def test_lazy_hands(self):
+        batch = DealBatch.generate(5, rng=2)
+        assert len(batch) == 5
+        hands_list = batch.to_hands_list()
+        assert len(hands_list) == 5
+        for i, hands in enumerate(hands_list):
+            assert hands == batch[i]
+            assert batch.bit_hands(i) == BitHands.convert_hands(hands)
+            for p in Player:
+                assert len(hands[p]) == 13
+
+    def test_from_hands(self):
+        batch = DealBatch.from_hands([HANDS1, HANDS2])
+        assert batch[0] == HANDS1
+        assert batch[1] == HANDS2
+        assert batch.to_tensor().shape == (2, 4, 52)
+        assert batch.to_masks().shape == (2, 4)
+
+    def test_bit_hands_index(self):
+        batch = DealBatch.from_hands([HANDS1, HANDS2])
+        assert batch.bit_hands(-1) == BitHands.convert_hands(HANDS2)
+        assert batch.bit_hands(-2) == BitHands.convert_hands(HANDS1)
+        with pytest.raises(IndexError):
+            batch.bit_hands(2)
+        with pytest.raises(IndexError):
+            batch.bit_hands(-3)
+
+    def test_concatenate(self):
+        batch = DealBatch.concatenate([DealBatch.from_hands([HANDS1]),
+                                       DealBatch.from_hands([HANDS2])])
+        assert list(batch) == [HANDS1, HANDS2]
+        assert len(DealBatch.concatenate([])) == 0
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            DealBatch(np.zeros((3, 51), dtype=np.uint8))
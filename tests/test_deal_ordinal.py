@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from bridge_env import BitHands, Hands
+from bridge_env.deal_generator import generate_owners, owners_to_masks
+from bridge_env.deal_ordinal import DEAL_COUNT, ORDINAL_BYTES, \
+    masks_to_ordinal, ordinal_to_masks, ordinals_to_owners, owners_to_ordinals
+from tests.data_handler import HANDS1, HANDS2, HANDS3
+
+
+class TestDealOrdinal:
+    def test_deal_count(self):
+        assert DEAL_COUNT == 53644737765488792839237440000
+        assert (DEAL_COUNT - 1).bit_length() <= ORDINAL_BYTES * 8
+
+    @pytest.mark.parametrize('ordinal', [0, 1, 12345678901234567890,
+                                         DEAL_COUNT // 2, DEAL_COUNT - 1])
+    def test_round_trip(self, ordinal):
+        masks = ordinal_to_masks(ordinal)
+        assert masks_to_ordinal(masks) == ordinal
+        assert Hands.from_ordinal(ordinal).to_ordinal() == ordinal
+        assert BitHands.from_ordinal(ordinal).masks == masks
+
+    def test_first_and_last(self):
+        # The first deal: N has clubs, E diamonds, S hearts and W spades.
+        assert ordinal_to_masks(0) == (0x1fff, 0x1fff << 13, 0x1fff << 26,
+                                       0x1fff << 39)
+        assert ordinal_to_masks(DEAL_COUNT - 1) == (0x1fff << 39, 0x1fff << 26,
+                                                    0x1fff << 13, 0x1fff)
+
+    @pytest.mark.parametrize('hands', [HANDS1, HANDS2])
+    def test_hands(self, hands):
+        ordinal = hands.to_ordinal()
+        assert 0 <= ordinal < DEAL_COUNT
+        assert Hands.from_ordinal(ordinal) == hands
+        assert BitHands.convert_hands(hands).to_ordinal() == ordinal
+
+    def test_batch(self):
+        owners = generate_owners(200, rng=0)
+        ordinals = owners_to_ordinals(owners)
+        assert ordinals.shape == (200,)
+        masks = owners_to_masks(owners)
+        for ordinal, mask in zip(ordinals, masks):
+            assert ordinal == masks_to_ordinal([int(m) for m in mask])
+        np.testing.assert_array_equal(ordinals_to_owners(ordinals), owners)
+        assert len(set(ordinals)) == 200
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            HANDS3.to_ordinal()
+        with pytest.raises(ValueError):
+            ordinal_to_masks(DEAL_COUNT)
+        with pytest.raises(ValueError):
+            ordinal_to_masks(-1)
+        with pytest.raises(ValueError):
+            ordinals_to_owners([DEAL_COUNT])
+        with pytest.raises(ValueError):
+            owners_to_ordinals(np.zeros((1, 52), dtype=np.uint8))
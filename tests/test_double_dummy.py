@@ -0,0 +1,200 @@
+import random
+
+import pytest
+from pytest_mock import MockFixture
+
+import bridge_env.double_dummy
+
+from bridge_env import Card, Hands, Player, Suit
+from bridge_env.bit_hands import cards_to_mask, iter_bits
+from bridge_env.dda_cache import DDACache
+from bridge_env.double_dummy import DDA_SUITS, DoubleDummySolver, calc_dda, \
+    calc_dda_masks, calc_dda_masks_dds, calc_dda_masks_python, solve_position
+from bridge_env.play_engine import NT_STRAIN, PlayEngine
+from tests.data_handler import HANDS1
+
+
+def minimax(engine: PlayEngine) -> int:
+    # NS tricks of the remaining tricks by searching all plays
+    if engine.has_done():
+        return 0
+    is_ns = engine.active_player % 2 == 0
+    values = []
+    for card in list(iter_bits(engine.legal_moves())):
+        tricks = engine.tricks[0]
+        engine.play(card)
+        values.append(engine.tricks[0] - tricks + minimax(engine))
+        engine.undo()
+    return max(values) if is_ns else min(values)
+
+
+def random_hands(rng: random.Random, n: int):
+    cards = list(range(52))
+    rng.shuffle(cards)
+    return tuple(sum(1 << c for c in cards[i * n:(i + 1) * n])
+                 for i in range(4))
+
+
+def to_mask(cards: str) -> int:
+    return sum(1 << int(Card.str_to_card(c)) for c in cards.split())
+
+
+class TestDoubleDummySolver:
+    @pytest.mark.parametrize('seed', range(4))
+    def test_compare_with_minimax(self, seed):
+        rng = random.Random(seed)
+        for n in (1, 2, 3, 3):
+            hands = random_hands(rng, n)
+            trump = rng.randint(0, NT_STRAIN)
+            # all leaders share the transposition table
+            solver = DoubleDummySolver(hands, trump)
+            for leader in rng.sample(range(4), 4):
+                assert solver.ns_tricks(leader) == \
+                    minimax(PlayEngine(hands, trump, leader))
+
+    @pytest.mark.parametrize('seed', range(2))
+    def test_shared_table(self, seed):
+        rng = random.Random(seed)
+        hands = random_hands(rng, 3)
+        table = DoubleDummySolver(hands, NT_STRAIN).table
+        for trump in rng.sample(range(NT_STRAIN + 1), NT_STRAIN + 1):
+            solver = DoubleDummySolver(hands, trump, table)
+            assert solver.table is table
+            for leader in range(4):
+                assert solver.ns_tricks(leader) == \
+                    minimax(PlayEngine(hands, trump, leader))
+
+    def test_guess(self):
+        rng = random.Random(10)
+        hands = random_hands(rng, 4)
+        expected = minimax(PlayEngine(hands, NT_STRAIN, 0))
+        for guess in range(5):
+            solver = DoubleDummySolver(hands, NT_STRAIN)
+            assert solver.ns_tricks(0, guess) == expected
+
+    def test_finesse(self):
+        hands = (to_mask('SA SQ'), to_mask('H2 H3'),
+                 to_mask('S2 S3'), to_mask('SK S4'))
+        solver = DoubleDummySolver(hands, NT_STRAIN)
+        # south leads toward the tenace
+        assert solver.ns_tricks(2) == 2
+        assert solver.ns_tricks(3) == 2
+        assert solver.ns_tricks(0) == 1
+        # east cashes hearts
+        assert solver.ns_tricks(1) == 0
+
+    def test_declarer_tricks(self):
+        hands = (to_mask('SA SK'), to_mask('HA HK'),
+                 to_mask('S2 S3'), to_mask('DA DK'))
+        solver = DoubleDummySolver(hands, Suit.S.value - 1)
+        # east leads hearts and south ruffs
+        assert solver.declarer_tricks(Player.N) == 2
+        # north leads spades
+        assert solver.declarer_tricks(Player.W) == 0
+
+    def test_invalid_hands(self):
+        with pytest.raises(ValueError):
+            DoubleDummySolver((to_mask('SA'), to_mask('SK SQ'),
+                               to_mask('S2'), to_mask('S3')), NT_STRAIN)
+        with pytest.raises(ValueError):
+            DoubleDummySolver((to_mask('SA'), to_mask('SA'),
+                               to_mask('S2'), to_mask('S3')), NT_STRAIN)
+        with pytest.raises(ValueError):
+            DoubleDummySolver((to_mask('SA'), to_mask('SK'),
+                               to_mask('S2'), to_mask('S3')), 5)
+
+
+def test_solve_position():
+    rng = random.Random(0)
+    engine = PlayEngine(random_hands(rng, 3), Suit.H.value - 1, 2)
+    for card in list(iter_bits(engine.legal_moves()))[:1]:
+        engine.play(card)
+    with pytest.raises(ValueError):
+        solve_position(engine)
+    for _ in range(3):
+        engine.play(next(iter_bits(engine.legal_moves())))
+    assert solve_position(engine) == minimax(engine.copy())
+
+
+def test_calc_dda_masks():
+    rng = random.Random(1)
+    hands = random_hands(rng, 3)
+    dda = calc_dda_masks(hands)
+    assert set(dda) == set(Player)
+    for declarer in Player:
+        assert list(dda[declarer]) == list(DDA_SUITS)
+        for suit in DDA_SUITS:
+            engine = PlayEngine(hands, suit.value - 1,
+                                declarer.next_player.value - 1)
+            ns_tricks = minimax(engine)
+            assert dda[declarer][suit] == (
+                ns_tricks if declarer in (Player.N, Player.S)
+                else 3 - ns_tricks)
+
+
+def test_calc_dda_masks_solvers(mocker: MockFixture):
+    rng = random.Random(1)
+    hands = random_hands(rng, 3)
+    mocker.patch('bridge_env.double_dummy.DDS_AVAILABLE', True)
+    spy = mocker.spy(bridge_env.double_dummy, 'calc_dda_masks_python')
+    calc_dda_masks(hands)
+    spy.assert_called_once_with(hands)
+
+    hands = tuple(cards_to_mask(hand) for hand in
+                  (HANDS1.north, HANDS1.east, HANDS1.south, HANDS1.west))
+    mocker.patch('bridge_env.double_dummy.DDS_AVAILABLE', False)
+    mock = mocker.patch('bridge_env.double_dummy.calc_dda_masks_python')
+    assert calc_dda_masks(hands) is mock.return_value
+    mock.assert_called_once_with(hands)
+
+
+def test_calc_dda_masks_dds():
+    pytest.importorskip('endplay')
+    hands = tuple(cards_to_mask(hand) for hand in
+                  (HANDS1.north, HANDS1.east, HANDS1.south, HANDS1.west))
+    dda = calc_dda_masks_dds(hands)
+    assert {p: list(dda[p].values()) for p in Player} == {
+        Player.N: [9, 6, 5, 6, 6], Player.E: [3, 7, 8, 7, 6],
+        Player.S: [9, 6, 5, 6, 6], Player.W: [3, 7, 8, 7, 7]}
+    assert calc_dda_masks(hands) == dda
+
+    rng = random.Random(1)
+    with pytest.raises(ValueError):
+        calc_dda_masks_dds(random_hands(rng, 3))
+
+    # each player has a whole suit.
+    hands = tuple(0x1fff << suit * 13 for suit in (3, 2, 1, 0))
+    assert calc_dda_masks_dds(hands) == calc_dda_masks_python(hands)
+
+
+def test_calc_dda():
+    # each player has a whole suit.
+    hands = Hands(north_hand={Card(r, Suit.S) for r in range(2, 15)},
+                  east_hand={Card(r, Suit.H) for r in range(2, 15)},
+                  south_hand={Card(r, Suit.D) for r in range(2, 15)},
+                  west_hand={Card(r, Suit.C) for r in range(2, 15)})
+    dda = calc_dda(hands)
+    for declarer in Player:
+        for suit in DDA_SUITS:
+            if suit is Suit.NT:
+                # the opening leader takes all tricks
+                expected = 0
+            elif hands[declarer] & {Card(2, suit)} or \
+                    hands[declarer.partner] & {Card(2, suit)}:
+                expected = 13
+            else:
+                expected = 0
+            assert dda[declarer][suit] == expected
+
+
+def test_calc_dda_cache(mocker: MockFixture):
+    hands = Hands(north_hand={Card(r, Suit.S) for r in range(2, 15)},
+                  east_hand={Card(r, Suit.H) for r in range(2, 15)},
+                  south_hand={Card(r, Suit.D) for r in range(2, 15)},
+                  west_hand={Card(r, Suit.C) for r in range(2, 15)})
+    cache = DDACache()
+    dda = calc_dda(hands, cache=cache)
+    spy = mocker.patch('bridge_env.double_dummy.calc_dda_masks')
+    assert calc_dda(hands, cache=cache) == dda
+    spy.assert_not_called()
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,71 @@
+import random
+
+import numpy as np
+import pytest
+
+from bridge_env import score
+from bridge_env.field_scoring import bam, butler_imps, cross_imps, datums, \
+    matchpoints, percentages
+
+SCORES = (-1430, -800, -620, -200, -100, -50, 0, 50, 90, 110, 140, 400, 420,
+          450, 620, 990, 1430)
+
+
+def random_field(seed: int):
+    rng = random.Random(seed)
+    boards = [rng.choice(['1', '2', '10', '3']) for _ in range(60)]
+    # few kinds of scores make ties
+    scores = [rng.choice(SCORES[i:i + 5]) for i in
+              [rng.randrange(3) for _ in boards]]
+    return boards, scores
+
+
+def results_of_board(boards, scores, i):
+    return [s for j, (b, s) in enumerate(zip(boards, scores))
+            if b == boards[i] and j != i]
+
+
+class TestFieldScoring:
+    def test_matchpoints(self):
+        boards = np.array([1, 1, 1, 2, 2])
+        scores = np.array([420, 420, -50, 110, 140])
+        assert matchpoints(boards, scores).tolist() == [1.5, 1.5, 0, 0, 1]
+        assert percentages(boards, scores).tolist() == [75, 75, 0, 0, 100]
+        assert percentages([1], [100]).tolist() == [50]
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_compare_with_pairwise(self, seed):
+        boards, scores = random_field(seed)
+        mps = matchpoints(boards, scores)
+        cross = cross_imps(boards, scores)
+        average = cross_imps(boards, scores, average=True)
+        for i, s in enumerate(scores):
+            others = results_of_board(boards, scores, i)
+            assert mps[i] == sum(1 if s > o else 0.5 if s == o else 0
+                                 for o in others)
+            expected = sum(score.score_to_imp(s, -o) for o in others)
+            assert cross[i] == expected
+            assert average[i] == pytest.approx(
+                expected / len(others) if others else 0)
+
+    def test_datums(self):
+        boards = ['a'] * 5 + ['b'] * 2
+        scores = [620, 170, 140, -100, 1000, 420, 455]
+        # a: mean of 170, 140 and 620, b: all scores are used
+        assert datums(boards, scores).tolist() == [310] * 5 + [440] * 2
+        assert datums(boards, scores, trim=0).tolist() == \
+            [370] * 5 + [440] * 2
+        assert butler_imps(boards, scores).tolist() == \
+            [score.point_difference_to_imps(s - d)
+             for s, d in zip(scores, [310] * 5 + [440] * 2)]
+        with pytest.raises(ValueError):
+            datums(boards, scores, trim=-1)
+
+    def test_bam(self):
+        assert bam([420, 420, 170], [420, 400, 140]).tolist() == \
+            [0.5, 1, 1]
+        assert bam([-100], [110]).tolist() == [0]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            matchpoints([1, 2], [100])
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from bridge_env import BitHands, Player
+from bridge_env.hand_features import FEATURE_NAMES, HandFeatures, \
+    binary_to_mask, controls, extract_features, hand_features, hcp, ltc, \
+    shape, suit_lengths
+from tests.data_handler import HANDS1
+
+
+class TestHandFeatures:
+    # N:4.KJ32.842.AQ743 JT987.Q876.AK5.2 AK532.T.JT6.T985 Q6.A954.Q973.KJ6
+    BINARY = np.array([HANDS1.to_np_binary()[p] for p in Player])
+    EXPECTED = {
+        Player.N: HandFeatures(hcp=10, suit_lengths=(5, 3, 4, 1),
+                               shape=(5, 4, 3, 1), controls=3, ltc=7),
+        Player.E: HandFeatures(hcp=10, suit_lengths=(1, 3, 4, 5),
+                               shape=(5, 4, 3, 1), controls=3, ltc=7),
+        Player.S: HandFeatures(hcp=8, suit_lengths=(4, 3, 1, 5),
+                               shape=(5, 4, 3, 1), controls=3, ltc=8),
+        Player.W: HandFeatures(hcp=12, suit_lengths=(3, 4, 4, 2),
+                               shape=(4, 4, 3, 2), controls=3, ltc=8)}
+
+    def test_hcp(self):
+        np.testing.assert_array_equal(hcp(self.BINARY), [10, 10, 8, 12])
+        assert hcp(self.BINARY[0]) == 10
+        np.testing.assert_array_equal(hcp(self.BINARY[np.newaxis]),
+                                      [[10, 10, 8, 12]])
+
+    def test_suit_lengths(self):
+        np.testing.assert_array_equal(suit_lengths(self.BINARY),
+                                      [[5, 3, 4, 1],
+                                       [1, 3, 4, 5],
+                                       [4, 3, 1, 5],
+                                       [3, 4, 4, 2]])
+
+    def test_features(self):
+        np.testing.assert_array_equal(
+            shape(self.BINARY), [e.shape for e in self.EXPECTED.values()])
+        np.testing.assert_array_equal(controls(self.BINARY), [3, 3, 3, 3])
+        np.testing.assert_array_equal(ltc(self.BINARY), [7, 7, 8, 8])
+
+    @pytest.mark.parametrize(('binary', 'expected'), [
+        # singleton K, doubleton KQ, AKQJ and void
+        ([0] * 11 + [1, 0] + [0] * 10 + [1, 1, 0] + [0] * 9 + [1] * 4
+         + [0] * 13, 1 + 1 + 0 + 0),
+        # xxx, Qxx, A and Ax
+        ([1, 1, 1] + [0] * 10 + [1, 1] + [0] * 8 + [1, 0, 0] + [0] * 12
+         + [1] + [1] + [0] * 11 + [1], 3 + 2 + 0 + 1),
+    ])
+    def test_ltc(self, binary, expected):
+        assert ltc(np.array(binary)) == expected
+        assert hand_features(binary_to_mask(binary)).ltc == expected
+
+    def test_extract_features(self):
+        features = extract_features(self.BINARY[np.newaxis])
+        assert features.shape == (1, 4, len(FEATURE_NAMES))
+        for i, expected in enumerate(self.EXPECTED.values()):
+            row = features[0, i]
+            assert row[0] == expected.hcp
+            assert tuple(row[1:5]) == expected.suit_lengths
+            assert tuple(row[5:9]) == expected.shape
+            assert row[9] == expected.controls
+            assert row[10] == expected.ltc
+
+    def test_hand_features(self):
+        bit_hands = BitHands.convert_hands(HANDS1)
+        for p, expected in self.EXPECTED.items():
+            assert hand_features(bit_hands[p]) == expected
+            assert hand_features(binary_to_mask(
+                HANDS1.to_binary()[p])) == expected
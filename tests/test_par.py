@@ -0,0 +1,136 @@
+import random
+from functools import lru_cache
+
+import numpy as np
+import pytest
+
+from bridge_env import Bid, Contract, Player, Suit, Vul
+from bridge_env.par import ParResult, calc_par, calc_par_scores
+from bridge_env.score import calc_score
+
+STRAINS = (Suit.C, Suit.D, Suit.H, Suit.S, Suit.NT)
+
+
+def make_dda(ns, ew):
+    ns_tricks = dict(zip(STRAINS, ns))
+    ew_tricks = dict(zip(STRAINS, ew))
+    return {Player.N: ns_tricks, Player.E: ew_tricks,
+            Player.S: dict(ns_tricks), Player.W: dict(ew_tricks)}
+
+
+def random_dda(rng: random.Random):
+    dda = {p: dict() for p in Player}
+    for suit in STRAINS:
+        for p in (Player.N, Player.E):
+            tricks = rng.randint(0, 13)
+            dda[p][suit] = tricks
+            dda[p.partner][suit] = max(0, tricks - rng.randint(0, 1))
+    return dda
+
+
+def brute_force_par(dda, vul: Vul, dealer: Player) -> int:
+    # NS score of the auction game with calc_score
+    sides = ((Player.N, Player.S), (Player.E, Player.W))
+
+    def final(r: int, s: int) -> int:
+        bid = Bid.int_to_bid(r)
+        declarer = max(sides[s], key=lambda p: dda[p][bid.suit])
+        tricks = dda[declarer][bid.suit]
+        contract = Contract(bid, x=tricks < bid.level + 6, vul=vul,
+                            declarer=declarer)
+        score = calc_score(contract, tricks)
+        return score if s == 0 else -score
+
+    def opt(s: int, values):
+        return max(values) if s == 0 else min(values)
+
+    @lru_cache(maxsize=None)
+    def value(r: int, s: int) -> int:
+        return opt(1 - s, [final(r, s)] + [value(higher, 1 - s)
+                                           for higher in range(r + 1, 35)])
+
+    def opening(s: int) -> int:
+        return opt(s, [value(r, s) for r in range(35)])
+
+    first = 0 if dealer in (Player.N, Player.S) else 1
+    second = 1 - first
+    return opt(first, [opening(first), opt(second, [
+        opening(second), opt(first, [opening(first), opt(second, [
+            opening(second), 0])])])])
+
+
+def to_strs(result: ParResult):
+    return [f'{c} {c.declarer}' for c in result.contracts]
+
+
+class TestCalcPar:
+    def test_grand_slams(self):
+        # each side makes 7 of 2 suits and no NT
+        dda = make_dda((0, 13, 0, 13, 0), (13, 0, 13, 0, 0))
+        for dealer in Player:
+            result = calc_par(dda, Vul.NONE, dealer)
+            assert result.score == 1510
+            assert to_strs(result) == ['7S N', '7S S']
+
+    def test_sacrifice(self):
+        dda = make_dda((6, 6, 5, 10, 6), (7, 7, 8, 3, 7))
+        result = calc_par(dda, Vul.NONE)
+        assert result.score == 420
+        assert to_strs(result) == ['4S N', '4S S']
+        result = calc_par(dda, Vul.NS)
+        assert result.score == 500
+        assert to_strs(result) == ['4NTX E', '4NTX W', '5HX E', '5HX W']
+        assert result.contracts[0].x
+        assert result.contracts[0].vul is Vul.NS
+
+    def test_declarers(self):
+        dda = make_dda((0, 0, 0, 0, 9), (0, 0, 0, 0, 4))
+        dda[Player.S][Suit.NT] = 8
+        result = calc_par(dda, Vul.NONE, Player.E)
+        assert result.score == 400
+        assert to_strs(result) == ['3NT N']
+
+    def test_passed_out(self):
+        dda = make_dda((6,) * 5, (6,) * 5)
+        result = calc_par(dda, Vul.BOTH)
+        assert result == ParResult(score=0, contracts=[])
+
+    @pytest.mark.parametrize('seed', range(3))
+    def test_compare_with_brute_force(self, seed):
+        rng = random.Random(seed)
+        for _ in range(20):
+            dda = random_dda(rng)
+            vul = rng.choice(list(Vul))
+            dealer = rng.choice(list(Player))
+            result = calc_par(dda, vul, dealer)
+            assert result.score == brute_force_par(dda, vul, dealer)
+            for contract in result.contracts:
+                tricks = dda[contract.declarer][contract.trump]
+                score = calc_score(contract, tricks)
+                assert result.score == (
+                    score if contract.declarer in (Player.N, Player.S)
+                    else -score)
+
+
+class TestCalcParScores:
+    def test_batch(self):
+        rng = random.Random(3)
+        ddas = [random_dda(rng) for _ in range(50)]
+        vuls = [rng.choice(list(Vul)) for _ in ddas]
+        dealers = [rng.choice(list(Player)) for _ in ddas]
+        tricks = np.array([[[dda[p][s] for s in STRAINS] for p in Player]
+                           for dda in ddas])
+        scores = calc_par_scores(tricks, vuls, dealers)
+        assert scores.shape == (50,)
+        assert scores.tolist() == [calc_par(dda, vul, dealer).score
+                                   for dda, vul, dealer
+                                   in zip(ddas, vuls, dealers)]
+        scores = calc_par_scores(tricks, Vul.EW)
+        assert scores.tolist() == [calc_par(dda, Vul.EW).score
+                                   for dda in ddas]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            calc_par_scores(np.zeros((2, 4, 4), dtype=int), Vul.NONE)
+        with pytest.raises(ValueError):
+            calc_par_scores(np.zeros((2, 4, 5), dtype=int), [Vul.NONE])
@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from bridge_env import Bid, Card, Contract, Hands, Pair, Player, \
+    PlayingPhaseWithHands, Suit
+from bridge_env.bit_hands import iter_bits
+from bridge_env.play_engine import NT_STRAIN, PlayEngine
+
+# N: S K, H A K, D -, C -
+# E: S -, H Q, D A, C 2
+# S: S A, H 2, D -, C 3
+# W: S 2, H 3, D 2, C -
+SMALL_HANDS = (
+    1 << int(Card(13, Suit.S)) | 1 << int(Card(14, Suit.H))
+    | 1 << int(Card(13, Suit.H)),
+    1 << int(Card(12, Suit.H)) | 1 << int(Card(14, Suit.D))
+    | 1 << int(Card(2, Suit.C)),
+    1 << int(Card(14, Suit.S)) | 1 << int(Card(2, Suit.H))
+    | 1 << int(Card(3, Suit.C)),
+    1 << int(Card(2, Suit.S)) | 1 << int(Card(3, Suit.H))
+    | 1 << int(Card(2, Suit.D)))
+
+
+class TestPlayEngine:
+    def test_legal_moves(self):
+        engine = PlayEngine(SMALL_HANDS, trump=Suit.C.value - 1, leader=1)
+        assert engine.legal_moves() == SMALL_HANDS[1]
+        engine.play(int(Card(12, Suit.H)))
+        # south follows hearts
+        assert engine.legal_moves() == 1 << int(Card(2, Suit.H))
+        with pytest.raises(ValueError):
+            engine.play(int(Card(3, Suit.C)))
+        engine.play(int(Card(2, Suit.H)))
+        engine.play(int(Card(3, Suit.H)))
+        engine.play(int(Card(14, Suit.H)))
+        assert engine.tricks == (1, 0)
+        assert engine.leader == 0
+        assert engine.trick_num == 2
+
+        engine.play(int(Card(13, Suit.H)))
+        # east has no heart and ruffs
+        assert engine.legal_moves() == SMALL_HANDS[1] & ~(
+            1 << int(Card(12, Suit.H)))
+        engine.play(int(Card(2, Suit.C)))
+        assert engine.winner() is Player.E
+
+    def test_undo(self):
+        engine = PlayEngine(SMALL_HANDS, trump=NT_STRAIN, leader=3)
+        states = []
+        while not engine.has_done():
+            states.append((engine.hands, engine.leader, engine.tricks,
+                           engine.legal_moves()))
+            engine.play(next(iter_bits(engine.legal_moves())))
+        assert sum(engine.tricks) == 3
+        while states:
+            engine.undo()
+            assert (engine.hands, engine.leader, engine.tricks,
+                    engine.legal_moves()) == states.pop()
+        with pytest.raises(Exception):
+            engine.undo()
+
+    def test_copy(self):
+        engine = PlayEngine(SMALL_HANDS, trump=NT_STRAIN, leader=0)
+        engine.play(int(Card(13, Suit.S)))
+        copied = engine.copy()
+        copied.play(int(Card(2, Suit.C)))
+        assert engine.played == (int(Card(13, Suit.S)),)
+        assert copied.trick_cards == (int(Card(13, Suit.S)),
+                                      int(Card(2, Suit.C)))
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_compare_with_playing_phase(self, seed):
+        random.seed(seed)
+        hands = Hands.generate_random_hands()
+        contract = Contract(Bid.int_to_bid(seed * 7),
+                            declarer=Player(seed % 4 + 1))
+        engine = PlayEngine.from_hands(contract, hands)
+        phase = PlayingPhaseWithHands(contract, Hands(
+            north_hand=set(hands.north), east_hand=set(hands.east),
+            south_hand=set(hands.south), west_hand=set(hands.west)))
+        while not phase.has_done():
+            player = phase.active_player
+            assert engine.active_player == player.value - 1
+            cards = phase.current_available_cards_in_hand(player)
+            assert engine.legal_cards() == cards
+            card = random.choice(sorted(cards))
+            phase.play_card_by_player(card, player)
+            engine.play(int(card))
+            if random.random() < 0.3:
+                # compares an engine converted from the phase
+                converted = PlayEngine.from_playing_phase(phase)
+                assert converted.played == engine.played
+                assert converted.hands == engine.hands
+        assert engine.has_done()
+        assert engine.tricks == (phase.taken_tricks[Pair.NS],
+                                 phase.taken_tricks[Pair.EW])
+        assert engine.trick_histories() == \
+            list(phase.playing_history.history)
+
+    def test_passed_out_exception(self):
+        with pytest.raises(Exception):
+            PlayEngine.from_hands(Contract(None),
+                                  Hands.generate_random_hands())
@@ -1,6 +1,8 @@
 import pytest
 
 from bridge_env import Pair, Player, Vul
+from bridge_env.player import LEFT_IDX, PAIR_IDX, PARTNER_IDX, PLAYERS, \
+    RIGHT_IDX
 
 
 class TestPlayer:
@@ -111,3 +113,12 @@ class TestPlayer:
     def test_convert_formal_name_exception(self):
         with pytest.raises(ValueError):
             Player.convert_formal_name('N')
+
+    @pytest.mark.parametrize('player', list(Player))
+    def test_idx_tables(self, player):
+        i = player.value - 1
+        assert PLAYERS[i] is player
+        assert PLAYERS[LEFT_IDX[i]] is player.left
+        assert PLAYERS[PARTNER_IDX[i]] is player.partner
+        assert PLAYERS[RIGHT_IDX[i]] is player.right
+        assert PAIR_IDX[i] == player.pair.value - 1
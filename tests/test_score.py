@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from bridge_env import Bid, Contract, Suit, Vul, score
@@ -218,3 +219,42 @@ class TestScore:
                               (50, 0, 2)])
     def test_score_to_imp(self, score1, score2, expected):
         assert score.score_to_imp(score1, score2) == expected
+
+    def test_calc_scores(self):
+        bids = [bid for bid in Bid if bid not in {Bid.Pass, Bid.X, Bid.XX}]
+        bid_idx = np.array([bid.idx for bid in bids])[:, None, None, None]
+        x = np.array([False, True, False, True])[None, :, None, None]
+        xx = np.array([False, False, True, True])[None, :, None, None]
+        vul = np.array([False, True])[None, None, :, None]
+        tricks = np.arange(14)[None, None, None, :]
+        scores = score.calc_scores(bid_idx, x, xx, vul, tricks)
+        assert scores.shape == (35, 4, 2, 14)
+        for bid in bids:
+            for i in range(4):
+                for v in range(2):
+                    for t in range(14):
+                        assert scores[bid.idx, i, v, t] == \
+                            score.calc_bid_score(bid, bool(x[0, i, 0, 0]),
+                                                 bool(xx[0, i, 0, 0]),
+                                                 bool(v), t)
+        assert score.calc_scores(Bid.NT3.idx, False, False, True, 9) == 600
+        with pytest.raises(ValueError):
+            score.calc_scores(np.array([0, Bid.Pass.idx]), False, False,
+                              False, 7)
+        with pytest.raises(ValueError):
+            score.calc_scores(0, False, False, False, np.array([7, 14]))
+        with pytest.raises(ValueError):
+            score.calc_scores(0, False, False, False, -1)
+
+    @pytest.mark.parametrize('taken_trick_num', [-1, 14])
+    def test_calc_bid_score_invalid_tricks(self, taken_trick_num):
+        with pytest.raises(ValueError):
+            score.calc_bid_score(Bid.C1, False, False, False, taken_trick_num)
+        with pytest.raises(ValueError):
+            score.calc_score(Contract(Bid.C1), taken_trick_num)
+
+    def test_imps(self):
+        differences = np.arange(-5000, 5001, 10)
+        assert score.imps(differences).tolist() == \
+            [score.point_difference_to_imps(int(d)) for d in differences]
+        assert score.imps(-20) == -1